@@ -0,0 +1,6 @@
+#!/bin/bash
+
+BASELINE=benchmarks/baseline.json
+
+echo "running benchmarks"
+python -m benchmarks.suite --baseline $BASELINE --output bench_results.json "$@"
@@ -0,0 +1 @@
+"""Performance benchmarks of the maze game."""
@@ -0,0 +1,115 @@
+"""Render throughput benchmark.
+
+Renders frames of the menus and of the mazes of levels 1 to K through the headless visualization, without a frame
+rate cap, and reports the frames per second of every scene. Full frames redraw the whole screen, play frames move
+the player once and redraw only what changed.
+"""
+import argparse
+import json
+import sys
+import time
+from typing import Callable, Dict, List, Optional
+
+import pygame
+
+from src.config import BaseConfig
+from src.event import Direction
+from src.maze_game import MazeGame, MazeGameState
+from src.maze_game.distance_field import MOVES
+from src.maze_game.layers.maze_layer import MazeLayer
+from src.maze_visualization import MazeGameVisualization
+
+SCREEN_WIDTH = 1280
+SCREEN_HEIGHT = 720
+MAZE_WIDTH = SCREEN_WIDTH - 100
+MAZE_HEIGHT = SCREEN_HEIGHT - 100
+
+
+def get_walk(maze: MazeLayer) -> List[Direction]:
+    """Returns the moves walking the player along the solution path and back, stopping short of the goal.
+
+    Args:
+        maze: MazeGameLayer object.
+    """
+
+    path = maze.get_solution_path()[:-1]
+    directions = {(d_row, d_col): direction for direction, d_row, d_col in MOVES}
+    steps = list(zip(path, path[1:]))
+    forward = [directions[(end[0] - start[0], end[1] - start[1])] for start, end in steps]
+    backward = [directions[(start[0] - end[0], start[1] - end[1])] for start, end in reversed(steps)]
+    return forward + backward
+
+
+def render_frames(visualization: MazeGameVisualization,
+                  game: MazeGame,
+                  frames: int,
+                  step: Optional[Callable[[int], None]] = None) -> float:
+    """Renders frames of a game and returns the frames per second.
+
+    Args:
+        visualization: headless visualization to render with.
+        game: the game to render.
+        frames: number of frames to render.
+        step: updates the game before every frame, the whole screen is redrawn every frame if not given.
+    """
+
+    start_time = time.perf_counter()
+    for frame in range(frames):
+        if step is None:
+            visualization.frame_key = None
+        else:
+            step(frame)
+        dirty_rects = visualization.draw_game(game)
+        if dirty_rects:
+            pygame.display.update(dirty_rects)
+    return frames / max(time.perf_counter() - start_time, 1e-9)
+
+
+def benchmark_render(frames: int, levels: int) -> Dict[str, float]:
+    """Renders the menus and the levels 1 to levels, returns the frames per second of every scene.
+
+    Args:
+        frames: number of frames rendered per scene.
+        levels: number of levels rendered.
+    """
+
+    visualization = MazeGameVisualization(SCREEN_HEIGHT, SCREEN_WIDTH, headless=True)
+    game = MazeGame((MAZE_WIDTH, MAZE_HEIGHT), BaseConfig)
+    results = {}
+    try:
+        game.set_state(MazeGameState.MENU)
+        results["menu"] = render_frames(visualization, game, frames)
+        game.set_state(MazeGameState.PAUSED)
+        results["pause"] = render_frames(visualization, game, frames)
+
+        game.set_state(MazeGameState.PLAYING)
+        for level in range(1, levels + 1):
+            game.curr_maze = game.prefetcher.create_level(level)
+            results[f"level_{level}_full"] = render_frames(visualization, game, frames)
+            walk = get_walk(game.curr_maze)
+            results[f"level_{level}_play"] = render_frames(
+                visualization, game, frames, lambda frame: game.move(walk[frame % len(walk)]) if walk else None)
+    finally:
+        game.close()
+    return results
+
+
+def main(argv: List[str]) -> None:
+    """Runs the render benchmark described by the command line."""
+
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--frames", type=int, default=300, help="frames rendered per scene")
+    parser.add_argument("--levels", type=int, default=10, help="render the levels 1 to LEVELS")
+    parser.add_argument("--json", default=None, help="also write the results to this JSON file")
+    args = parser.parse_args(argv)
+
+    results = benchmark_render(args.frames, args.levels)
+    for scene, fps in results.items():
+        print(f"{scene:<16} {fps:>10.1f} frames/sec")
+    if args.json is not None:
+        with open(args.json, "w", encoding="utf-8") as json_file:
+            json.dump(results, json_file, indent=2)
+
+
+if __name__ == "__main__":
+    main(sys.argv[1:])
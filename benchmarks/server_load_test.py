@@ -0,0 +1,118 @@
+"""Game server load test.
+
+Simulated clients start sessions on the headless game server and play random moves in rounds, every round sending
+the moves of all the clients in a single batch. Every client keeps a copy of its board up to date from the state
+diffs, as a real client would. Reports the sessions started and the moves applied per second, overall and per worker
+core.
+"""
+import argparse
+import json
+import sys
+import time
+from random import Random
+from typing import Dict, List, Optional
+
+from src.config import ServerConfig
+from src.event import Direction
+from src.game_server import GameServer, Move, StateDiff
+
+DIRECTION_VALUES = [direction.value for direction in Direction]
+
+
+class SimulatedClient:
+    """Player of a session, mirroring its board from the state diffs."""
+
+    def __init__(self, diff: StateDiff):
+        """Constructor for the simulated client.
+
+        Args:
+            diff: full state of the new session.
+        """
+
+        self.session_id = diff[0]
+        self.level = self.step_count = 0
+        self.board = bytearray()
+        self.n_col = 0
+        self.apply(diff)
+
+    def apply(self, diff: StateDiff) -> None:
+        """Updates the board copy from a state diff."""
+
+        _, self.level, self.step_count, _, _, tiles, board_state = diff
+        if board_state is not None:
+            _, self.n_col, tiles_bytes = board_state
+            self.board = bytearray(tiles_bytes)
+        for row, col, value in tiles:
+            self.board[row * self.n_col + col] = value
+
+    def get_moves(self, rng: Random, count: int) -> List[Move]:
+        """Returns random moves of the session."""
+
+        return [(self.session_id, direction) for direction in rng.choices(DIRECTION_VALUES, k=count)]
+
+
+def run_load_test(workers: int, sessions: int, rounds: int, moves: int, seed: Optional[int]) -> Dict[str, float]:
+    """Starts sessions, plays them and returns the throughput.
+
+    Args:
+        workers: worker processes of the server, 0 to host the sessions in this process.
+        sessions: number of sessions.
+        rounds: number of move batches.
+        moves: moves per session per round.
+        seed: seed of the random moves.
+    """
+
+    rng = Random(seed)
+    server = GameServer(workers)
+    cores = server.get_shard_count()
+    try:
+        start_time = time.perf_counter()
+        clients = {diff[0]: SimulatedClient(diff) for diff in server.create_sessions(sessions)}
+        create_time = time.perf_counter() - start_time
+
+        diff_count = 0
+        start_time = time.perf_counter()
+        for _ in range(rounds):
+            batch = [move for client in clients.values() for move in client.get_moves(rng, moves)]
+            diffs = server.move(batch)
+            for diff in diffs:
+                clients[diff[0]].apply(diff)
+            diff_count += len(diffs)
+        move_time = time.perf_counter() - start_time
+    finally:
+        server.close()
+
+    total_moves = sessions * rounds * moves
+    return {
+        "cores": cores,
+        "sessions_per_sec": sessions / create_time,
+        "sessions_per_sec_per_core": sessions / create_time / cores,
+        "moves_per_sec": total_moves / move_time,
+        "moves_per_sec_per_core": total_moves / move_time / cores,
+        "diffs_per_sec": diff_count / move_time,
+        "max_level": max(client.level for client in clients.values()),
+    }
+
+
+def main(argv: List[str]) -> None:
+    """Runs the load test described by the command line."""
+
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--workers", type=int, default=ServerConfig.SERVER_WORKERS, help="one per core by default")
+    parser.add_argument("--sessions", type=int, default=2000, help="concurrent sessions")
+    parser.add_argument("--rounds", type=int, default=50, help="move batches sent")
+    parser.add_argument("--moves", type=int, default=4, help="moves per session per round")
+    parser.add_argument("--seed", type=int, default=None, help="seed of the random moves")
+    parser.add_argument("--json", default=None, help="also write the results to this JSON file")
+    args = parser.parse_args(argv)
+
+    results = run_load_test(args.workers, args.sessions, args.rounds, args.moves, args.seed)
+    for name, value in results.items():
+        print(f"{name:<28} {value:>12.1f}")
+    if args.json is not None:
+        with open(args.json, "w", encoding="utf-8") as json_file:
+            json.dump(results, json_file, indent=2)
+
+
+if __name__ == "__main__":
+    main(sys.argv[1:])
@@ -0,0 +1,102 @@
+"""Cold start benchmark.
+
+Starts the game in fresh processes and reports the time to the first frame on the screen: the time to launch the
+process, to import the game, to create it, with its window and first level, and to draw the first frame. The game
+runs headless unless --window is given.
+"""
+import argparse
+import asyncio
+import json
+import os
+import statistics
+import subprocess
+import sys
+import time
+from typing import Dict, List
+
+PHASES = ("import_ms", "create_ms", "first_frame_ms", "process_to_first_frame_ms")
+
+
+async def start_game() -> None:
+    """Starts the game up to its first frame and prints the time spent in every phase in milliseconds."""
+
+    import_start = time.perf_counter()
+    import main    # pylint: disable=import-outside-toplevel
+    from src.event import RenderEvent, StartGameEvent    # pylint: disable=import-outside-toplevel
+    create_start = time.perf_counter()
+    event_manager, game, _ = await main.create_game(main.get_config())
+    frame_start = time.perf_counter()
+    event_manager.post(StartGameEvent())
+    event_manager.post(RenderEvent())
+    event_manager.drain()
+    end_time = time.perf_counter()
+    results = {
+        "import_ms": (create_start - import_start) * 1000,
+        "create_ms": (frame_start - create_start) * 1000,
+        "first_frame_ms": (end_time - frame_start) * 1000,
+    }
+    print(json.dumps(results), flush=True)
+    game.close()
+
+
+def run_child(headless: bool) -> Dict[str, float]:
+    """Starts the game in a fresh process and returns its phase times in milliseconds.
+
+    Args:
+        headless: run the game without a window.
+    """
+
+    env = dict(os.environ, MAZE_HEADLESS=str(headless), PYGAME_HIDE_SUPPORT_PROMPT="1")
+    start_time = time.perf_counter()
+    with subprocess.Popen([sys.executable, "-m", "benchmarks.startup_benchmark", "--child"],
+                          env=env,
+                          stdout=subprocess.PIPE,
+                          text=True) as child:
+        assert child.stdout is not None
+        # The child prints its phase times as soon as the first frame is drawn, before closing the game.
+        line = child.stdout.readline()
+        first_frame_time = time.perf_counter()
+        child.stdout.read()
+    if child.returncode or not line:
+        raise RuntimeError(f"the game exited with code {child.returncode}")
+    results = json.loads(line)
+    results["process_to_first_frame_ms"] = (first_frame_time - start_time) * 1000
+    return results
+
+
+def benchmark_startup(runs: int, headless: bool) -> Dict[str, float]:
+    """Starts the game a few times and returns the median time of every phase in milliseconds.
+
+    Args:
+        runs: number of game starts.
+        headless: run the game without a window.
+    """
+
+    results = [run_child(headless) for _ in range(runs)]
+    return {phase: statistics.median(result[phase] for result in results) for phase in PHASES}
+
+
+def main(argv: List[str]) -> None:
+    """Runs the startup benchmark described by the command line."""
+
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--runs", type=int, default=5, help="game starts, the median of every phase is reported")
+    parser.add_argument("--window", action="store_true", help="open a window instead of running headless")
+    parser.add_argument("--json", default=None, help="also write the results to this JSON file")
+    parser.add_argument("--child", action="store_true", help=argparse.SUPPRESS)
+    args = parser.parse_args(argv)
+
+    if args.child:
+        asyncio.run(start_game())
+        return
+
+    results = benchmark_startup(args.runs, not args.window)
+    for phase, milliseconds in results.items():
+        print(f"{phase:<28} {milliseconds:>10.1f} ms")
+    if args.json is not None:
+        with open(args.json, "w", encoding="utf-8") as json_file:
+            json.dump(results, json_file, indent=2)
+
+
+if __name__ == "__main__":
+    main(sys.argv[1:])
@@ -0,0 +1,204 @@
+"""Benchmark suite of the game hot paths.
+
+Times maze generation over a size sweep, long random walks of the player, event fan-out to many listeners and level
+changes. Every benchmark reports the best time in seconds of a few runs. The results are written to JSON and
+compared against a stored baseline, a benchmark slower than its baseline by more than its threshold is a regression
+and makes the suite exit with an error.
+"""
+import argparse
+import json
+import os
+import sys
+import time
+from functools import partial
+from random import Random
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from src.config import BaseConfig
+from src.event import Event, QuitEvent, TickEvent
+from src.event_listener import EventListener
+from src.event_manager import EventManager
+from src.maze_game import MazeGame
+from src.maze_game.layers.maze_layer import MazeLayer
+from src.maze_game.maze_generation import generate_prim_maze
+
+GENERATION_SIZES = ((15, 29), (31, 59), (62, 118), (124, 236))
+WALK_LENGTH = 100_000
+LISTENER_COUNTS = (1, 10, 100)
+POST_COUNT = 10_000
+LEVEL_COUNT = 10
+DEFAULT_THRESHOLD = 0.5
+
+
+class NullListener(EventListener):
+    """Listener doing nothing with the events it receives."""
+
+    def notify(self, event: Event):
+        """Receive an event posted to the message queue."""
+
+
+def best_time(benchmark: Callable[[], Any], repeat: int) -> float:
+    """Returns the best time in seconds of a few runs of a benchmark.
+
+    Args:
+        benchmark: the code to time.
+        repeat: number of runs.
+    """
+
+    times = []
+    for _ in range(repeat):
+        start_time = time.perf_counter()
+        benchmark()
+        times.append(time.perf_counter() - start_time)
+    return min(times)
+
+
+def bench_generation(repeat: int) -> Dict[str, float]:
+    """Times generate_prim_maze over the size sweep."""
+
+    results = {}
+    for n_row, n_col in GENERATION_SIZES:
+        results[f"generate_prim.{n_row}x{n_col}"] = best_time(partial(generate_prim_maze, n_row, n_col, seed=0), repeat)
+    return results
+
+
+def random_walk(level: int, seed: int) -> None:
+    """Moves the player of a maze in random directions, walking on past the goal."""
+
+    maze = MazeLayer(620, 1180, level, generator="kruskal", seed=seed)
+    moves = (maze.move_up, maze.move_down, maze.move_left, maze.move_right)
+    rng = Random(seed)
+    for move in rng.choices(moves, k=WALK_LENGTH):
+        move()
+        maze.board.solved = False
+
+
+def bench_movement(repeat: int) -> Dict[str, float]:
+    """Times long random walks of the player on small and large mazes."""
+
+    return {f"random_walk.level_{level}": best_time(partial(random_walk, level, 0), repeat) for level in (1, 10)}
+
+
+def post_events(listener_count: int, interested_count: Optional[int] = None) -> None:
+    """Posts tick events to many listeners, of which only some are registered for tick events."""
+
+    event_manager = EventManager()
+    listeners = [NullListener() for _ in range(listener_count)]
+    for index, listener in enumerate(listeners):
+        interested = interested_count is None or index < interested_count
+        event_manager.register_listener(listener, (TickEvent if interested else QuitEvent, ))
+    event = TickEvent()
+    for _ in range(POST_COUNT):
+        event_manager.post(event)
+
+
+def bench_dispatch(repeat: int) -> Dict[str, float]:
+    """Times EventManager.post fanning out to a growing number of listeners, and to one listener among many."""
+
+    results = {f"post.{count}_listeners": best_time(partial(post_events, count), repeat) for count in LISTENER_COUNTS}
+    results[f"post.1_of_{LISTENER_COUNTS[-1]}_listeners"] = best_time(partial(post_events, LISTENER_COUNTS[-1], 1),
+                                                                      repeat)
+    return results
+
+
+def play_levels() -> float:
+    """Returns the time spent in MazeGame.get_next_level over the first levels."""
+
+    game = MazeGame((1180, 620), BaseConfig)
+    elapsed = 0.0
+    try:
+        for _ in range(LEVEL_COUNT - 1):
+            start_time = time.perf_counter()
+            game.get_next_level()
+            elapsed += time.perf_counter() - start_time
+    finally:
+        game.close()
+    return elapsed
+
+
+def bench_levels(repeat: int) -> Dict[str, float]:
+    """Times the level changes of a game."""
+
+    return {f"get_next_level.levels_1_{LEVEL_COUNT}": min(play_levels() for _ in range(repeat))}
+
+
+BENCHMARKS: Dict[str, Callable[[int], Dict[str, float]]] = {
+    "generation": bench_generation,
+    "movement": bench_movement,
+    "dispatch": bench_dispatch,
+    "levels": bench_levels,
+}
+
+
+def compare(results: Dict[str, float], baseline: Dict[str, Any], threshold: float) -> List[Tuple[str, float, float]]:
+    """Returns the benchmarks slower than their baseline by more than their threshold.
+
+    Args:
+        results: best time in seconds of every benchmark.
+        baseline: baseline results, with optional per benchmark thresholds under "thresholds".
+        threshold: allowed slowdown as a fraction of the baseline time, for benchmarks without their own.
+    Returns:
+        name, time and baseline time of every regression.
+    """
+
+    thresholds = baseline.get("thresholds", {})
+    return [
+        (name, seconds, baseline["results"][name]) for name, seconds in results.items()
+        if name in baseline["results"] and seconds > baseline["results"][name] * (1 + thresholds.get(name, threshold))
+    ]
+
+
+def update_baseline(path: str, results: Dict[str, float]) -> None:
+    """Writes results to a baseline file, keeping the results of the benchmarks not run and the thresholds.
+
+    Args:
+        path: path of the baseline JSON file, created if it does not exist.
+        results: best time in seconds of the benchmarks run.
+    """
+
+    baseline: Dict[str, Any] = {"results": {}, "thresholds": {}}
+    if os.path.exists(path):
+        with open(path, encoding="utf-8") as baseline_file:
+            baseline.update(json.load(baseline_file))
+    baseline["results"].update(results)
+    with open(path, "w", encoding="utf-8") as baseline_file:
+        json.dump({"results": baseline["results"], "thresholds": baseline["thresholds"]}, baseline_file, indent=2)
+
+
+def main(argv: List[str]) -> int:
+    """Runs the benchmark suite described by the command line, returns the exit code."""
+
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--only", choices=sorted(BENCHMARKS), nargs="+", default=list(BENCHMARKS))
+    parser.add_argument("--repeat", type=int, default=3, help="runs per benchmark, the best one is kept")
+    parser.add_argument("--output", default="bench_results.json", help="JSON file of the results")
+    parser.add_argument("--baseline", default=None, help="JSON file of the baseline results")
+    parser.add_argument("--threshold",
+                        type=float,
+                        default=DEFAULT_THRESHOLD,
+                        help="allowed slowdown as a fraction of the baseline time")
+    parser.add_argument("--update-baseline", action="store_true", help="write the results to the baseline file")
+    args = parser.parse_args(argv)
+
+    results: Dict[str, float] = {}
+    for group in args.only:
+        for name, seconds in BENCHMARKS[group](args.repeat).items():
+            results[name] = seconds
+            print(f"{name:<32} {seconds * 1000:>10.2f} ms")
+    with open(args.output, "w", encoding="utf-8") as output_file:
+        json.dump({"results": results}, output_file, indent=2)
+
+    if args.baseline is None:
+        return 0
+    if args.update_baseline:
+        update_baseline(args.baseline, results)
+        return 0
+    with open(args.baseline, encoding="utf-8") as baseline_file:
+        regressions = compare(results, json.load(baseline_file), args.threshold)
+    for name, seconds, baseline_seconds in regressions:
+        print(f"REGRESSION {name}: {seconds * 1000:.2f} ms, baseline {baseline_seconds * 1000:.2f} ms")
+    return 1 if regressions else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main(sys.argv[1:]))
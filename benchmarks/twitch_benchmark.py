@@ -0,0 +1,88 @@
+"""Twitch chat throughput benchmark.
+
+Streams generated chat from the local fake IRC server to the chat controller while a fake game loop ticks at the
+game tick rate, and reports the chat lines handled per second and the worst tick lateness. A controller stalling
+the game loop shows up as a lateness of more than a few milliseconds.
+"""
+import argparse
+import asyncio
+import json
+import sys
+import time
+from typing import Dict, List, Optional
+
+from src.config import Config
+from src.crowd_vote import CrowdVote
+from src.event_manager import EventManager
+from src.event import MovementEvent
+from src.fake_irc_server import FakeIrcServer, generate_chat
+from src.twitch_controller import TwitchChat
+
+
+async def tick(event_manager: EventManager, interval: float, lateness: List[float], done: asyncio.Event) -> None:
+    """Ticks like the game loop, dispatching the queued events, and records how late every tick runs."""
+
+    loop = asyncio.get_running_loop()
+    next_tick = loop.time() + interval
+    while not done.is_set():
+        await asyncio.sleep(max(0.0, next_tick - loop.time()))
+        lateness.append(loop.time() - next_tick)
+        event_manager.drain()
+        next_tick += interval
+
+
+async def benchmark_chat(lines: int, users: int, rate: Optional[float], votes: bool = False) -> Dict[str, float]:
+    """Streams chat to the controller and returns its throughput and the tick lateness.
+
+    Args:
+        lines: number of chat lines.
+        users: number of distinct chatters.
+        rate: chat lines sent per second, as fast as possible if not given.
+        votes: count the movement commands in a crowd vote instead of posting them.
+    """
+
+    server = FakeIrcServer(generate_chat(lines, users, seed=0), rate)
+    port = await server.start()
+    event_manager = EventManager(Config.EVENT_QUEUE_SIZE, {MovementEvent: Config.MAX_MOVES_PER_TICK})
+    crowd_vote = CrowdVote(event_manager) if votes else None
+    chat = TwitchChat(event_manager, "maze", "bench", "token", "127.0.0.1", port, crowd_vote)
+    lateness: List[float] = []
+    done = asyncio.Event()
+    ticker = asyncio.create_task(tick(event_manager, 1 / Config.TICK_RATE, lateness, done))
+    start_time = time.perf_counter()
+    try:
+        await chat.run()
+    finally:
+        elapsed = time.perf_counter() - start_time
+        done.set()
+        await ticker
+        await server.close()
+    return {
+        "lines": chat.lines,
+        "commands": chat.commands,
+        "lines_per_sec": chat.lines / elapsed,
+        "max_tick_lateness_ms": max(lateness, default=0.0) * 1000,
+    }
+
+
+def main(argv: List[str]) -> None:
+    """Runs the chat benchmark described by the command line."""
+
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--lines", type=int, default=200_000, help="chat lines sent")
+    parser.add_argument("--users", type=int, default=10_000, help="distinct chatters")
+    parser.add_argument("--rate", type=float, default=None, help="chat lines per second, unlimited by default")
+    parser.add_argument("--votes", action="store_true", help="count the movement commands in a crowd vote")
+    parser.add_argument("--json", default=None, help="also write the results to this JSON file")
+    args = parser.parse_args(argv)
+
+    results = asyncio.run(benchmark_chat(args.lines, args.users, args.rate, args.votes))
+    for name, value in results.items():
+        print(f"{name:<24} {value:>12.1f}")
+    if args.json is not None:
+        with open(args.json, "w", encoding="utf-8") as json_file:
+            json.dump(results, json_file, indent=2)
+
+
+if __name__ == "__main__":
+    main(sys.argv[1:])
@@ -0,0 +1,56 @@
+"""Builds a maze corpus for a level pack across all cores."""
+import argparse
+import sys
+import time
+from typing import List, Tuple
+
+from src.maze_game.maze_corpus import build_corpus
+from src.maze_game.maze_generators import MAZE_GENERATORS
+
+
+def parse_size(size: str) -> Tuple[int, int]:
+    """Parses a ROWSxCOLS maze size."""
+
+    try:
+        n_row, n_col = (int(value) for value in size.lower().split("x"))
+    except ValueError as error:
+        raise argparse.ArgumentTypeError(f"expected ROWSxCOLS, got {size}") from error
+    return n_row, n_col
+
+
+def parse_seed(seed: str) -> int:
+    """Parses a non-negative seed."""
+
+    try:
+        value = int(seed)
+    except ValueError as error:
+        raise argparse.ArgumentTypeError(f"expected an integer, got {seed}") from error
+    if value < 0:
+        raise argparse.ArgumentTypeError(f"seeds can't be negative, got {seed}")
+    return value
+
+
+def main(argv: List[str]) -> None:
+    """Builds or resumes the maze corpus described by the command line."""
+
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("output", help="corpus file, resumed if it exists")
+    parser.add_argument("--sizes", type=parse_size, nargs="+", required=True, help="maze sizes as ROWSxCOLS")
+    parser.add_argument("--count", type=int, required=True, help="number of mazes per size")
+    parser.add_argument("--generator", choices=sorted(MAZE_GENERATORS), default="kruskal")
+    parser.add_argument("--seed", type=parse_seed, default=0, help="seed of the first maze of every size")
+    parser.add_argument("--workers", type=int, default=None, help="worker processes, all cores by default")
+    args = parser.parse_args(argv)
+
+    def report(written: int, total: int) -> None:
+        if written == total or written % 1000 == 0:
+            print(f"\r{written}/{total} mazes", end="", flush=True)
+
+    start_time = time.perf_counter()
+    generated = build_corpus(args.output, args.sizes, args.count, args.generator, args.seed, args.workers, report)
+    elapsed = time.perf_counter() - start_time
+    print(f"\ngenerated {generated} mazes in {elapsed:.2f}s ({generated / max(elapsed, 1e-9):.0f} mazes/sec)")
+
+
+if __name__ == "__main__":
+    main(sys.argv[1:])
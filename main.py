@@ -1,13 +1,18 @@
 """Main file to start the maze game."""
 import asyncio
-from typing import Final
+from typing import Final, Tuple, Type
 
+from src.event import MovementEvent, RenderEvent, TickEvent
 from src.event_manager import EventManager
 from src.keyboard_controller import Keyboard
+from src.twitch_controller import TwitchChat
+from src.crowd_vote import CrowdVote
 from src.view import MazeView
 from src.model import GameEngine
 from src.maze_game import MazeGame
-from src.config import get_config
+from src.maze_visualization import MazeGameVisualization
+from src.config import Config, get_config
+from src.frame_profiler import PROFILER
 
 SCREEN_WIDTH: Final = 1280
 SCREEN_HEIGHT: Final = 720
@@ -15,16 +20,51 @@ MAZE_WIDTH: Final = SCREEN_WIDTH - 100
 MAZE_HEIGHT: Final = SCREEN_HEIGHT - 100
 
 
+async def create_game(config: Type[Config]) -> Tuple[EventManager, MazeGame, GameEngine]:
+    """Creates the game and its listeners, the first level is generated while the window opens.
+
+    Args:
+        config: the game config.
+    """
+
+    event_manager = EventManager(config.EVENT_QUEUE_SIZE, {
+        TickEvent: 1,
+        RenderEvent: 1,
+        MovementEvent: config.MAX_MOVES_PER_TICK
+    })
+    loop = asyncio.get_running_loop()
+    # The window is opened on the main thread, some platforms only handle windows there.
+    game_future = loop.run_in_executor(None, MazeGame, (MAZE_WIDTH, MAZE_HEIGHT), config)
+    visualization = MazeGameVisualization(SCREEN_HEIGHT, SCREEN_WIDTH, config.HEADLESS, config.FONT_FILE)
+    game = await game_future
+    game_model = GameEngine(event_manager, game, config.TICK_RATE, 0 if config.HEADLESS else config.FRAME_RATE)
+    _ = MazeView(event_manager, game, config.HEADLESS, visualization)
+    _ = Keyboard(event_manager)
+    return event_manager, game, game_model
+
+
 async def main() -> None:
     """Starts the maze games"""
 
     config = get_config()
-    event_manager = EventManager()
-    game = MazeGame((MAZE_WIDTH, MAZE_HEIGHT), config)
-    game_model = GameEngine(event_manager, game)
-    _ = MazeView(event_manager, game)
-    _ = Keyboard(event_manager)
+    PROFILER.enabled = config.PROFILE_FRAMES
+    event_manager, game, game_model = await create_game(config)
+    tasks = []
+    if config.TWITCH_MODE:
+        votes = CrowdVote(event_manager, config.TWITCH_VOTE_WINDOW)
+        chat = TwitchChat(event_manager,
+                          config.TWITCH_CHANNEL,
+                          config.TWITCH_USERNAME,
+                          config.TWITCH_OAUTH_TOKEN,
+                          votes=votes)
+        tasks.append(asyncio.create_task(chat.run()))
     await game_model.run()
+    for task in tasks:
+        task.cancel()
+    await asyncio.gather(*tasks, return_exceptions=True)
+    game.close()
+    if PROFILER.stats:
+        PROFILER.dump(config.PROFILE_FILE)
 
 
 if __name__ == "__main__":
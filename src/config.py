@@ -1,5 +1,6 @@
 """Defines the config class for the maze game."""
 import os
+from typing import Dict, Optional, Tuple, Type
 
 
 class Config:
@@ -7,6 +8,26 @@ class Config:
 
     DEBUG = False
     TWITCH_MODE = False
+    TWITCH_CHANNEL = ""
+    TWITCH_USERNAME = ""
+    TWITCH_OAUTH_TOKEN = ""
+    TWITCH_VOTE_WINDOW = 1.0
+    NUMPY_BOARD = False
+    MAZE_GENERATOR = "prim"
+    PREFETCH_LEVELS = 1
+    PREFETCH_PROCESSES = False
+    MAZE_SEED: Optional[int] = None
+    MAZE_CACHE_SIZE = 32
+    MAZE_CACHE_DIR: Optional[str] = None
+    HEADLESS = os.environ.get("MAZE_HEADLESS", "False") == "True"
+    TICK_RATE = 60
+    FRAME_RATE = 30
+    EVENT_QUEUE_SIZE: Optional[int] = 256
+    MAX_MOVES_PER_TICK = 4
+    PROFILE_FRAMES = False
+    PROFILE_FILE = "frame_profile.json"
+    # Font file of the texts, None for the font bundled with pygame.
+    FONT_FILE: Optional[str] = None
     APP_NAME = "Maze Game"
     APP_VERSION = "1.0.0"
     APP_DESCRIPTION = "A maze game."
@@ -16,6 +37,9 @@ class Config:
     LOG_FILE = "maze_game.log"
     LOG_FORMAT = "%(asctime)s - %(name)s - %(levelname)s - %(message)s"
     LOG_DATE_FORMAT = "%Y-%m-%d %H:%M:%S"
+    # Log one record out of this many of an event type, and at most LOG_EVENTS_PER_SECOND records per event type.
+    LOG_EVENT_SAMPLE_RATES: Dict[str, int] = {"MovementEvent": 10}
+    LOG_EVENTS_PER_SECOND = 10
 
 
 class BaseConfig(Config):
@@ -33,10 +57,21 @@ class TwitchConfig(Config):
     TWITCH_CHANNEL = os.environ.get("TWITCH_CHANNEL", "")
     TWITCH_USERNAME = os.environ.get("TWITCH_USERNAME", "")
     TWITCH_OAUTH_TOKEN = os.environ.get("TWITCH_OAUTH_TOKEN", "")
+    TWITCH_VOTE_WINDOW = float(os.environ.get("TWITCH_VOTE_WINDOW", "1.0"))
 
 
-def get_config() -> Config:
+class ServerConfig(BaseConfig):
+    """Defines the config class of the sessions of the game server."""
+
+    APP_CONFIG = "SERVER_CONFIG"
+    # Every session would start a level generation worker, levels are generated in place instead.
+    PREFETCH_LEVELS = 0
+    SESSION_SIZE: Tuple[int, int] = (1180, 620)
+    SERVER_WORKERS: Optional[int] = None
+
+
+def get_config() -> Type[Config]:
     """Returns the config object."""
     if TwitchConfig.TWITCH_MODE:
-        return TwitchConfig    # type: ignore
-    return BaseConfig    # type: ignore
+        return TwitchConfig
+    return BaseConfig
@@ -0,0 +1,114 @@
+"""Crowd vote of the chat on the player moves.
+
+Chat commands are votes for a direction. A voting window opens with the first vote and closes a fixed time later,
+the direction with the most votes then wins and a single movement event is posted for it. Every user votes once per
+window.
+
+Voters are not stored, every user name hashes to a slot of a fixed size array holding the window in which the slot
+last voted. Memory stays the same however many users chat, at the cost of the rare user sharing a slot with another
+voter of the same window and losing their vote.
+"""
+import time
+from typing import Callable, Dict, Final, Optional
+
+from src.event import Direction, Event, MovementEvent, TickEvent
+from src.event_listener import EventListener
+from src.event_manager import EventManager
+
+DEFAULT_WINDOW: Final = 1.0
+DEFAULT_VOTER_SLOTS: Final = 1 << 22
+# Slots store the window number modulo this, the slots are cleared when it wraps around.
+WINDOW_GENERATIONS: Final = 256
+
+
+class CrowdVote(EventListener):
+    """Tallies the chat votes and moves the player in the winning direction of every window."""
+
+    def __init__(self,
+                 event_manager: EventManager,
+                 window: float = DEFAULT_WINDOW,
+                 voter_slots: int = DEFAULT_VOTER_SLOTS,
+                 clock: Callable[[], float] = time.monotonic):
+        """Constructor for the crowd vote.
+
+        Args:
+            event_manager: The event manager.
+            window: length of a voting window in seconds.
+            voter_slots: size of the array of voters, more slots lose fewer votes to hash collisions.
+            clock: returns the current time in seconds.
+        """
+
+        self.event_manager = event_manager
+        self.window = window
+        self.clock = clock
+        self.voters = bytearray(voter_slots)
+        self.generation = 1
+        self.counts = [0] * (len(Direction) + 1)
+        self.leader: Optional[Direction] = None
+        self.window_end: Optional[float] = None
+        self.duplicates = 0
+        event_manager.register_listener(self, (TickEvent, ))
+
+    def vote(self, user: bytes, direction: Direction) -> bool:
+        """Counts the vote of a user in the current window.
+
+        Args:
+            user: name of the user.
+            direction: direction voted for.
+        Returns:
+            False if the user already voted in this window.
+        """
+
+        slot = hash(user) % len(self.voters)
+        if self.voters[slot] == self.generation:
+            self.duplicates += 1
+            return False
+        self.voters[slot] = self.generation
+        if self.window_end is None:
+            self.window_end = self.clock() + self.window
+        counts = self.counts
+        counts[direction.value] += 1
+        if self.leader is None or counts[direction.value] > counts[self.leader.value]:
+            self.leader = direction
+        return True
+
+    def close_window(self) -> Optional[Direction]:
+        """Posts the movement of the winning direction and opens the next window.
+
+        Ties go to the direction that got its number of votes first.
+
+        Returns:
+            the winning direction, None without votes.
+        """
+
+        winner = self.leader
+        if winner is not None:
+            self.event_manager.post(MovementEvent(winner))
+        self.counts = [0] * (len(Direction) + 1)
+        self.leader = self.window_end = None
+        self.generation += 1
+        if self.generation == WINDOW_GENERATIONS:
+            self.voters[:] = bytes(len(self.voters))
+            self.generation = 1
+        return winner
+
+    def get_tallies(self) -> Dict[Direction, int]:
+        """Returns the votes of every direction in the current window, for the on-screen bar."""
+
+        return {direction: self.counts[direction.value] for direction in Direction}
+
+    def get_time_left(self) -> float:
+        """Returns the seconds left in the current window, the full window length before the first vote."""
+
+        if self.window_end is None:
+            return self.window
+        return max(0.0, self.window_end - self.clock())
+
+    def notify(self, event: Event):
+        """Receive events posted to the message queue.
+
+        Args:
+            event: The event that was posted.
+        """
+        if isinstance(event, TickEvent) and self.window_end is not None and self.clock() >= self.window_end:
+            self.close_window()
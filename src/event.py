@@ -1,5 +1,6 @@
 """Event module."""
 from enum import Enum
+from typing import Any, ClassVar, Dict, Tuple
 
 
 class Direction(Enum):
@@ -11,74 +12,115 @@ class Direction(Enum):
 
 
 class Event:
-    """A superclass for any events that might be generated by an object and sent to the EventManager."""
+    """A superclass for any events that might be generated by an object and sent to the EventManager.
+
+    Events are immutable and slotted, so that a single instance can be shared by every post of the same event.
+    """
+
+    __slots__ = ()
+    name: ClassVar[str] = "Generic event"
+
+    def __setattr__(self, key: str, value: Any):
+        raise AttributeError(f"{type(self).__name__} is immutable")
 
-    def __init__(self, name: str = "Generic event"):
-        self.name = name
+    def __delattr__(self, key: str):
+        raise AttributeError(f"{type(self).__name__} is immutable")
 
     def __str__(self):
         return self.name
 
 
-class StartGameEvent(Event):
+# Interned instances of every event type, by the values of their slots.
+INTERNED_EVENTS: Dict[type, Dict[Tuple[Any, ...], Event]] = {}
+
+
+class InternedEvent(Event):
+    """An event interned by the values of its slots, creating an event equal to an earlier one returns it again."""
+
+    __slots__ = ()
+
+    def __new__(cls, *values: Any):
+        instances = INTERNED_EVENTS.get(cls)
+        if instances is None:
+            instances = INTERNED_EVENTS[cls] = {}
+        event = instances.get(values)
+        if event is None:
+            if len(values) != len(cls.__slots__):
+                raise TypeError(f"{cls.__name__} takes {len(cls.__slots__)} arguments, got {len(values)}")
+            event = super().__new__(cls)
+            slot: str
+            for slot, value in zip(cls.__slots__, values):
+                object.__setattr__(event, slot, value)
+            instances[values] = event
+        return event
+
+
+class StartGameEvent(InternedEvent):
     """A superclass for any events that might be generated by an object and sent to the EventManager."""
 
-    def __init__(self):
-        super().__init__("Start game event")
+    __slots__ = ()
+    name = "Start game event"
 
 
-class TickEvent(Event):
+class TickEvent(InternedEvent):
     """Tick event."""
 
-    def __init__(self):
-        super().__init__("Tick event")
+    __slots__ = ()
+    name = "Tick event"
+
+
+class RenderEvent(InternedEvent):
+    """Render event."""
+
+    __slots__ = ()
+    name = "Render event"
 
 
-class PauseEvent(Event):
+class PauseEvent(InternedEvent):
     """Pause event."""
 
-    def __init__(self):
-        super().__init__("Pause event")
+    __slots__ = ()
+    name = "Pause event"
 
 
-class SelectEvent(Event):
+class SelectEvent(InternedEvent):
     """Select event."""
 
-    def __init__(self):
-        super().__init__("Select event")
+    __slots__ = ()
+    name = "Select event"
 
 
-class QuitEvent(Event):
+class QuitEvent(InternedEvent):
     """Quit event."""
 
-    def __init__(self):
-        super().__init__("Quit event")
+    __slots__ = ()
+    name = "Quit event"
 
 
-class EscapeEvent(Event):
+class EscapeEvent(InternedEvent):
     """Escape event."""
 
-    def __init__(self):
-        super().__init__("Escape event")
+    __slots__ = ()
+    name = "Escape event"
 
 
-class MovementEvent(Event):
+class MovementEvent(InternedEvent):
     """Keyboard or mouse input event."""
 
-    def __init__(self, direction: Direction):
-        super().__init__("Movement event")
-        self.direction = direction
+    __slots__ = ("direction", )
+    name = "Movement event"
+    direction: Direction
 
     def __str__(self):
         return f"{self.name}, direction={self.direction}"
 
 
-class KeyboardEvent(Event):
+class KeyboardEvent(InternedEvent):
     """Keyboard input event."""
 
-    def __init__(self, key_char: str):
-        super().__init__("Keyboard Event")
-        self.key_char = key_char
+    __slots__ = ("key_char", )
+    name = "Keyboard Event"
+    key_char: str
 
     def __str__(self):
         return f"{self.name}, key_char={self.key_char}"
@@ -1,39 +1,171 @@
 """Event manager class."""
-from typing import Set
-from src.event import Event
+from collections import deque
+from typing import Callable, Deque, Dict, Final, Iterable, List, Optional, Tuple, Type, TypeVar
+
+from src.event import Event, QuitEvent
 from src.event_listener import EventListener
 
+Handler = Callable[[Event], None]
+EventType = TypeVar("EventType", bound=Event)
+# Event type, priority, registration order and handler of a subscription.
+Subscription = Tuple[Type[Event], int, int, Handler]
+
+DEFAULT_PRIORITY: Final = 0
+# Views draw the state left by the model and the controllers, so they are notified last.
+VIEW_PRIORITY: Final = 100
+ESSENTIAL_EVENTS: Final = (QuitEvent, )
+
 
 class EventManager:
     """We coordinate communication between the Model, View, and Controller."""
 
-    def __init__(self) -> None:
-        """Constructor for the event manager."""
+    def __init__(self,
+                 queue_size: Optional[int] = None,
+                 limits: Optional[Dict[Type[Event], int]] = None,
+                 essential: Iterable[Type[Event]] = ESSENTIAL_EVENTS) -> None:
+        """Constructor for the event manager.
+
+        Without a queue size events are dispatched as soon as they are posted. With one they are queued and
+        dispatched by drain, which the game loop calls once per tick.
+
+        Args:
+            queue_size: most events queued, and dispatched by a single drain.
+            limits: most queued events of a type, the extra events of that type are coalesced into the queued ones.
+            essential: event types queued even when the queue is full.
+        """
+
+        self.subscriptions: List[Subscription] = []
+        self.dispatch_table: Dict[Type[Event], List[Handler]] = {}
+        self.registrations = 0
+        self.queue_size = queue_size
+        self.limits = limits or {}
+        self.essential = frozenset(essential)
+        self.queue: Deque[Event] = deque()
+        self.pending: Dict[Type[Event], int] = dict.fromkeys(self.limits, 0)
+        self.coalesced = self.dropped = 0
+
+    def subscribe(self,
+                  event_type: Type[EventType],
+                  handler: Callable[[EventType], None],
+                  priority: int = DEFAULT_PRIORITY):
+        """Calls a handler with every posted event of a type or of one of its subclasses.
+
+        Handlers are called by increasing priority, handlers of the same priority in the order they subscribed.
+
+        Args:
+            event_type: The type of the events to handle.
+            handler: The handler to call with the events.
+            priority: The priority of the handler.
+        """
+
+        self.subscriptions.append((event_type, priority, self.registrations, handler))    # type: ignore[arg-type]
+        self.registrations += 1
+        self.dispatch_table.clear()
+
+    def unsubscribe(self, event_type: Type[Event], handler: Handler):
+        """Stops calling a handler with the events of a type.
+
+        Args:
+            event_type: The type the handler subscribed to.
+            handler: The handler to remove.
+        """
 
-        self.listeners: Set[EventListener] = set()
+        self.subscriptions = [
+            subscription for subscription in self.subscriptions
+            if subscription[0] is not event_type or subscription[3] != handler
+        ]
+        self.dispatch_table.clear()
 
-    def register_listener(self, listener: EventListener):
-        """Add a listener to our listener set.
+    def register_listener(self,
+                          listener: EventListener,
+                          event_types: Iterable[Type[Event]] = (Event, ),
+                          priority: int = DEFAULT_PRIORITY):
+        """Add a listener notified of the events of some types.
 
         Args:
             listener: The listener to add.
+            event_types: The types of the events the listener is notified of, every event by default.
+            priority: The priority of the listener.
         """
 
-        self.listeners.add(listener)
+        for event_type in event_types:
+            self.subscribe(event_type, listener.notify, priority)
 
     def unregister_listener(self, listener: EventListener):
-        """Remove a listener from our listener set.
+        """Remove a listener from every event type it was registered for.
         Args:
             listener: The listener to remove.
         """
-        self.listeners.remove(listener)
+        self.subscriptions = [subscription for subscription in self.subscriptions if subscription[3] != listener.notify]
+        self.dispatch_table.clear()
+
+    def get_handlers(self, event_type: Type[Event]) -> List[Handler]:
+        """Returns the handlers of an event type in call order, building its dispatch table entry on first use.
+
+        Args:
+            event_type: The type of a posted event.
+        """
 
-    def post(self, event: Event):
+        handlers = self.dispatch_table.get(event_type)
+        if handlers is None:
+            matching = sorted((priority, order, handler)
+                              for subscribed_type, priority, order, handler in self.subscriptions
+                              if issubclass(event_type, subscribed_type))
+            handlers = self.dispatch_table[event_type] = [handler for _, _, handler in matching]
+        return handlers
+
+    def post(self, event: Event) -> bool:
         """Post a new event to the message queue and notifies the listeners.
 
+        Args:
+            event: The event to notified to the listeners.
+        Returns:
+            False if the event was coalesced or dropped because the queue is full.
+        """
+
+        if self.queue_size is None:
+            self.dispatch(event)
+            return True
+
+        event_type = type(event)
+        limit = self.limits.get(event_type)
+        if limit is not None and self.pending[event_type] >= limit:
+            self.coalesced += 1
+            return False
+        if len(self.queue) >= self.queue_size and event_type not in self.essential:
+            self.dropped += 1
+            return False
+        self.queue.append(event)
+        if limit is not None:
+            self.pending[event_type] += 1
+        return True
+
+    def drain(self) -> int:
+        """Dispatches the queued events in order, the events posted meanwhile included, up to the queue size.
+
+        Returns:
+            the number of dispatched events.
+        """
+
+        dispatched = 0
+        while self.queue and dispatched < (self.queue_size or 0):
+            event = self.queue.popleft()
+            if type(event) in self.pending:
+                self.pending[type(event)] -= 1
+            self.dispatch(event)
+            dispatched += 1
+        return dispatched
+
+    def dispatch(self, event: Event):
+        """Notifies the listeners of an event right away.
+
         Args:
             event: The event to notified to the listeners.
         """
 
-        for listener in self.listeners:
-            listener.notify(event)
+        try:
+            handlers = self.dispatch_table[type(event)]
+        except KeyError:
+            handlers = self.get_handlers(type(event))
+        for handler in handlers:
+            handler(event)
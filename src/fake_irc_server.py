@@ -0,0 +1,92 @@
+"""Local fake of the Twitch IRC server, to test and benchmark the chat controller offline.
+
+The server accepts a connection, waits for the client to join a channel and streams generated chat lines to it, as
+fast as possible or at a given rate. It pings the client once the chat is sent and closes the connection when the
+client answers.
+"""
+import asyncio
+from random import Random
+from typing import List, Optional, Sequence
+
+CHAT_COMMANDS = ("up", "down", "left", "right", "pause")
+CHAT_NOISE = ("hello chat", "PogChamp", "go left you fool!", "what level is this?", "UP", " right ")
+
+
+def generate_chat(count: int, users: int, channel: str = "maze", seed: Optional[int] = None) -> List[bytes]:
+    """Returns chat lines as sent by Twitch, commands mixed with other messages.
+
+    Args:
+        count: number of lines.
+        users: number of distinct chatters.
+        channel: channel name.
+        seed: seed of the generator.
+    """
+
+    rng = Random(seed)
+    messages = CHAT_COMMANDS * 2 + CHAT_NOISE
+    lines = []
+    for _ in range(count):
+        user = f"user{rng.randrange(users)}"
+        lines.append(f":{user}!{user}@{user}.tmi.twitch.tv PRIVMSG #{channel} :{rng.choice(messages)}\r\n".encode())
+    return lines
+
+
+class FakeIrcServer:
+    """Streams chat lines to the clients joining a channel."""
+
+    def __init__(self, lines: Sequence[bytes], rate: Optional[float] = None, batch: int = 256):
+        """Constructor for the fake server.
+
+        Args:
+            lines: chat lines sent to every client.
+            rate: lines sent per second, as fast as possible if not given.
+            batch: lines written at once.
+        """
+
+        self.lines = lines
+        self.rate = rate
+        self.batch = batch
+        self.server: Optional[asyncio.AbstractServer] = None
+        self.received: List[bytes] = []
+
+    async def start(self, host: str = "127.0.0.1", port: int = 0) -> int:
+        """Starts listening and returns the port.
+
+        Args:
+            host: address to listen on.
+            port: port to listen on, any free port by default.
+        """
+
+        self.server = await asyncio.start_server(self.handle_client, host, port)
+        return self.server.sockets[0].getsockname()[1]
+
+    async def handle_client(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        """Sends the chat to a client once it joins a channel."""
+
+        try:
+            while not self.received or not self.received[-1].startswith(b"JOIN"):
+                line = await reader.readline()
+                if not line:
+                    return
+                self.received.append(line.rstrip(b"\r\n"))
+            writer.write(b":tmi.twitch.tv 001 maze :Welcome, GLHF!\r\n")
+            for start in range(0, len(self.lines), self.batch):
+                batch = self.lines[start:start + self.batch]
+                writer.write(b"".join(batch))
+                await writer.drain()
+                if self.rate is not None:
+                    await asyncio.sleep(len(batch) / self.rate)
+            writer.write(b"PING :tmi.twitch.tv\r\n")
+            await writer.drain()
+            self.received.append((await reader.readline()).rstrip(b"\r\n"))
+        except ConnectionError:
+            pass
+        finally:
+            writer.close()
+
+    async def close(self) -> None:
+        """Stops listening."""
+
+        if self.server is not None:
+            self.server.close()
+            await self.server.wait_closed()
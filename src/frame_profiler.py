@@ -0,0 +1,179 @@
+"""Per frame phase profiler.
+
+Every frame is split into named phases such as the keyboard poll, the event handling, the draw calls, the display
+update and the frame rate sleep. The time spent in each phase is kept for a rolling window of frames, for the
+on-screen overlay, and in a histogram over the whole run, to compare builds.
+"""
+import json
+from bisect import bisect_left
+from collections import deque
+from contextlib import AbstractContextManager, nullcontext
+from time import perf_counter
+from typing import Any, Deque, Dict, Final, List, Optional
+
+# Upper edges of the histogram buckets in milliseconds, the last bucket holds everything slower.
+BUCKET_EDGES_MS: Final = (0.1, 0.25, 0.5, 1.0, 2.0, 4.0, 8.0, 16.0, 33.0, 66.0, 133.0)
+FRAME_PHASE: Final = "frame"
+# Context manager of every phase while profiling is off, shared so that a disabled phase allocates nothing.
+NULL_PHASE: Final = nullcontext()
+
+
+class PhaseStats:
+    """Timings of a phase."""
+
+    def __init__(self, window: int):
+        """Constructor for the phase stats.
+
+        Args:
+            window: number of recent frames kept for the percentiles.
+        """
+
+        self.recent: Deque[float] = deque(maxlen=window)
+        self.histogram: List[int] = [0] * (len(BUCKET_EDGES_MS) + 1)
+        self.count = 0
+        self.total = self.max = 0.0
+
+    def add(self, seconds: float) -> None:
+        """Records the time spent in the phase during a frame."""
+
+        milliseconds = seconds * 1000
+        self.recent.append(milliseconds)
+        self.histogram[bisect_left(BUCKET_EDGES_MS, milliseconds)] += 1
+        self.count += 1
+        self.total += milliseconds
+        self.max = max(self.max, milliseconds)
+
+    def percentile(self, percent: float) -> float:
+        """Returns a percentile in milliseconds of the recent frames, 0 without frames.
+
+        Args:
+            percent: the percentile, between 0 and 100.
+        """
+
+        if not self.recent:
+            return 0.0
+        ordered = sorted(self.recent)
+        return ordered[min(len(ordered) - 1, int(len(ordered) * percent / 100))]
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Returns the stats in a JSON serializable form."""
+
+        return {
+            "count": self.count,
+            "total_ms": self.total,
+            "mean_ms": self.total / self.count if self.count else 0.0,
+            "max_ms": self.max,
+            "p50_ms": self.percentile(50),
+            "p95_ms": self.percentile(95),
+            "p99_ms": self.percentile(99),
+            "histogram": self.histogram,
+        }
+
+
+class PhaseTimer:
+    """Times one run of a phase and adds it to the current frame of a profiler."""
+
+    __slots__ = ("profiler", "name", "start")
+
+    def __init__(self, profiler: "FrameProfiler", name: str):
+        """Constructor for the phase timer.
+
+        Args:
+            profiler: profiler of the current frame.
+            name: name of the phase.
+        """
+
+        self.profiler = profiler
+        self.name = name
+        self.start = 0.0
+
+    def __enter__(self) -> None:
+        self.start = perf_counter()
+
+    def __exit__(self, *exc_info: Any) -> Optional[bool]:
+        current = self.profiler.current
+        current[self.name] = current.get(self.name, 0.0) + perf_counter() - self.start
+        return None
+
+
+class FrameProfiler:
+    """Times the phases of every frame."""
+
+    def __init__(self, enabled: bool = False, window: int = 120):
+        """Constructor for the frame profiler.
+
+        Args:
+            enabled: start profiling right away.
+            window: number of recent frames kept for the rolling FPS and percentiles.
+        """
+
+        self.enabled = enabled
+        self.window = window
+        self.stats: Dict[str, PhaseStats] = {}
+        self.current: Dict[str, float] = {}
+        self.frame_start = perf_counter()
+
+    def toggle(self) -> None:
+        """Turns profiling on or off, a frame starts when it is turned on."""
+
+        self.enabled = not self.enabled
+        self.current = {}
+        self.frame_start = perf_counter()
+
+    def phase(self, name: str) -> AbstractContextManager:
+        """Returns a context manager timing a phase of the current frame, phases run more than once in a frame are
+        summed.
+
+        Args:
+            name: name of the phase.
+        """
+
+        if not self.enabled:
+            return NULL_PHASE
+        return PhaseTimer(self, name)
+
+    def end_frame(self) -> None:
+        """Records the phases of the current frame and starts the next one."""
+
+        if not self.enabled:
+            return
+        now = perf_counter()
+        self.current[FRAME_PHASE] = now - self.frame_start
+        for name, seconds in self.current.items():
+            if name not in self.stats:
+                self.stats[name] = PhaseStats(self.window)
+            self.stats[name].add(seconds)
+        self.current = {}
+        self.frame_start = now
+
+    def get_fps(self) -> float:
+        """Returns the frame rate over the recent frames, 0 without frames."""
+
+        frames = self.stats.get(FRAME_PHASE)
+        if frames is None or not sum(frames.recent):
+            return 0.0
+        return len(frames.recent) * 1000 / sum(frames.recent)
+
+    def get_summary(self) -> str:
+        """Returns a one line summary of the recent frames for the overlay."""
+
+        frames = self.stats.get(FRAME_PHASE)
+        if frames is None:
+            return "FPS --"
+        return (f"FPS {self.get_fps():.1f}  frame p50 {frames.percentile(50):.1f} ms  "
+                f"p95 {frames.percentile(95):.1f} ms  p99 {frames.percentile(99):.1f} ms")
+
+    def dump(self, path: str) -> None:
+        """Writes the stats of every phase to a JSON file.
+
+        Args:
+            path: path of the JSON file.
+        """
+
+        phases = {name: stats.to_dict() for name, stats in sorted(self.stats.items())}
+        report = {"bucket_edges_ms": BUCKET_EDGES_MS, "phases": phases}
+        with open(path, "w", encoding="utf-8") as report_file:
+            json.dump(report, report_file, indent=2)
+
+
+PROFILER: Final = FrameProfiler()
@@ -0,0 +1,265 @@
+"""Headless multi-session game server.
+
+Sessions are independent maze games hosted without a window, pygame is never imported. They are sharded by id over
+worker processes, every worker owning the games of its shard. Moves come in batches of (session id, direction value)
+pairs and every batch returns the state diffs of the sessions it moved: the tiles changed since the last batch, or
+the whole board when the session moved on to a new level.
+"""
+import os
+from multiprocessing import Pipe, Process
+from multiprocessing.connection import Connection
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple, Type, Union
+
+from src.config import ServerConfig
+from src.event import Direction
+from src.maze_game import MazeGame, MazeGameState
+from src.maze_game.maze_board import Grid
+
+Move = Tuple[int, int]
+# rows, cols and tiles of a board, one byte per tile row by row.
+BoardState = Tuple[int, int, bytes]
+# session id, level, step count, player position, solved, changed tiles as (row, col, value), and the whole board
+# for a new session or level.
+StateDiff = Tuple[int, int, int, Tuple[int, int], bool, Tuple[Tuple[int, int, int], ...], Optional[BoardState]]
+
+# Handles the payload of a request to a shard and returns its diffs.
+ShardHandler = Callable[[Any], Optional[List[StateDiff]]]
+
+DIRECTIONS = {direction.value: direction for direction in Direction}
+
+
+def get_board_state(board: Grid) -> BoardState:
+    """Returns the rows, cols and tiles of a board."""
+
+    return len(board), len(board[0]), b"".join(bytes(board[row]) for row in range(len(board)))
+
+
+class SessionShard:
+    """Games of the sessions of a shard."""
+
+    def __init__(self, config: Type[ServerConfig] = ServerConfig):
+        """Constructor for the session shard.
+
+        Args:
+            config: config of the games, it should not prefetch levels as every game would start a worker for it.
+        """
+
+        self.config = config
+        self.sessions: Dict[int, MazeGame] = {}
+
+    def get_handlers(self) -> Dict[str, ShardHandler]:
+        """Returns the handler of every request command."""
+
+        return {"create": self.create, "move": self.move, "close": self.close}
+
+    def create(self, session_ids: Iterable[int]) -> List[StateDiff]:
+        """Starts the games of new sessions and returns their full state.
+
+        Args:
+            session_ids: ids of the new sessions.
+        """
+
+        diffs = []
+        for session_id in session_ids:
+            game = self.sessions[session_id] = MazeGame(self.config.SESSION_SIZE, self.config)
+            game.set_state(MazeGameState.PLAYING)
+            diffs.append(self.get_diff(session_id, game, True))
+        return diffs
+
+    def move(self, moves: Iterable[Move]) -> List[StateDiff]:
+        """Applies a batch of moves in order and returns the diffs of the moved sessions.
+
+        Moves of unknown sessions and moves in unknown directions are ignored.
+
+        Args:
+            moves: session id and direction value of every move.
+        """
+
+        levels: Dict[int, int] = {}
+        for session_id, direction in moves:
+            game = self.sessions.get(session_id)
+            move_direction = DIRECTIONS.get(direction)
+            if game is None or move_direction is None:
+                continue
+            if session_id not in levels:
+                levels[session_id] = game.curr_level
+            game.move(move_direction)
+        return [
+            self.get_diff(session_id, self.sessions[session_id], self.sessions[session_id].curr_level != level)
+            for session_id, level in levels.items()
+        ]
+
+    def close(self, session_ids: Iterable[int]) -> None:
+        """Ends sessions.
+
+        Args:
+            session_ids: ids of the sessions.
+        """
+
+        for session_id in session_ids:
+            game = self.sessions.pop(session_id, None)
+            if game is not None:
+                game.close()
+
+    @staticmethod
+    def get_diff(session_id: int, game: MazeGame, new_board: bool) -> StateDiff:
+        """Returns the state diff of a session since its last diff.
+
+        Args:
+            session_id: id of the session.
+            game: game of the session.
+            new_board: send the whole board instead of the changed tiles.
+        """
+
+        maze = game.get_maze()
+        board = maze.get_board()
+        changed_tiles = maze.take_changed_tiles()
+        tiles = () if new_board else tuple((row, col, board[row][col]) for row, col in dict.fromkeys(changed_tiles))
+        return (session_id, game.curr_level, maze.step_count, maze.board.curr_pos, maze.is_solved(), tiles,
+                get_board_state(board) if new_board else None)
+
+
+class ShardError(Exception):
+    """Error of a request to a shard."""
+
+
+def run_shard(connection: Connection, config: Type[ServerConfig]) -> None:
+    """Serves the requests of a shard received on a connection until it is stopped.
+
+    A request that fails sends its error back instead of its result, the shard keeps serving.
+
+    Args:
+        connection: worker end of the pipe of the shard.
+        config: config of the games.
+    """
+
+    shard = SessionShard(config)
+    handlers = shard.get_handlers()
+    while True:
+        command, payload = connection.recv()
+        if command == "stop":
+            break
+        result: Union[Optional[List[StateDiff]], ShardError]
+        try:
+            result = handlers[command](payload)
+        except Exception as error:    # pylint: disable=broad-except
+            result = ShardError(f"{command} failed: {error!r}")
+        connection.send(result)
+    shard.close(list(shard.sessions))
+    connection.close()
+
+
+class GameServer:
+    """Hosts sessions sharded over worker processes."""
+
+    def __init__(self, workers: Optional[int] = None, config: Type[ServerConfig] = ServerConfig):
+        """Constructor for the game server.
+
+        Args:
+            workers: number of worker processes, one per core if not given. With 0 the sessions are hosted in
+                this process.
+            config: config of the games.
+        """
+
+        self.workers = (os.cpu_count() or 1) if workers is None else workers
+        self.local_shard = SessionShard(config) if self.workers == 0 else None
+        self.connections: List[Connection] = []
+        self.processes: List[Process] = []
+        for _ in range(self.workers):
+            connection, worker_connection = Pipe()
+            process = Process(target=run_shard, args=(worker_connection, config), daemon=True)
+            process.start()
+            worker_connection.close()
+            self.connections.append(connection)
+            self.processes.append(process)
+        self.next_session_id = 0
+
+    def get_shard_count(self) -> int:
+        """Returns the number of shards."""
+
+        return max(1, self.workers)
+
+    def request(self, command: str, payloads: List[Any]) -> List[StateDiff]:
+        """Sends a request to every shard with a payload and returns their diffs.
+
+        The shards process their requests concurrently.
+
+        Args:
+            command: name of the request.
+            payloads: payload of every shard, shards with an empty payload are skipped.
+        Raises:
+            ShardError: if the request failed on a shard, once every shard has answered.
+        """
+
+        if self.local_shard is not None:
+            return self.local_shard.get_handlers()[command](payloads[0]) or []
+        busy = []
+        for connection, payload in zip(self.connections, payloads):
+            if payload:
+                connection.send((command, payload))
+                busy.append(connection)
+        diffs: List[StateDiff] = []
+        errors = []
+        for connection in busy:
+            result = connection.recv()
+            if isinstance(result, ShardError):
+                errors.append(result)
+            else:
+                diffs.extend(result or [])
+        if errors:
+            raise errors[0]
+        return diffs
+
+    def split(self, items: Iterable[Any], get_session_id: Callable[[Any], int]) -> List[List[Any]]:
+        """Splits items over the shards of their sessions.
+
+        Args:
+            items: items to split.
+            get_session_id: returns the session id of an item.
+        """
+
+        shards: List[List[Any]] = [[] for _ in range(self.get_shard_count())]
+        for item in items:
+            shards[get_session_id(item) % len(shards)].append(item)
+        return shards
+
+    def create_sessions(self, count: int) -> List[StateDiff]:
+        """Starts new sessions and returns their full state.
+
+        Args:
+            count: number of sessions.
+        """
+
+        session_ids = range(self.next_session_id, self.next_session_id + count)
+        self.next_session_id += count
+        return self.request("create", self.split(session_ids, int))
+
+    def move(self, moves: Iterable[Move]) -> List[StateDiff]:
+        """Applies a batch of moves and returns the diffs of the moved sessions.
+
+        Args:
+            moves: session id and direction value of every move, the moves of a session are applied in order.
+        """
+
+        return self.request("move", self.split(moves, lambda move: move[0]))
+
+    def close_sessions(self, session_ids: Iterable[int]) -> None:
+        """Ends sessions.
+
+        Args:
+            session_ids: ids of the sessions.
+        """
+
+        self.request("close", self.split(session_ids, int))
+
+    def close(self) -> None:
+        """Ends every session and stops the workers."""
+
+        for connection in self.connections:
+            connection.send(("stop", None))
+            connection.close()
+        for process in self.processes:
+            process.join()
+        self.connections, self.processes = [], []
+        if self.local_shard is not None:
+            self.local_shard.close(list(self.local_shard.sessions))
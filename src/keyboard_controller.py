@@ -7,6 +7,7 @@ from src.event import (Event, QuitEvent, TickEvent, MovementEvent, Direction, Es
                        KeyboardEvent)
 from src.event_manager import EventManager
 from src.event_listener import EventListener
+from src.frame_profiler import PROFILER
 
 
 class Keyboard(EventListener):
@@ -19,7 +20,7 @@ class Keyboard(EventListener):
             event_manager: The event manager.
         """
         self.event_manager = event_manager
-        event_manager.register_listener(self)
+        event_manager.register_listener(self, (TickEvent, ))
 
         self.key_event_map = {
             K_UP: MovementEvent(Direction.UP),
@@ -34,7 +35,9 @@ class Keyboard(EventListener):
     def post_keyboard_event(self):
         """Get events from the keyboard."""
 
-        for event in py_event.get():
+        with PROFILER.phase("keyboard.poll"):
+            events = py_event.get()
+        for event in events:
             if event.type == QUIT:
                 self.event_manager.post(QuitEvent())
             if event.type == KEYDOWN:
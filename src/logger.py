@@ -1,38 +1,125 @@
-"""Maze Game Logger definition."""
-from typing import Final
-from logging import INFO, DEBUG, getLogger, FileHandler, StreamHandler, Formatter, Logger
+"""Maze Game Logger definition.
+
+Loggers only put their records on a queue, a background thread formats them and writes them to the log file and the
+terminal, so a slow disk or terminal never stalls the game loop. Records of events are sampled and rate limited per
+event type before they are queued.
+"""
+import atexit
+import time
+from logging import DEBUG, INFO, FileHandler, Filter, Formatter, Logger, LogRecord, StreamHandler, getLogger
+from logging.handlers import QueueHandler, QueueListener
+from queue import SimpleQueue
+from typing import Any, Callable, Dict, Final, Optional, Tuple
 
 from src.config import get_config
 
+LOG_QUEUE: Final[SimpleQueue] = SimpleQueue()
+# Name of the LogRecord attribute holding the event type, set with extra={EVENT_TYPE: ...}.
+EVENT_TYPE: Final = "event_type"
+
+
+class EventLogFilter(Filter):
+    """Samples and rate limits the records of events, per event type.
+
+    Records without an event type are always kept.
+    """
+
+    def __init__(self, sample_rates: Dict[str, int], max_per_second: int, clock: Callable[[], float] = time.monotonic):
+        """Constructor for the event log filter.
+
+        Args:
+            sample_rates: keep one record out of this many of an event type, every record of the other types.
+            max_per_second: most records of an event type kept per second.
+            clock: returns the current time in seconds.
+        """
+
+        super().__init__()
+        self.sample_rates = sample_rates
+        self.max_per_second = max_per_second
+        self.clock = clock
+        self.counts: Dict[str, int] = {}
+        # Second and number of records kept in it, per event type.
+        self.seconds: Dict[str, Tuple[int, int]] = {}
+        self.suppressed = 0
+
+    def filter(self, record: LogRecord) -> bool:
+        """Returns whether a record is logged."""
+
+        event_type = getattr(record, EVENT_TYPE, None)
+        if event_type is None:
+            return True
+        count = self.counts[event_type] = self.counts.get(event_type, 0) + 1
+        second = int(self.clock())
+        kept_second, kept = self.seconds.get(event_type, (second, 0))
+        if kept_second != second:
+            kept = 0
+        if count % self.sample_rates.get(event_type, 1) or kept >= self.max_per_second:
+            self.suppressed += 1
+            return False
+        self.seconds[event_type] = (second, kept + 1)
+        return True
+
+
+class DeferredQueueHandler(QueueHandler):
+    """Queues records without formatting them, the writer thread formats them.
+
+    The arguments of a record are formatted later in another thread, so only immutable values should be logged.
+    """
+
+    def prepare(self, record: LogRecord) -> Any:
+        """Returns the record unchanged."""
+
+        return record
 
-def init_logger(name: str) -> Logger:
-    """Initialize the module logger."""
+
+LOG_HANDLER: Optional[DeferredQueueHandler] = None
+LOG_LISTENER: Optional[QueueListener] = None
+
+
+def start_logging() -> DeferredQueueHandler:
+    """Starts the log writer thread and returns the handler queuing records for it, only once."""
+
+    global LOG_HANDLER, LOG_LISTENER    # pylint: disable=global-statement
+    if LOG_HANDLER is not None:
+        return LOG_HANDLER
 
     config = get_config()
-    print(config)
-    logger: Final = getLogger(name)
-    logger.setLevel(INFO)
-    if config.DEBUG:
-        logger.setLevel(DEBUG)
-
-    # create file handler which logs even debug messages
-    file_handler = FileHandler(config.LOG_FILE)
-    file_handler.setLevel(INFO)
-    if config.DEBUG:
-        file_handler.setLevel(DEBUG)
-    # create console handler with a higher log level
-    console_handler = StreamHandler()
-    console_handler.setLevel(INFO)
-    if config.DEBUG:
-        console_handler.setLevel(DEBUG)
-    # create formatter and add it to the handlers
+    level = DEBUG if config.DEBUG else INFO
     formatter = Formatter(config.LOG_FORMAT, datefmt=config.LOG_DATE_FORMAT)
+    # The log file is only created once a record is written.
+    file_handler = FileHandler(config.LOG_FILE, delay=True)
+    console_handler = StreamHandler()
+    for handler in (file_handler, console_handler):
+        handler.setLevel(level)
+        handler.setFormatter(formatter)
 
-    file_handler.setFormatter(formatter)
-    console_handler.setFormatter(formatter)
+    LOG_HANDLER = DeferredQueueHandler(LOG_QUEUE)
+    LOG_HANDLER.addFilter(EventLogFilter(config.LOG_EVENT_SAMPLE_RATES, config.LOG_EVENTS_PER_SECOND))
+    LOG_LISTENER = QueueListener(LOG_QUEUE, file_handler, console_handler, respect_handler_level=True)
+    LOG_LISTENER.start()
+    atexit.register(stop_logging)
+    return LOG_HANDLER
 
-    # add the handlers to logger
-    logger.addHandler(file_handler)
-    logger.addHandler(console_handler)
 
+def stop_logging() -> None:
+    """Writes the queued records and stops the log writer thread."""
+
+    global LOG_LISTENER    # pylint: disable=global-statement
+    if LOG_LISTENER is not None:
+        LOG_LISTENER.stop()
+        LOG_LISTENER = None
+
+
+def init_logger(name: str) -> Logger:
+    """Initialize the module logger, calling it again for the same module returns the same logger.
+
+    Args:
+        name: name of the module.
+    """
+
+    handler = start_logging()
+    logger: Final = getLogger(name)
+    logger.setLevel(DEBUG if get_config().DEBUG else INFO)
+    if handler not in logger.handlers:
+        logger.addHandler(handler)
     return logger
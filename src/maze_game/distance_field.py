@@ -0,0 +1,97 @@
+"""Distance to goal field of a maze."""
+from array import array
+from typing import List, Optional, Tuple
+
+from src.event import Direction
+from src.maze_game.maze_board import Grid
+from src.maze_game.maze_game_object import MazeGameObject
+
+# Tile values to 1 for walls and 0 for every tile the player can stand on.
+WALL_FLAGS = bytes(1 if value == MazeGameObject.WALL.value else 0 for value in range(256))
+
+MOVES = ((Direction.UP, -1, 0), (Direction.DOWN, 1, 0), (Direction.LEFT, 0, -1), (Direction.RIGHT, 0, 1))
+
+
+class DistanceField:
+    """Breadth first search distances from every tile of a maze to its goal.
+
+    Walls never change within a level, so the field is computed once and every lookup after that is O(1).
+    """
+
+    def __init__(self, board: Grid, end: Tuple[int, int]):
+        """Constructor for the distance field.
+
+        Args:
+            board: the maze board.
+            end: coordinates of the goal.
+        """
+
+        self.n_row, self.n_col = len(board), len(board[0])
+        walls = b"".join(bytes(board[i]) for i in range(self.n_row)).translate(WALL_FLAGS)
+        self.distances = array("i", [-1]) * len(walls)
+
+        n_col, size = self.n_col, len(walls)
+        goal = end[0] * n_col + end[1]
+        self.distances[goal] = 0
+        queue = array("i", [goal])
+        head = 0
+        while head < len(queue):
+            tile = queue[head]
+            head += 1
+            distance = self.distances[tile] + 1
+            col = tile % n_col
+            for neighbour in (tile - n_col, tile + n_col, tile - 1 if col > 0 else -1,
+                              tile + 1 if col < n_col - 1 else -1):
+                if 0 <= neighbour < size and not walls[neighbour] and self.distances[neighbour] < 0:
+                    self.distances[neighbour] = distance
+                    queue.append(neighbour)
+
+    def distance(self, pos: Tuple[int, int]) -> int:
+        """Returns the number of moves from a position to the goal, -1 if the goal can't be reached.
+
+        Args:
+            pos: coordinates on the board.
+        """
+
+        return self.distances[pos[0] * self.n_col + pos[1]]
+
+    def is_solvable(self, start: Tuple[int, int]) -> bool:
+        """Returns if the goal can be reached from a position."""
+
+        return self.distance(start) >= 0
+
+    def next_move(self, pos: Tuple[int, int]) -> Optional[Direction]:
+        """Returns the move getting one step closer to the goal, None at the goal or when it can't be reached.
+
+        Args:
+            pos: coordinates on the board.
+        """
+
+        distance = self.distance(pos)
+        if distance <= 0:
+            return None
+        for direction, d_row, d_col in MOVES:
+            row, col = pos[0] + d_row, pos[1] + d_col
+            if 0 <= row < self.n_row and 0 <= col < self.n_col and self.distance((row, col)) == distance - 1:
+                return direction
+        return None
+
+    def solution_path(self, pos: Tuple[int, int]) -> List[Tuple[int, int]]:
+        """Returns the tiles of a shortest path from a position to the goal, both included.
+
+        Args:
+            pos: coordinates on the board.
+        """
+
+        if self.distance(pos) < 0:
+            return []
+        path = [pos]
+        for _ in range(self.distance(pos)):
+            row, col = path[-1]
+            for _, d_row, d_col in MOVES:
+                step = (row + d_row, col + d_col)
+                if 0 <= step[0] < self.n_row and 0 <= step[1] < self.n_col \
+                        and self.distance(step) == self.distance(path[-1]) - 1:
+                    path.append(step)
+                    break
+        return path
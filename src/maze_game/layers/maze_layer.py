@@ -1,26 +1,75 @@
 """Defining the maze game layer"""
+from typing import List, Optional, Tuple, Union
 
-from typing import List
-
-from src.maze_game.maze_board import MazeBoard
-from src.maze_game.maze_generation import generate_prim_maze
+from src.event import Direction
+from src.maze_game.distance_field import DistanceField
+from src.maze_game.maze_board import Grid, MazeBoard
+from src.maze_game.maze_cache import MazeCache, get_maze_cache
+from src.maze_game.maze_generators import MAZE_GENERATORS, resolve_generator_name
+from src.maze_game.maze_file import PackedBoard, open_board_file
+from src.maze_game.maze_mmap import MappedBoard
 
 
 class MazeLayer:
     """Maze Layer Definition."""
 
-    def __init__(self, maze_height: int, maze_width: int, level: int = 1):
-        """Constructor for the maze layer."""
+    def __init__(self,
+                 maze_height: int,
+                 maze_width: int,
+                 level: int = 1,
+                 use_numpy: bool = False,
+                 generator: str = "prim",
+                 board_file: Optional[str] = None,
+                 seed: Optional[int] = None,
+                 cache: Optional[MazeCache] = None):
+        """Constructor for the maze layer.
+
+        Args:
+            maze_height: pixel height of the maze.
+            maze_width: pixel width of the maze.
+            level: level number, sets the tile size.
+            use_numpy: store the board as an int8 ndarray instead of a 2D List.
+            generator: name of a registered maze generator, or "auto" to pick the cheapest one for the board size.
+            board_file: board file or maze file to map lazily instead of generating a maze.
+            seed: seed of the maze, seeded mazes are looked up in the maze cache before being generated.
+            cache: maze cache of the seeded mazes, the shared default cache if not given.
+        """
 
         self.step_count = 0
         self.level_count = level
-        self.tile_width, self.tile_height = 100 // level, 100 // level
-        self.tile_width_count, self.tile_height_count = maze_width // self.tile_width, maze_height // self.tile_height
-
-        start, end, board = generate_prim_maze(self.tile_height_count, self.tile_width_count)
-        self.board = MazeBoard(board, start, end, (start[0], start[1]))
-
-    def get_board(self) -> List[List[int]]:
+        self.seed = seed
+        self.distance_field: Optional[DistanceField] = None
+        self.changed_tiles: List[Tuple[int, int]] = []
+        self.mapped_board: Optional[Union[MappedBoard, PackedBoard]] = None
+        if board_file is not None:
+            self.generator = "file"
+            start, end, mapped_board = open_board_file(board_file)
+            self.mapped_board = mapped_board
+            self.tile_width_count, self.tile_height_count = mapped_board.n_col, mapped_board.n_row
+            self.tile_width = self.tile_height = max(
+                1, min(maze_width // mapped_board.n_col, maze_height // mapped_board.n_row))
+            self.board = MazeBoard(mapped_board, start, end, (start[0], start[1]))
+        else:
+            self.tile_width, self.tile_height = 100 // level, 100 // level
+            self.tile_width_count = maze_width // self.tile_width
+            self.tile_height_count = maze_height // self.tile_height
+
+            self.generator = resolve_generator_name(generator, self.tile_height_count, self.tile_width_count)
+            if seed is not None:
+                start, end, board = (cache or get_maze_cache()).get_maze(self.tile_height_count, self.tile_width_count,
+                                                                         self.generator, seed, use_numpy)
+            else:
+                generate = MAZE_GENERATORS[self.generator]
+                start, end, board = generate(self.tile_height_count, self.tile_width_count, use_numpy)
+            self.board = MazeBoard(board, start, end, (start[0], start[1]))
+
+    def close(self) -> None:
+        """Releases the mapping of the board file, if the maze was opened from one."""
+        if self.mapped_board is not None:
+            self.mapped_board.close()
+            self.mapped_board = None
+
+    def get_board(self) -> Grid:
         """Returns the maze board."""
         return self.board.board
 
@@ -28,6 +77,29 @@ class MazeLayer:
         """Returns if the maze is solved."""
         return self.board.solved
 
+    def take_changed_tiles(self) -> List[Tuple[int, int]]:
+        """Returns the tiles changed by the moves since the last call."""
+        changed_tiles, self.changed_tiles = self.changed_tiles, []
+        return changed_tiles
+
+    def get_distance_field(self) -> DistanceField:
+        """Returns the distance to goal field of the maze, computed on first use."""
+        if self.distance_field is None:
+            self.distance_field = DistanceField(self.board.board, self.board.end)
+        return self.distance_field
+
+    def get_hint(self) -> Optional[Direction]:
+        """Returns the next best move of the player."""
+        return self.get_distance_field().next_move(self.board.curr_pos)
+
+    def get_distance_remaining(self) -> int:
+        """Returns the number of moves left to reach the goal."""
+        return self.get_distance_field().distance(self.board.curr_pos)
+
+    def get_solution_path(self) -> List[Tuple[int, int]]:
+        """Returns the tiles of a shortest path from the player to the goal."""
+        return self.get_distance_field().solution_path(self.board.curr_pos)
+
     def move_left(self):
         """Moves the player one place left."""
 
@@ -45,6 +117,7 @@ class MazeLayer:
                 self.board.solved = True
 
             self.board.curr_pos = (curr_pos[0], curr_pos[1] - 1)
+            self.changed_tiles.extend((curr_pos, self.board.curr_pos))
             self.board.board[curr_pos[0]][curr_pos[1] - 1] = 7
 
     def move_right(self):
@@ -64,6 +137,7 @@ class MazeLayer:
                 self.board.solved = True
 
             self.board.curr_pos = (curr_pos[0], curr_pos[1] + 1)
+            self.changed_tiles.extend((curr_pos, self.board.curr_pos))
             self.board.board[curr_pos[0]][curr_pos[1] + 1] = 7
 
     def move_up(self):
@@ -82,6 +156,7 @@ class MazeLayer:
             if board[curr_pos[0] - 1][curr_pos[1]] == 2:
                 self.board.solved = True
             self.board.curr_pos = (curr_pos[0] - 1, curr_pos[1])
+            self.changed_tiles.extend((curr_pos, self.board.curr_pos))
             self.board.board[curr_pos[0] - 1][curr_pos[1]] = 7
 
     def move_down(self):
@@ -100,4 +175,5 @@ class MazeLayer:
             if board[curr_pos[0] + 1][curr_pos[1]] == 2:
                 self.board.solved = True
             self.board.curr_pos = (curr_pos[0] + 1, curr_pos[1])
+            self.changed_tiles.extend((curr_pos, self.board.curr_pos))
             self.board.board[curr_pos[0] + 1][curr_pos[1]] = 7
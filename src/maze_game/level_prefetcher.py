@@ -0,0 +1,124 @@
+"""Background generation of the upcoming maze levels."""
+from concurrent.futures import Executor, Future, ProcessPoolExecutor, ThreadPoolExecutor
+from typing import Any, Dict, Optional, Tuple
+
+from src.maze_game.layers.maze_layer import MazeLayer
+from src.maze_game.maze_cache import MazeCache, level_seed
+from src.maze_game.maze_generation import seed_shared_rng
+
+
+def build_level(*args: Any) -> MazeLayer:
+    """Generates a level in the worker along with its distance field, so that its first hint never stalls a frame.
+
+    Args:
+        args: the MazeLayer arguments of the level.
+    """
+
+    maze_layer = MazeLayer(*args)
+    maze_layer.get_distance_field()
+    return maze_layer
+
+
+class LevelPrefetcher:
+    """Generates the next levels of a maze game in a worker while the current level is played."""
+
+    def __init__(self,
+                 size: Tuple[int, int],
+                 depth: int = 1,
+                 use_processes: bool = False,
+                 use_numpy: bool = False,
+                 generator: str = "prim",
+                 base_seed: Optional[int] = None,
+                 cache: Optional[MazeCache] = None):
+        """Constructor for the level prefetcher.
+
+        Args:
+            size: pixel width and height of the maze.
+            depth: number of levels generated ahead of the current one, 0 disables prefetching.
+            use_processes: generate in a worker process instead of a worker thread.
+            use_numpy: store the boards as int8 ndarrays instead of 2D Lists.
+            generator: name of a registered maze generator, or "auto".
+            base_seed: seed of the game, every level gets a seed derived from it. Unseeded levels are random.
+            cache: maze cache of the seeded levels.
+        """
+
+        self.size = size
+        self.depth = depth
+        self.use_numpy = use_numpy
+        self.generator = generator
+        self.base_seed = base_seed
+        self.cache = cache
+        self.pending: Dict[int, Future] = {}
+        self.executor: Optional[Executor] = None
+        if depth > 0:
+            try:
+                self.executor = ProcessPoolExecutor(1, initializer=seed_shared_rng) if use_processes \
+                    else ThreadPoolExecutor(1, thread_name_prefix="level_prefetch")
+            except (NotImplementedError, OSError):
+                # Platforms without workers, such as the browser build, generate every level in place.
+                self.executor = None
+
+    def create_level(self, level: int) -> MazeLayer:
+        """Generates a level in place.
+
+        Args:
+            level: The level number.
+        """
+
+        return MazeLayer(*self.get_level_args(level))
+
+    def get_level_args(self, level: int) -> Tuple[Any, ...]:
+        """Returns the MazeLayer arguments of a level.
+
+        Args:
+            level: The level number.
+        """
+
+        seed = None if self.base_seed is None else level_seed(self.base_seed, level)
+        return self.size[1], self.size[0], level, self.use_numpy, self.generator, None, seed, self.cache
+
+    def prefetch(self, level: int) -> None:
+        """Starts generating the levels following a level.
+
+        Args:
+            level: The level being played.
+        """
+
+        if self.executor is None:
+            return
+        for next_level in range(level + 1, level + 1 + self.depth):
+            if next_level in self.pending:
+                continue
+            try:
+                self.pending[next_level] = self.executor.submit(build_level, *self.get_level_args(next_level))
+            except RuntimeError:
+                self.close()
+                return
+
+    def get_level(self, level: int) -> MazeLayer:
+        """Returns a level, prefetched when possible.
+
+        A level that is still being generated is waited for, since that is never slower than starting over.
+        A level that was not started yet is generated in place.
+
+        Args:
+            level: The level number.
+        """
+
+        future = self.pending.pop(level, None)
+        if future is not None and (future.done() or not future.cancel()):
+            try:
+                return future.result()
+            except Exception:    # pylint: disable=broad-except
+                pass
+        return self.create_level(level)
+
+    def close(self) -> None:
+        """Stops the worker and drops the levels not played yet."""
+
+        for future in self.pending.values():
+            future.cancel()
+        self.pending.clear()
+        if self.executor is not None:
+            self.executor.shutdown(wait=False, cancel_futures=True)
+            self.executor = None
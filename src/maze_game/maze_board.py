@@ -1,13 +1,23 @@
 """Maze board class."""
 
 from dataclasses import dataclass
-from typing import List, Tuple
+from typing import TYPE_CHECKING, List, Tuple, Union
+
+if TYPE_CHECKING:
+    from numpy import ndarray
+    from src.maze_game.maze_file import PackedBoard
+    from src.maze_game.maze_mmap import MappedBoard
+
+# Board built by the maze generators, a 2D List or a 2D int8 ndarray when numpy is installed.
+MazeMatrix = Union[List[List[int]], "ndarray"]
+# A maze board is a generated board, or a memory mapped board or maze file. All of them are indexed as board[row][col].
+Grid = Union[MazeMatrix, "MappedBoard", "PackedBoard"]
 
 
 @dataclass
 class MazeBoard:
     """Maze board class."""
-    board: List[List[int]]
+    board: Grid
     start: Tuple[int, int]
     end: Tuple[int, int]
     curr_pos: Tuple[int, int]
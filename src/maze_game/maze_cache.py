@@ -0,0 +1,155 @@
+"""Cache of seeded mazes.
+
+A seeded maze is fully determined by its dimensions, its generator and its seed, so those are the cache key. Mazes
+are kept in memory as immutable tile bytes in a least recently used cache, and optionally on disk as board files
+named after a hash of the key.
+"""
+import hashlib
+import os
+import threading
+from collections import OrderedDict
+from functools import lru_cache
+from typing import Optional, Tuple
+
+from src.maze_game.maze_board import Grid
+from src.maze_game.maze_generators import MAZE_GENERATORS
+from src.maze_game.maze_generation import to_ndarray
+from src.maze_game.maze_mmap import open_maze_file, write_maze_file
+
+MazeKey = Tuple[int, int, str, int]
+CachedMaze = Tuple[Tuple[int, int], Tuple[int, int], bytes]
+
+
+class MazeCache:
+    """Two tier cache of seeded mazes."""
+
+    def __init__(self, max_entries: int = 32, directory: Optional[str] = None):
+        """Constructor for the maze cache.
+
+        Args:
+            max_entries: number of mazes kept in memory.
+            directory: directory of the on disk tier, no disk tier by default.
+        """
+
+        self.max_entries = max_entries
+        self.directory = directory
+        self.entries: "OrderedDict[MazeKey, CachedMaze]" = OrderedDict()
+        self.hits = self.disk_hits = self.misses = 0
+        self.lock = threading.Lock()
+        if directory is not None:
+            os.makedirs(directory, exist_ok=True)
+
+    def __reduce__(self) -> Tuple[type, Tuple[int, Optional[str]]]:
+        # Worker processes get an empty cache with the same settings, sharing the disk tier only.
+        return MazeCache, (self.max_entries, self.directory)
+
+    def get_path(self, key: MazeKey) -> str:
+        """Returns the disk tier path of a maze.
+
+        Args:
+            key: rows, columns, generator name and seed of the maze.
+        """
+
+        digest = hashlib.sha1(repr(key).encode()).hexdigest()
+        return os.path.join(self.directory or "", f"{digest}.board")
+
+    def lookup(self, key: MazeKey) -> Optional[CachedMaze]:
+        """Returns a cached maze from memory or from disk.
+
+        Args:
+            key: rows, columns, generator name and seed of the maze.
+        """
+
+        with self.lock:
+            maze = self.entries.get(key)
+            if maze is not None:
+                self.entries.move_to_end(key)
+                self.hits += 1
+                return maze
+
+        if self.directory is None or not os.path.exists(self.get_path(key)):
+            return None
+        start, end, board = open_maze_file(self.get_path(key))
+        maze = (start, end, bytes(board.tiles))
+        board.close()
+        self.store(key, maze)
+        with self.lock:
+            self.disk_hits += 1
+        return maze
+
+    def store(self, key: MazeKey, maze: CachedMaze) -> None:
+        """Keeps a maze in memory, evicting the least recently used one when full.
+
+        Args:
+            key: rows, columns, generator name and seed of the maze.
+            maze: start position, end position and tiles of the maze.
+        """
+
+        with self.lock:
+            self.entries[key] = maze
+            self.entries.move_to_end(key)
+            while len(self.entries) > self.max_entries:
+                self.entries.popitem(last=False)
+
+    def get_maze(self,
+                 n_row: int,
+                 n_col: int,
+                 generator: str,
+                 seed: int,
+                 use_numpy: bool = False) -> Tuple[Tuple[int, int], Tuple[int, int], Grid]:
+        """Returns a seeded maze, generating it only when it is not cached.
+
+        Every call returns a new board, so the player moves never change the cached maze.
+
+        Args:
+            n_row: number of rows in the maze board.
+            n_col: number of columns the maze board.
+            generator: name of a registered maze generator.
+            seed: seed of the maze.
+            use_numpy: return the board as an int8 ndarray instead of a 2D List.
+        Returns:
+            start position coordinates
+            end position coordinates
+            maze board
+        """
+
+        key = (n_row, n_col, generator, seed)
+        maze = self.lookup(key)
+        if maze is None:
+            with self.lock:
+                self.misses += 1
+            start, end, board = MAZE_GENERATORS[generator](n_row, n_col, seed=seed)
+            maze = (start, end, b"".join(bytes(board[row]) for row in range(n_row)))
+            self.store(key, maze)
+            if self.directory is not None:
+                path = self.get_path(key)
+                temp_path = f"{path}.{os.getpid()}.{threading.get_ident()}"
+                write_maze_file(temp_path, start, end, maze[2], n_col)
+                os.replace(temp_path, path)
+
+        start, end, tiles = maze
+        rows = [list(tiles[i * n_col:(i + 1) * n_col]) for i in range(n_row)]
+        return start, end, to_ndarray(rows) if use_numpy else rows
+
+
+@lru_cache(maxsize=None)
+def get_maze_cache(max_entries: int = 32, directory: Optional[str] = None) -> MazeCache:
+    """Returns the maze cache shared by every game with the same cache settings.
+
+    Args:
+        max_entries: number of mazes kept in memory.
+        directory: directory of the on disk tier, no disk tier by default.
+    """
+
+    return MazeCache(max_entries, directory)
+
+
+def level_seed(base_seed: int, level: int) -> int:
+    """Returns the seed of a level for a game seed, such as a daily seed.
+
+    Args:
+        base_seed: seed of the game.
+        level: level number.
+    """
+
+    return int.from_bytes(hashlib.sha1(f"{base_seed}:{level}".encode()).digest()[:8], "little")
@@ -0,0 +1,222 @@
+"""Maze corpus file for curated level packs.
+
+A corpus file starts with a header naming the generator, followed by one record per maze. A record holds the
+board dimensions, the start and end positions, the seed, the CRC-32 of the tiles and the zlib compressed tiles, one
+byte per tile. Once a build completes, an index of the record offsets is appended together with a trailer pointing at
+it. Builds that were interrupted have no trailer and are recovered by scanning the records up to the first torn one.
+"""
+import os
+import struct
+import zlib
+from multiprocessing import Pool
+from typing import BinaryIO, Callable, Dict, Iterable, List, Optional, Tuple
+
+from src.maze_game.maze_board import Grid
+from src.maze_game.maze_generators import MAZE_GENERATORS
+
+CORPUS_MAGIC = b"MZCP"
+CORPUS_VERSION = 2
+# magic, version, length of the generator name that follows
+CORPUS_HEADER = struct.Struct("<4sHH")
+# rows, cols, start row, start col, end row, end col, seed, payload length, CRC-32 of the payload
+RECORD_HEADER = struct.Struct("<IIIIIIQII")
+# rows, cols, seed, record offset
+INDEX_ENTRY = struct.Struct("<IIQQ")
+# index offset, number of index entries, magic
+CORPUS_TRAILER = struct.Struct("<QQ4s")
+INDEX_MAGIC = b"MZIX"
+
+MazeKey = Tuple[int, int, int]
+MazeRecord = Tuple[int, int, int, Tuple[int, int], Tuple[int, int], bytes]
+
+
+def generate_record(job: Tuple[str, int, int, int]) -> MazeRecord:
+    """Generates one maze of the corpus.
+
+    Args:
+        job: generator name, number of rows, number of columns and seed of the maze.
+    Returns:
+        rows, cols, seed, start position, end position and compressed tiles of the maze.
+    """
+
+    generator, n_row, n_col, seed = job
+    start, end, board = MAZE_GENERATORS[generator](n_row, n_col, seed=seed)
+    tiles = b"".join(bytes(board[row]) for row in range(n_row))
+    return n_row, n_col, seed, start, end, zlib.compress(tiles)
+
+
+def read_header(corpus_file: BinaryIO) -> str:
+    """Reads the corpus header and returns the generator name.
+
+    Raises:
+        ValueError: if the file is not a maze corpus.
+    """
+
+    header = corpus_file.read(CORPUS_HEADER.size)
+    if len(header) < CORPUS_HEADER.size:
+        raise ValueError("not a maze corpus file")
+    magic, version, name_length = CORPUS_HEADER.unpack(header)
+    if magic != CORPUS_MAGIC or version != CORPUS_VERSION:
+        raise ValueError("not a maze corpus file")
+    return corpus_file.read(name_length).decode()
+
+
+def read_trailer_index(corpus_file: BinaryIO) -> Optional[Tuple[int, Dict[MazeKey, int]]]:
+    """Reads the index of a completed corpus.
+
+    Returns:
+        offset of the index and the record offset of every maze, or None without a trailer.
+    """
+
+    size = corpus_file.seek(0, os.SEEK_END)
+    if size < CORPUS_TRAILER.size:
+        return None
+    corpus_file.seek(size - CORPUS_TRAILER.size)
+    index_offset, entry_count, magic = CORPUS_TRAILER.unpack(corpus_file.read(CORPUS_TRAILER.size))
+    if magic != INDEX_MAGIC or index_offset + entry_count * INDEX_ENTRY.size + CORPUS_TRAILER.size != size:
+        return None
+    corpus_file.seek(index_offset)
+    index = {}
+    for rows, cols, seed, offset in INDEX_ENTRY.iter_unpack(corpus_file.read(entry_count * INDEX_ENTRY.size)):
+        index[(rows, cols, seed)] = offset
+    return index_offset, index
+
+
+def scan_records(corpus_file: BinaryIO, data_offset: int) -> Tuple[int, Dict[MazeKey, int]]:
+    """Scans the records of a corpus without a trailer.
+
+    The scan stops at the first record running past the end of the file or whose payload does not match its CRC,
+    that record and everything after it were torn by the interrupted write.
+
+    Returns:
+        offset after the last valid record and the record offset of every maze.
+    """
+
+    size = corpus_file.seek(0, os.SEEK_END)
+    offset, index = data_offset, {}
+    while offset + RECORD_HEADER.size <= size:
+        corpus_file.seek(offset)
+        rows, cols, _, _, _, _, seed, payload_length, crc = RECORD_HEADER.unpack(corpus_file.read(RECORD_HEADER.size))
+        end = offset + RECORD_HEADER.size + payload_length
+        if end > size or zlib.crc32(corpus_file.read(payload_length)) != crc:
+            break
+        index[(rows, cols, seed)] = offset
+        offset = end
+    return offset, index
+
+
+def open_corpus(path: str, generator: str) -> Tuple[BinaryIO, Dict[MazeKey, int]]:
+    """Opens a corpus for appending, recovering the mazes already built.
+
+    Args:
+        path: path of the corpus file, created if missing.
+        generator: name of the generator the corpus is built with.
+    Returns:
+        the corpus file positioned after the last complete record, and the record offset of every maze.
+    Raises:
+        ValueError: if the corpus was built with another generator.
+    """
+
+    if not os.path.exists(path) or os.path.getsize(path) == 0:
+        corpus_file = open(path, "wb+")    # pylint: disable=consider-using-with
+        name = generator.encode()
+        corpus_file.write(CORPUS_HEADER.pack(CORPUS_MAGIC, CORPUS_VERSION, len(name)) + name)
+        return corpus_file, {}
+
+    corpus_file = open(path, "rb+")    # pylint: disable=consider-using-with
+    try:
+        built_with = read_header(corpus_file)
+        if built_with != generator:
+            raise ValueError(f"{path} was built with {built_with}, not {generator}")
+        data_offset = corpus_file.tell()
+        trailer_index = read_trailer_index(corpus_file)
+        end, index = trailer_index if trailer_index is not None else scan_records(corpus_file, data_offset)
+    except ValueError:
+        corpus_file.close()
+        raise
+    corpus_file.truncate(end)
+    corpus_file.seek(end)
+    return corpus_file, index
+
+
+def build_corpus(path: str,
+                 sizes: Iterable[Tuple[int, int]],
+                 count: int,
+                 generator: str = "kruskal",
+                 base_seed: int = 0,
+                 workers: Optional[int] = None,
+                 progress: Optional[Callable[[int, int], None]] = None) -> int:
+    """Builds or resumes a maze corpus across a process pool.
+
+    Maze number i of every size uses the seed base_seed + i, so a corpus is reproducible and an interrupted build
+    only generates the missing mazes when run again.
+
+    Args:
+        path: path of the corpus file.
+        sizes: rows and columns of the mazes.
+        count: number of mazes per size.
+        generator: name of a registered maze generator.
+        base_seed: seed of the first maze of every size.
+        workers: number of worker processes, all cores by default.
+        progress: called with the number of mazes written and the number of mazes to write.
+    Returns:
+        number of mazes generated by this run.
+    Raises:
+        KeyError: if the generator is not registered.
+        ValueError: if base_seed is negative, the records only hold unsigned seeds.
+    """
+
+    if generator not in MAZE_GENERATORS:
+        raise KeyError(f"unknown maze generator {generator}, expected one of {', '.join(MAZE_GENERATORS)}")
+    if base_seed < 0:
+        raise ValueError(f"seeds of a corpus can't be negative, got {base_seed}")
+
+    corpus_file, index = open_corpus(path, generator)
+    with corpus_file:
+        jobs = [(generator, n_row, n_col, base_seed + i) for n_row, n_col in sizes for i in range(count)
+                if (n_row, n_col, base_seed + i) not in index]
+        if jobs:
+            with Pool(workers) as pool:
+                chunk_size = max(1, min(64, len(jobs) // (4 * (workers or os.cpu_count() or 1))))
+                for written, record in enumerate(pool.imap_unordered(generate_record, jobs, chunk_size), 1):
+                    n_row, n_col, seed, start, end, payload = record
+                    index[(n_row, n_col, seed)] = corpus_file.tell()
+                    header = RECORD_HEADER.pack(n_row, n_col, *start, *end, seed, len(payload), zlib.crc32(payload))
+                    corpus_file.write(header + payload)
+                    if progress is not None:
+                        progress(written, len(jobs))
+
+        index_offset = corpus_file.tell()
+        entries: List[bytes] = [INDEX_ENTRY.pack(*key, offset) for key, offset in sorted(index.items())]
+        corpus_file.write(b"".join(entries) + CORPUS_TRAILER.pack(index_offset, len(entries), INDEX_MAGIC))
+    return len(jobs)
+
+
+def load_corpus_maze(path: str, n_row: int, n_col: int, seed: int) -> Tuple[Tuple[int, int], Tuple[int, int], Grid]:
+    """Loads one maze of a completed corpus.
+
+    Args:
+        path: path of the corpus file.
+        n_row: number of rows of the maze.
+        n_col: number of columns of the maze.
+        seed: seed of the maze.
+    Returns:
+        start position coordinates
+        end position coordinates
+        maze board as a 2D List
+    Raises:
+        KeyError: if the corpus holds no such maze.
+        ValueError: if the corpus build did not complete.
+    """
+
+    with open(path, "rb") as corpus_file:
+        read_header(corpus_file)
+        trailer_index = read_trailer_index(corpus_file)
+        if trailer_index is None:
+            raise ValueError(f"{path} is not a completed maze corpus")
+        corpus_file.seek(trailer_index[1][(n_row, n_col, seed)])
+        _, _, start_row, start_col, end_row, end_col, _, payload_length, _ = RECORD_HEADER.unpack(
+            corpus_file.read(RECORD_HEADER.size))
+        tiles = zlib.decompress(corpus_file.read(payload_length))
+    board = [list(tiles[i * n_col:(i + 1) * n_col]) for i in range(n_row)]
+    return (start_row, start_col), (end_row, end_col), board
@@ -0,0 +1,208 @@
+"""Bit packed maze file format.
+
+A maze file holds a fixed size header followed by the walls of the maze, one bit per tile. Every row is padded to
+whole bytes so that a row can be decoded on its own, the most significant bit of a byte being the leftmost tile.
+A 10000x10000 maze takes 12.5 MB.
+"""
+import mmap
+import struct
+from typing import Dict, List, Optional, Tuple, Union
+
+from src.maze_game.maze_board import Grid, MazeBoard
+from src.maze_game.maze_game_object import MazeGameObject
+from src.maze_game.maze_generation import is_ndarray, np
+from src.maze_game.maze_mmap import BOARD_FILE_MAGIC, MappedBoard
+
+MAZE_FILE_MAGIC = b"MZBP"
+MAZE_FILE_VERSION = 1
+# magic, version, flags, rows, cols, start row, start col, end row, end col, seed, generator name
+MAZE_FILE_HEADER = struct.Struct("<4sHHIIIIIIQ16s")
+HAS_SEED_FLAG = 1
+
+# Tile values to the text digits of their wall bit, and back.
+WALL_DIGITS = bytes(ord("1") if value == MazeGameObject.WALL.value else ord("0") for value in range(256))
+DIGIT_TILES = bytes(MazeGameObject.WALL.value if value == ord("1") else MazeGameObject.PATH.value
+                    for value in range(256))
+
+
+def get_row_bytes(n_col: int) -> int:
+    """Returns the number of bytes of a packed row."""
+
+    return (n_col + 7) // 8
+
+
+def pack_row(tiles: bytes) -> bytes:
+    """Packs a row of tiles into its wall bits.
+
+    Args:
+        tiles: the tiles of the row, one byte per tile.
+    """
+
+    padding = -len(tiles) % 8
+    digits = tiles.translate(WALL_DIGITS) + b"0" * padding
+    return int(digits, 2).to_bytes((len(tiles) + padding) // 8, "big")
+
+
+def unpack_row(packed: bytes, n_col: int) -> List[int]:
+    """Unpacks the wall bits of a row into path and wall tiles.
+
+    Args:
+        packed: the packed row.
+        n_col: number of tiles in the row.
+    """
+
+    digits = format(int.from_bytes(packed, "big"), f"0{len(packed) * 8}b").encode()
+    return list(digits[:n_col].translate(DIGIT_TILES))
+
+
+class PackedBoard:
+    """Maze board backed by a memory mapped maze file.
+
+    Rows are decoded on first access and kept, so tiles changed by the player moves stay changed.
+    """
+
+    def __init__(self, mapping: mmap.mmap, n_row: int, n_col: int, start: Tuple[int, int], end: Tuple[int, int]):
+        """Constructor for the packed board.
+
+        Args:
+            mapping: memory mapping of the maze file.
+            n_row: number of rows in the maze board.
+            n_col: number of columns the maze board.
+            start: start position coordinates.
+            end: end position coordinates.
+        """
+
+        self.mapping = mapping
+        self.n_row, self.n_col = n_row, n_col
+        self.start, self.end = start, end
+        self.row_bytes = get_row_bytes(n_col)
+        self.rows: Dict[int, List[int]] = {}
+
+    def __len__(self) -> int:
+        return self.n_row
+
+    def __getitem__(self, row: int) -> List[int]:
+        if row < 0:
+            row += self.n_row
+        if row in self.rows:
+            return self.rows[row]
+        if not 0 <= row < self.n_row:
+            raise IndexError("board row out of range")
+
+        offset = MAZE_FILE_HEADER.size + row * self.row_bytes
+        tiles = unpack_row(self.mapping[offset:offset + self.row_bytes], self.n_col)
+        for position, tile in ((self.start, MazeGameObject.PLAYER_TILE), (self.end, MazeGameObject.GOAL)):
+            if position[0] == row:
+                tiles[position[1]] = tile.value
+        self.rows[row] = tiles
+        return tiles
+
+    def close(self) -> None:
+        """Releases the mapping of the maze file."""
+
+        self.mapping.close()
+
+
+def save_maze(path: str, board: MazeBoard, seed: Optional[int] = None, generator: str = "") -> None:
+    """Saves the walls of a maze to a maze file.
+
+    Args:
+        path: path of the maze file to write.
+        board: the maze board, only its walls, start and end are saved.
+        seed: seed the maze was generated with.
+        generator: name of the generator the maze was generated with.
+    Raises:
+        ValueError: if the seed does not fit the unsigned 64 bits seed of the header.
+    """
+
+    if seed is not None and not 0 <= seed < 1 << 64:
+        raise ValueError(f"seed {seed} does not fit a maze file, seeds are unsigned 64 bits integers")
+    grid = board.board
+    n_row, n_col = len(grid), len(grid[0])
+    flags, name = HAS_SEED_FLAG if seed is not None else 0, generator.encode()[:16]
+    header = MAZE_FILE_HEADER.pack(MAZE_FILE_MAGIC, MAZE_FILE_VERSION, flags, n_row, n_col, *board.start, *board.end,
+                                   seed or 0, name)
+    with open(path, "wb") as maze_file:
+        maze_file.write(header)
+        if is_ndarray(grid):
+            maze_file.write(np.packbits(grid == MazeGameObject.WALL.value, axis=1).tobytes())
+            return
+        for row in range(n_row):
+            maze_file.write(pack_row(bytes(grid[row])))
+
+
+def read_header(mapping: mmap.mmap) -> Tuple[int, int, Tuple[int, int], Tuple[int, int], Optional[int], str]:
+    """Reads the header of a maze file.
+
+    Returns:
+        rows, cols, start position, end position, seed and generator name of the maze.
+    Raises:
+        ValueError: if the file is not a maze file.
+    """
+
+    if len(mapping) < MAZE_FILE_HEADER.size:
+        raise ValueError("not a maze file")
+    magic, version, flags, n_row, n_col, start_row, start_col, end_row, end_col, seed, generator = \
+        MAZE_FILE_HEADER.unpack_from(mapping)
+    if magic != MAZE_FILE_MAGIC or version != MAZE_FILE_VERSION \
+            or len(mapping) < MAZE_FILE_HEADER.size + n_row * get_row_bytes(n_col):
+        raise ValueError("not a maze file")
+    return (n_row, n_col, (start_row, start_col), (end_row, end_col), seed if flags & HAS_SEED_FLAG else None,
+            generator.rstrip(b"\0").decode())
+
+
+def load_maze(path: str, use_numpy: bool = False) -> Tuple[MazeBoard, Optional[int], str]:
+    """Loads a maze file through a memory mapping.
+
+    Rows are decoded lazily as they are read. With use_numpy the whole board is decoded at once into an int8 ndarray.
+
+    Args:
+        path: path of the maze file.
+        use_numpy: decode the board into an int8 ndarray.
+    Returns:
+        the maze board, the seed and the generator name of the maze.
+    """
+
+    with open(path, "rb") as maze_file:
+        mapping = mmap.mmap(maze_file.fileno(), 0, access=mmap.ACCESS_READ)
+    try:
+        n_row, n_col, start, end, seed, generator = read_header(mapping)
+    except ValueError:
+        mapping.close()
+        raise
+
+    grid: Grid
+    if use_numpy:
+        if np is None:
+            mapping.close()
+            raise ImportError("numpy is required for ndarray maze boards")
+        packed = np.frombuffer(mapping, np.uint8, n_row * get_row_bytes(n_col), MAZE_FILE_HEADER.size)
+        grid = np.unpackbits(packed.reshape(n_row, -1), axis=1, count=n_col).astype(np.int8)
+        del packed
+        mapping.close()
+        grid[start] = MazeGameObject.PLAYER_TILE.value
+        grid[end] = MazeGameObject.GOAL.value
+    else:
+        grid = PackedBoard(mapping, n_row, n_col, start, end)
+    return MazeBoard(grid, start, end, start), seed, generator
+
+
+def open_board_file(path: str) -> Tuple[Tuple[int, int], Tuple[int, int], Union[MappedBoard, PackedBoard]]:
+    """Opens a board file or a maze file without reading its tiles.
+
+    Args:
+        path: path of the file.
+    Returns:
+        start position coordinates
+        end position coordinates
+        lazily loaded maze board
+    """
+
+    with open(path, "rb") as board_file:
+        magic = board_file.read(len(BOARD_FILE_MAGIC))
+    if magic == BOARD_FILE_MAGIC:
+        mapped_board = MappedBoard(path)
+        return mapped_board.start, mapped_board.end, mapped_board
+    board, _, _ = load_maze(path)
+    packed_board: PackedBoard = board.board    # type: ignore
+    return board.start, board.end, packed_board
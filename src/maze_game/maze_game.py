@@ -1,18 +1,21 @@
 """Maze Game definition"""
-from typing import List, Dict, Tuple
+from typing import Dict, Tuple, Type
 
 from src.config import Config
 from src.event import Direction
 
 from src.maze_game.layers.maze_layer import MazeLayer
 from src.maze_game.layers.options_layer import OptionsLayer
+from src.maze_game.level_prefetcher import LevelPrefetcher
+from src.maze_game.maze_cache import get_maze_cache
+from src.maze_game.maze_board import Grid
 from src.maze_game.maze_state import MazeGameState
 
 
 class MazeGame:
     """Maze Game class."""
 
-    def __init__(self, size: Tuple[int, int], config: Config):
+    def __init__(self, size: Tuple[int, int], config: Type[Config]):
         """Constructor for the maze game.
 
         Args:
@@ -23,8 +26,13 @@ class MazeGame:
         self.curr_level: int = 1
         self.state = MazeGameState(0)
         self.level_stats: Dict[int, int] = {1: 0}
+        self.show_hint = False
         self.size = size
-        self.curr_maze: MazeLayer = MazeLayer(self.size[1], self.size[0], self.curr_level)
+        self.prefetcher = LevelPrefetcher(self.size, config.PREFETCH_LEVELS, config.PREFETCH_PROCESSES,
+                                          config.NUMPY_BOARD, config.MAZE_GENERATOR, config.MAZE_SEED,
+                                          get_maze_cache(config.MAZE_CACHE_SIZE, config.MAZE_CACHE_DIR))
+        self.curr_maze: MazeLayer = self.prefetcher.create_level(self.curr_level)
+        self.prefetcher.prefetch(self.curr_level)
 
         menu_options = {
             "Play": "PLAY",
@@ -37,7 +45,7 @@ class MazeGame:
         self.main_menu_layer = OptionsLayer(menu_options, "Play")
         self.pause_menu_layer = OptionsLayer({"Resume": "RESUME", "Quit": "QUIT"}, "Resume")
 
-    def get_board(self) -> List[List[int]]:
+    def get_board(self) -> Grid:
         """Returns the board of the current level."""
 
         return self.curr_maze.get_board()
@@ -51,6 +59,11 @@ class MazeGame:
 
         self.state = state
 
+    def toggle_hint(self):
+        """Shows or hides the solution path of the current level."""
+
+        self.show_hint = not self.show_hint
+
     def get_maze(self) -> MazeLayer:
         """Returns the current maze."""
 
@@ -61,7 +74,15 @@ class MazeGame:
 
         self.update_stats()
         self.curr_level += 1
-        self.curr_maze = MazeLayer(self.size[1], self.size[0], self.curr_level)
+        self.curr_maze.close()
+        self.curr_maze = self.prefetcher.get_level(self.curr_level)
+        self.prefetcher.prefetch(self.curr_level)
+
+    def close(self):
+        """Stops generating the upcoming levels and releases the current one."""
+
+        self.prefetcher.close()
+        self.curr_maze.close()
 
     def update_stats(self):
         """Updates the stats of the game."""
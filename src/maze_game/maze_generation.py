@@ -1,10 +1,101 @@
 """Maze generation function definition."""
 
-from typing import List, Tuple
-from random import random, choices
+from typing import Dict, Final, List, Optional, Tuple, TypeGuard
+from random import Random
 
+from src.maze_game.maze_board import Grid, MazeMatrix
 from src.maze_game.maze_game_object import MazeGameObject
 
+try:
+    import numpy as np
+except ImportError:    # pragma: no cover
+    np = None    # type: ignore
+
+# Generator of the generations without a seed or generator.
+SHARED_RNG: Final[Random] = Random()
+
+
+def seed_shared_rng(seed: Optional[int] = None) -> None:
+    """Seeds the shared random generator, from the system entropy if no seed is given.
+
+    Args:
+        seed: seed of the shared generator.
+    """
+
+    SHARED_RNG.seed(seed)
+
+
+def get_rng(seed: Optional[int] = None, rng: Optional[Random] = None) -> Random:
+    """Returns the random generator of a maze generation.
+
+    Args:
+        seed: seed of a new random generator, used when no generator is given.
+        rng: random generator to use.
+    Returns:
+        the given generator, a new seeded one, or the shared one.
+    """
+
+    if rng is not None:
+        return rng
+    if seed is not None:
+        return Random(seed)
+    return SHARED_RNG
+
+
+class WallFrontier:
+    """Frontier of candidate walls for the prim's algorithm.
+
+    Walls are kept in a list with a position map so that add, remove and random pick are all O(1).
+    Removal swaps the last wall into the freed slot instead of shifting the list.
+    """
+
+    def __init__(self, rng: Optional[Random] = None) -> None:
+        """Constructor for the wall frontier.
+
+        Args:
+            rng: random generator for the picks, the shared one by default.
+        """
+
+        self.rng = get_rng(rng=rng)
+        self.walls: List[Tuple[int, int]] = []
+        self.positions: Dict[Tuple[int, int], int] = {}
+
+    def __len__(self) -> int:
+        return len(self.walls)
+
+    def __contains__(self, wall: Tuple[int, int]) -> bool:
+        return wall in self.positions
+
+    def add(self, wall: Tuple[int, int]) -> None:
+        """Adds a wall to the frontier, ignoring walls already present.
+
+        Args:
+            wall: coordinates of the wall.
+        """
+
+        if wall in self.positions:
+            return
+        self.positions[wall] = len(self.walls)
+        self.walls.append(wall)
+
+    def remove(self, wall: Tuple[int, int]) -> None:
+        """Removes a wall from the frontier.
+
+        Args:
+            wall: coordinates of the wall, must be in the frontier.
+        """
+
+        index = self.positions.pop(wall)
+        last_wall = self.walls.pop()
+        if index < len(self.walls):
+            self.walls[index] = last_wall
+            self.positions[last_wall] = index
+
+    def pick(self) -> Tuple[int, int]:
+        """Returns a random wall of the frontier without removing it."""
+
+        return self.rng.choices(self.walls, k=1)[0]
+
 
 def init_maze(height: int, width: int) -> List[List[int]]:
     """Initialize the maze matrix for any given dimension.
@@ -23,29 +114,58 @@ def init_maze(height: int, width: int) -> List[List[int]]:
     return maze
 
 
-def fill_walls(maze: List[List[int]]) -> None:
+def to_ndarray(maze: List[List[int]]) -> "np.ndarray":
+    """Converts a maze matrix into a compact ndarray board.
+
+    The board uses one signed byte per tile so that the EMPTY tiles of a maze under construction fit as well.
+
+    Args:
+        maze: the input maze matrix.
+    Returns:
+        the maze as a 2D int8 ndarray.
+    Raises:
+        ImportError: if numpy is not installed.
+    """
+
+    if np is None:
+        raise ImportError("numpy is required for ndarray maze boards")
+    return np.array(maze, dtype=np.int8)
+
+
+def is_ndarray(maze: Grid) -> TypeGuard["np.ndarray"]:
+    """Returns if the maze board is stored as an ndarray."""
+
+    return np is not None and isinstance(maze, np.ndarray)
+
+
+def fill_walls(maze: MazeMatrix) -> None:
     """Fills the remaining tiles.
 
     Args:
         maze: the input maze array.
     """
 
+    if is_ndarray(maze):
+        maze[maze == MazeGameObject.EMPTY.value] = MazeGameObject.WALL.value
+        return
+
     for i, _ in enumerate(maze):
         for j in range(len(maze[0])):
             if maze[i][j] == MazeGameObject.EMPTY.value:
                 maze[i][j] = MazeGameObject.WALL.value
 
 
-def get_start_pos(maze: List[List[int]]) -> Tuple[int, int]:
+def get_start_pos(maze: List[List[int]], rng: Random) -> Tuple[int, int]:
     """Returns an appropriate start position
     Args:
         maze: 2d array representing the maze board
+        rng: random generator.
     Returns:
         coordinates of the start position as tuple pair
     """
 
     row, col = len(maze), len(maze[0])
-    start_row, start_col = int(random() * (row - 2)) + 1, int(random() * (col - 2)) + 1
+    start_row, start_col = int(rng.random() * (row - 2)) + 1, int(rng.random() * (col - 2)) + 1
     return start_row, start_col
 
 
@@ -70,7 +190,7 @@ def get_surrounding_cell_count(cell: Tuple[int, int], maze: List[List[int]]):
     return s_cell_count
 
 
-def create_entry_exit(maze: List[List[int]]) -> Tuple[Tuple[int, int], Tuple[int, int], List[List[int]]]:
+def create_entry_exit(maze: MazeMatrix) -> Tuple[Tuple[int, int], Tuple[int, int], MazeMatrix]:
     """create the entry and exit to the maze
 
     Args:
@@ -82,6 +202,17 @@ def create_entry_exit(maze: List[List[int]]) -> Tuple[Tuple[int, int], Tuple[int
     """
     row, col = len(maze), len(maze[0])
     start_point, exit_point = (0, 0), (row - 1, col - 1)
+    if is_ndarray(maze):
+        entries = np.flatnonzero(maze[1] == MazeGameObject.PATH.value)
+        if entries.size:
+            start_point = (0, int(entries[0]))
+            maze[start_point] = MazeGameObject.PLAYER_TILE.value
+        exits = np.flatnonzero(maze[row - 2, 1:] == MazeGameObject.PATH.value)
+        if exits.size:
+            exit_point = (row - 1, int(exits[-1]) + 1)
+            maze[exit_point] = MazeGameObject.GOAL.value
+        return start_point, exit_point, maze
+
     # Set entrance and exit
     for i in range(col):
         if maze[1][i] == MazeGameObject.PATH.value:
@@ -97,7 +228,11 @@ def create_entry_exit(maze: List[List[int]]) -> Tuple[Tuple[int, int], Tuple[int
     return start_point, exit_point, maze
 
 
-def generate_prim_maze(n_row: int, n_col: int) -> Tuple[Tuple[int, int], Tuple[int, int], List[List[int]]]:
+def generate_prim_maze(n_row: int,
+                       n_col: int,
+                       use_numpy: bool = False,
+                       seed: Optional[int] = None,
+                       rng: Optional[Random] = None) -> Tuple[Tuple[int, int], Tuple[int, int], Grid]:
     """Generates a solvable maze using the prim's algorithm
 
     Links:
@@ -105,14 +240,18 @@ def generate_prim_maze(n_row: int, n_col: int) -> Tuple[Tuple[int, int], Tuple[i
     Args:
         n_row: number of rows in the maze board.
         n_col: number of columns the maze board.
+        use_numpy: return the board as an int8 ndarray instead of a 2D List.
+        seed: seed of the maze, the same seed always generates the same maze.
+        rng: random generator to use instead of a seeded one.
     Returns:
         start position coordinates
         end position coordinates
-        maze board as a 2D List
+        maze board as a 2D List, or a 2D ndarray if use_numpy is set
     """
-    wall_list = set()
+    rng = get_rng(seed, rng)
+    wall_list = WallFrontier(rng)
     maze = init_maze(n_row, n_col)
-    start_pos = get_start_pos(maze)
+    start_pos = get_start_pos(maze, rng)
     maze[start_pos[0]][start_pos[1]] = MazeGameObject.PATH.value
 
     for val in [(0, 1), (1, 0), (0, -1), (-1, 0)]:
@@ -120,7 +259,7 @@ def generate_prim_maze(n_row: int, n_col: int) -> Tuple[Tuple[int, int], Tuple[i
         maze[start_pos[0] + val[0]][start_pos[1] + val[1]] = MazeGameObject.WALL.value
 
     while wall_list:
-        rand_wall = choices(list(wall_list), k=1)[0]
+        rand_wall = wall_list.pick()
         s_cell_count = get_surrounding_cell_count(rand_wall, maze)
 
         if s_cell_count < 2:
@@ -175,6 +314,7 @@ def generate_prim_maze(n_row: int, n_col: int) -> Tuple[Tuple[int, int], Tuple[i
                     wall_list.add((rand_wall[0] - 1, rand_wall[1]))
                     wall_list.add((rand_wall[0] + 1, rand_wall[1]))
         wall_list.remove(rand_wall)
-    fill_walls(maze)
-    entry_point, exit_point, maze = create_entry_exit(maze)
-    return entry_point, exit_point, maze
+    board: MazeMatrix = to_ndarray(maze) if use_numpy else maze
+    fill_walls(board)
+    entry_point, exit_point, board = create_entry_exit(board)
+    return entry_point, exit_point, board
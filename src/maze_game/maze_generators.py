@@ -0,0 +1,348 @@
+"""Maze generator registry and the cell based generation algorithms.
+
+Every generator follows the generate_prim_maze contract: it takes the board dimensions, an optional seed or random
+generator, and returns the start position, the end position and the board.
+"""
+
+import sys
+import time
+from typing import Callable, Dict, List, Optional, Tuple
+from random import Random
+
+from src.maze_game.maze_board import Grid, MazeMatrix
+from src.maze_game.maze_game_object import MazeGameObject
+from src.maze_game.maze_generation import create_entry_exit, generate_prim_maze, get_rng, to_ndarray
+
+MazeGenerator = Callable[..., Tuple[Tuple[int, int], Tuple[int, int], Grid]]
+
+AUTO_GENERATOR = "auto"
+
+
+def init_cell_maze(n_row: int, n_col: int) -> List[List[int]]:
+    """Initialize a maze matrix of walls with a path tile on every cell.
+
+    Cells sit on odd rows and odd columns, the tiles between two cells are the walls that can be opened.
+
+    Args:
+        n_row: number of rows in the resulting matrix.
+        n_col: number of cols in the resulting matrix.
+    Returns:
+        the maze matrix.
+    """
+
+    if n_row < 3 or n_col < 3:
+        raise ValueError(f"maze of {n_row}x{n_col} tiles is too small to hold a cell")
+
+    maze = [[MazeGameObject.WALL.value] * n_col for _ in range(n_row)]
+    for i in range(1, n_row - 1, 2):
+        row = maze[i]
+        for j in range(1, n_col - 1, 2):
+            row[j] = MazeGameObject.PATH.value
+    return maze
+
+
+def get_cell_dimensions(n_row: int, n_col: int) -> Tuple[int, int]:
+    """Returns the number of cell rows and cell columns of a maze matrix."""
+
+    return (n_row - 1) // 2, (n_col - 1) // 2
+
+
+def open_wall(maze: List[List[int]], cell_a: int, cell_b: int, cell_cols: int) -> None:
+    """Opens the wall between two neighbouring cells.
+
+    Args:
+        maze: the maze matrix.
+        cell_a: index of the first cell.
+        cell_b: index of the second cell.
+        cell_cols: number of cell columns in the maze.
+    """
+
+    row_a, col_a = divmod(cell_a, cell_cols)
+    row_b, col_b = divmod(cell_b, cell_cols)
+    maze[row_a + row_b + 1][col_a + col_b + 1] = MazeGameObject.PATH.value
+
+
+def get_cell_neighbours(cell: int, cell_rows: int, cell_cols: int) -> List[int]:
+    """Returns the indices of the cells around a cell.
+
+    Args:
+        cell: index of the cell.
+        cell_rows: number of cell rows in the maze.
+        cell_cols: number of cell columns in the maze.
+    """
+
+    row, col = divmod(cell, cell_cols)
+    neighbours = []
+    if row > 0:
+        neighbours.append(cell - cell_cols)
+    if row < cell_rows - 1:
+        neighbours.append(cell + cell_cols)
+    if col > 0:
+        neighbours.append(cell - 1)
+    if col < cell_cols - 1:
+        neighbours.append(cell + 1)
+    return neighbours
+
+
+def finish_cell_maze(maze: List[List[int]], use_numpy: bool,
+                     rng: Random) -> Tuple[Tuple[int, int], Tuple[int, int], Grid]:
+    """Creates the entry and exit of a carved cell maze.
+
+    With an even number of rows the row above the bottom border holds no cells, so a single tile below a random
+    bottom cell is opened to reach it.
+
+    Args:
+        maze: the carved maze matrix.
+        use_numpy: return the board as an int8 ndarray instead of a 2D List.
+        rng: random generator.
+    Returns:
+        start position coordinates
+        end position coordinates
+        maze board
+    """
+
+    n_row, n_col = len(maze), len(maze[0])
+    if n_row % 2 == 0:
+        maze[n_row - 2][2 * int(rng.random() * get_cell_dimensions(n_row, n_col)[1]) + 1] = MazeGameObject.PATH.value
+    board: MazeMatrix = to_ndarray(maze) if use_numpy else maze
+    return create_entry_exit(board)
+
+
+def generate_kruskal_maze(n_row: int,
+                          n_col: int,
+                          use_numpy: bool = False,
+                          seed: Optional[int] = None,
+                          rng: Optional[Random] = None) -> Tuple[Tuple[int, int], Tuple[int, int], Grid]:
+    """Generates a solvable maze using the randomized kruskal's algorithm
+
+    Links:
+        https://en.wikipedia.org/wiki/Maze_generation_algorithm#Randomized_Kruskal's_algorithm
+    Args:
+        n_row: number of rows in the maze board.
+        n_col: number of columns the maze board.
+        use_numpy: return the board as an int8 ndarray instead of a 2D List.
+        seed: seed of the maze, the same seed always generates the same maze.
+        rng: random generator to use instead of a seeded one.
+    Returns:
+        start position coordinates
+        end position coordinates
+        maze board as a 2D List, or a 2D ndarray if use_numpy is set
+    """
+
+    rng = get_rng(seed, rng)
+    maze = init_cell_maze(n_row, n_col)
+    cell_rows, cell_cols = get_cell_dimensions(n_row, n_col)
+
+    edges = [(cell, cell + 1) for cell in range(cell_rows * cell_cols) if cell % cell_cols != cell_cols - 1]
+    edges.extend((cell, cell + cell_cols) for cell in range((cell_rows - 1) * cell_cols))
+    rng.shuffle(edges)
+
+    parent = list(range(cell_rows * cell_cols))
+    size = [1] * (cell_rows * cell_cols)
+    for cell_a, cell_b in edges:
+        root_a = cell_a
+        while parent[root_a] != root_a:
+            parent[root_a] = parent[parent[root_a]]
+            root_a = parent[root_a]
+        root_b = cell_b
+        while parent[root_b] != root_b:
+            parent[root_b] = parent[parent[root_b]]
+            root_b = parent[root_b]
+        if root_a == root_b:
+            continue
+        if size[root_a] < size[root_b]:
+            root_a, root_b = root_b, root_a
+        parent[root_b] = root_a
+        size[root_a] += size[root_b]
+        open_wall(maze, cell_a, cell_b, cell_cols)
+
+    return finish_cell_maze(maze, use_numpy, rng)
+
+
+def generate_backtracker_maze(n_row: int,
+                              n_col: int,
+                              use_numpy: bool = False,
+                              seed: Optional[int] = None,
+                              rng: Optional[Random] = None) -> Tuple[Tuple[int, int], Tuple[int, int], Grid]:
+    """Generates a solvable maze using an iterative randomized depth first search
+
+    Links:
+        https://en.wikipedia.org/wiki/Maze_generation_algorithm#Iterative_implementation
+    Args:
+        n_row: number of rows in the maze board.
+        n_col: number of columns the maze board.
+        use_numpy: return the board as an int8 ndarray instead of a 2D List.
+        seed: seed of the maze, the same seed always generates the same maze.
+        rng: random generator to use instead of a seeded one.
+    Returns:
+        start position coordinates
+        end position coordinates
+        maze board as a 2D List, or a 2D ndarray if use_numpy is set
+    """
+
+    rng = get_rng(seed, rng)
+    maze = init_cell_maze(n_row, n_col)
+    cell_rows, cell_cols = get_cell_dimensions(n_row, n_col)
+
+    visited = bytearray(cell_rows * cell_cols)
+    start_cell = rng.randrange(cell_rows * cell_cols)
+    visited[start_cell] = 1
+    stack = [start_cell]
+    while stack:
+        cell = stack[-1]
+        unvisited = [
+            neighbour for neighbour in get_cell_neighbours(cell, cell_rows, cell_cols) if not visited[neighbour]
+        ]
+        if not unvisited:
+            stack.pop()
+            continue
+        next_cell = unvisited[int(rng.random() * len(unvisited))]
+        visited[next_cell] = 1
+        open_wall(maze, cell, next_cell, cell_cols)
+        stack.append(next_cell)
+
+    return finish_cell_maze(maze, use_numpy, rng)
+
+
+def generate_wilson_maze(n_row: int,
+                         n_col: int,
+                         use_numpy: bool = False,
+                         seed: Optional[int] = None,
+                         rng: Optional[Random] = None) -> Tuple[Tuple[int, int], Tuple[int, int], Grid]:
+    """Generates a uniform spanning tree maze using wilson's algorithm
+
+    Links:
+        https://en.wikipedia.org/wiki/Maze_generation_algorithm#Wilson's_algorithm
+    Args:
+        n_row: number of rows in the maze board.
+        n_col: number of columns the maze board.
+        use_numpy: return the board as an int8 ndarray instead of a 2D List.
+        seed: seed of the maze, the same seed always generates the same maze.
+        rng: random generator to use instead of a seeded one.
+    Returns:
+        start position coordinates
+        end position coordinates
+        maze board as a 2D List, or a 2D ndarray if use_numpy is set
+    """
+
+    rng = get_rng(seed, rng)
+    maze = init_cell_maze(n_row, n_col)
+    cell_rows, cell_cols = get_cell_dimensions(n_row, n_col)
+    cell_count = cell_rows * cell_cols
+
+    in_tree = bytearray(cell_count)
+    in_tree[rng.randrange(cell_count)] = 1
+    next_step = [0] * cell_count
+    for walk_start in range(cell_count):
+        # The walk only remembers the last exit of every cell, which erases its loops.
+        cell = walk_start
+        while not in_tree[cell]:
+            neighbours = get_cell_neighbours(cell, cell_rows, cell_cols)
+            next_step[cell] = neighbours[int(rng.random() * len(neighbours))]
+            cell = next_step[cell]
+
+        cell = walk_start
+        while not in_tree[cell]:
+            in_tree[cell] = 1
+            open_wall(maze, cell, next_step[cell], cell_cols)
+            cell = next_step[cell]
+
+    return finish_cell_maze(maze, use_numpy, rng)
+
+
+MAZE_GENERATORS: Dict[str, MazeGenerator] = {
+    "prim": generate_prim_maze,
+    "kruskal": generate_kruskal_maze,
+    "backtracker": generate_backtracker_maze,
+    "wilson": generate_wilson_maze,
+}
+
+# Cheapest generator for boards up to a given number of tiles, measured with measure_throughput.
+SIZE_GENERATORS: List[Tuple[int, str]] = [
+    (100_000, "kruskal"),
+    (sys.maxsize, "backtracker"),
+]
+
+
+def register_generator(name: str, generator: MazeGenerator) -> None:
+    """Adds a maze generator to the registry.
+
+    Args:
+        name: name the generator is selected by.
+        generator: function following the generate_prim_maze contract.
+    """
+
+    if name == AUTO_GENERATOR:
+        raise ValueError(f"{AUTO_GENERATOR} is reserved for size based selection")
+    MAZE_GENERATORS[name] = generator
+
+
+def select_generator(n_row: int, n_col: int) -> str:
+    """Returns the name of the cheapest generator for a board size.
+
+    Args:
+        n_row: number of rows in the maze board.
+        n_col: number of columns the maze board.
+    """
+
+    for max_tiles, name in SIZE_GENERATORS:
+        if n_row * n_col <= max_tiles:
+            return name
+    return SIZE_GENERATORS[-1][1]
+
+
+def resolve_generator_name(name: str, n_row: int, n_col: int) -> str:
+    """Returns the registered generator name for a name or for the auto selection.
+
+    Args:
+        name: name of a registered generator or "auto".
+        n_row: number of rows in the maze board.
+        n_col: number of columns the maze board.
+    Raises:
+        KeyError: if no generator is registered under the name.
+    """
+
+    if name == AUTO_GENERATOR:
+        name = select_generator(n_row, n_col)
+    if name not in MAZE_GENERATORS:
+        raise KeyError(f"unknown maze generator {name}, expected one of {', '.join(MAZE_GENERATORS)}")
+    return name
+
+
+def get_generator(name: str, n_row: int, n_col: int) -> MazeGenerator:
+    """Returns the generator registered under a name, or the cheapest one for the board size with "auto".
+
+    Args:
+        name: name of a registered generator or "auto".
+        n_row: number of rows in the maze board.
+        n_col: number of columns the maze board.
+    """
+
+    return MAZE_GENERATORS[resolve_generator_name(name, n_row, n_col)]
+
+
+def measure_throughput(name: str, n_row: int, n_col: int, repeat: int = 3) -> float:
+    """Measures the throughput of a generator in board tiles per second.
+
+    Args:
+        name: name of a registered generator.
+        n_row: number of rows in the maze board.
+        n_col: number of columns the maze board.
+        repeat: number of generated mazes, the fastest one is reported.
+    """
+
+    generator = MAZE_GENERATORS[name]
+    best = float("inf")
+    for _ in range(repeat):
+        start_time = time.perf_counter()
+        generator(n_row, n_col)
+        best = min(best, time.perf_counter() - start_time)
+    return n_row * n_col / best
+
+
+if __name__ == "__main__":
+    SIZES = [(6, 11), (12, 23), (31, 59), (62, 118), (155, 295), (310, 590)]
+    print(f"{'tiles':>10}" + "".join(f"{name:>14}" for name in MAZE_GENERATORS) + "   (tiles/sec)")
+    for size in SIZES:
+        throughputs = [measure_throughput(name, *size) for name in MAZE_GENERATORS]
+        print(f"{size[0] * size[1]:>10}" + "".join(f"{throughput:>14.0f}" for throughput in throughputs))
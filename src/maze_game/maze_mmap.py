@@ -0,0 +1,232 @@
+"""Memory mapped maze boards and the row streaming eller's generator.
+
+A maze board file holds a fixed size header followed by the board tiles in row major order, one byte per tile,
+with the same tile values as the boards returned by MazeGame.get_board().
+"""
+
+import mmap
+import struct
+from random import Random
+from typing import Callable, Dict, List, Optional, Tuple
+
+from src.maze_game.maze_game_object import MazeGameObject
+from src.maze_game.maze_generation import get_rng
+
+BOARD_FILE_MAGIC = b"MZTB"
+BOARD_FILE_VERSION = 1
+# magic, version, reserved, rows, cols, start row, start col, end row, end col
+BOARD_FILE_HEADER = struct.Struct("<4sHHIIIIII")
+
+
+class MappedBoard:
+    """Maze board backed by a memory mapped board file.
+
+    Rows are memoryview slices of the mapping, so tiles are only paged in when they are read. The file is mapped
+    copy on write: moves change the tiles in memory but never the file on disk.
+    """
+
+    def __init__(self, path: str):
+        """Constructor for the mapped board.
+
+        Args:
+            path: path of a maze board file.
+        Raises:
+            ValueError: if the file is not a maze board file.
+        """
+
+        with open(path, "rb") as board_file:
+            self.mapping = mmap.mmap(board_file.fileno(), 0, access=mmap.ACCESS_COPY)
+
+        magic, version, _, n_row, n_col, start_row, start_col, end_row, end_col = BOARD_FILE_HEADER.unpack_from(
+            self.mapping)
+        if magic != BOARD_FILE_MAGIC or version != BOARD_FILE_VERSION:
+            self.mapping.close()
+            raise ValueError(f"{path} is not a maze board file")
+
+        self.n_row, self.n_col = n_row, n_col
+        self.start, self.end = (start_row, start_col), (end_row, end_col)
+        self.tiles = memoryview(self.mapping)[BOARD_FILE_HEADER.size:BOARD_FILE_HEADER.size + n_row * n_col]
+
+    def __len__(self) -> int:
+        return self.n_row
+
+    def __getitem__(self, row: int) -> memoryview:
+        if row < 0:
+            row += self.n_row
+        if not 0 <= row < self.n_row:
+            raise IndexError("board row out of range")
+        return self.tiles[row * self.n_col:(row + 1) * self.n_col]
+
+    def close(self) -> None:
+        """Releases the mapping of the board file."""
+
+        self.tiles.release()
+        self.mapping.close()
+
+
+def join_sets(labels: List[int], members: Dict[int, List[int]], label_a: int, label_b: int) -> None:
+    """Merges the smaller of two cell sets of a row into the larger one.
+
+    Args:
+        labels: set label of every cell in the row.
+        members: cells of the row belonging to each set label.
+        label_a: label of the first set.
+        label_b: label of the second set.
+    """
+
+    if len(members[label_a]) < len(members[label_b]):
+        label_a, label_b = label_b, label_a
+    for cell in members[label_b]:
+        labels[cell] = label_a
+    members[label_a].extend(members.pop(label_b))
+
+
+def join_row(labels: List[int], members: Dict[int, List[int]], cell_row: bytearray, last_row: bool,
+             rand: Callable[[], float]) -> None:
+    """Opens random walls between neighbouring cells of different sets in a row.
+
+    Args:
+        labels: set label of every cell in the row.
+        members: cells of the row belonging to each set label.
+        cell_row: tiles of the row, cells and horizontal passages are opened in place.
+        last_row: join every remaining set, as done on the last row of the maze.
+        rand: random number source.
+    """
+
+    cell_row[1] = MazeGameObject.PATH.value
+    for cell in range(1, len(labels)):
+        cell_row[2 * cell + 1] = MazeGameObject.PATH.value
+        if labels[cell] != labels[cell - 1] and (last_row or rand() < 0.5):
+            cell_row[2 * cell] = MazeGameObject.PATH.value
+            join_sets(labels, members, labels[cell - 1], labels[cell])
+
+
+def drop_row(members: Dict[int, List[int]], passage_row: bytearray, rand: Callable[[], float]) -> List[int]:
+    """Opens random passages down from a row, at least one for every set.
+
+    Args:
+        members: cells of the row belonging to each set label.
+        passage_row: tiles below the row, vertical passages are opened in place.
+        rand: random number source.
+    Returns:
+        set labels of the next row, -1 for cells that are not connected yet.
+    """
+
+    next_labels = [-1] * ((len(passage_row) - 1) // 2)
+    for label, cells in members.items():
+        down_cells = [cell for cell in cells if rand() < 0.5]
+        if not down_cells:
+            down_cells = [cells[int(rand() * len(cells))]]
+        for cell in down_cells:
+            passage_row[2 * cell + 1] = MazeGameObject.PATH.value
+            next_labels[cell] = label
+    return next_labels
+
+
+def generate_eller_maze_file(path: str,
+                             n_row: int,
+                             n_col: int,
+                             seed: Optional[int] = None,
+                             rng: Optional[Random] = None) -> Tuple[Tuple[int, int], Tuple[int, int]]:
+    """Generates a solvable maze into a board file using eller's algorithm
+
+    The maze is emitted one row at a time straight into the memory mapped file, so the working memory only grows
+    with the width of the maze.
+
+    Links:
+        https://en.wikipedia.org/wiki/Maze_generation_algorithm#Eller's_algorithm
+    Args:
+        path: path of the board file to write.
+        n_row: number of rows in the maze board.
+        n_col: number of columns the maze board.
+        seed: seed of the maze, the same seed always generates the same maze.
+        rng: random generator to use instead of a seeded one.
+    Returns:
+        start position coordinates
+        end position coordinates
+    """
+
+    if n_row < 3 or n_col < 3:
+        raise ValueError(f"maze of {n_row}x{n_col} tiles is too small to hold a cell")
+
+    rng = get_rng(seed, rng)
+    cell_rows, cell_cols = (n_row - 1) // 2, (n_col - 1) // 2
+    path_tile = MazeGameObject.PATH.value
+    wall_row = bytes([MazeGameObject.WALL.value]) * n_col
+
+    with open(path, "wb+") as board_file:
+        board_file.truncate(BOARD_FILE_HEADER.size + n_row * n_col)
+        with mmap.mmap(board_file.fileno(), 0) as mapping:
+
+            def write_row(row: int, tiles: bytes) -> None:
+                offset = BOARD_FILE_HEADER.size + row * n_col
+                mapping[offset:offset + n_col] = tiles
+
+            labels: List[int] = [-1] * cell_cols
+            next_label = 0
+            cell_row, passage_row = bytearray(wall_row), bytearray(wall_row)
+            for row in range(cell_rows):
+                members: Dict[int, List[int]] = {}
+                for cell in range(cell_cols):
+                    if labels[cell] < 0:
+                        labels[cell] = next_label
+                        next_label += 1
+                    members.setdefault(labels[cell], []).append(cell)
+
+                cell_row[:] = wall_row
+                join_row(labels, members, cell_row, row == cell_rows - 1, rng.random)
+                write_row(2 * row + 1, bytes(cell_row))
+                if row == cell_rows - 1:
+                    break
+
+                passage_row[:] = wall_row
+                labels = drop_row(members, passage_row, rng.random)
+                write_row(2 * row + 2, bytes(passage_row))
+
+            write_row(0, wall_row)
+            write_row(n_row - 1, wall_row)
+            exit_row = cell_row
+            if n_row % 2 == 0:
+                passage_row[:] = wall_row
+                passage_row[2 * int(rng.random() * cell_cols) + 1] = path_tile
+                write_row(n_row - 2, bytes(passage_row))
+                exit_row = passage_row
+
+            # Same entry and exit as create_entry_exit: first path tile below the top row, last one above the bottom.
+            start, end = (0, 1), (n_row - 1, exit_row.rfind(path_tile, 1))
+            mapping[BOARD_FILE_HEADER.size + start[1]] = MazeGameObject.PLAYER_TILE.value
+            mapping[BOARD_FILE_HEADER.size + end[0] * n_col + end[1]] = MazeGameObject.GOAL.value
+            BOARD_FILE_HEADER.pack_into(mapping, 0, BOARD_FILE_MAGIC, BOARD_FILE_VERSION, 0, n_row, n_col, *start, *end)
+    return start, end
+
+
+def write_maze_file(path: str, start: Tuple[int, int], end: Tuple[int, int], tiles: bytes, n_col: int) -> None:
+    """Writes a generated maze to a board file.
+
+    Args:
+        path: path of the board file to write.
+        start: start position coordinates.
+        end: end position coordinates.
+        tiles: the board tiles in row major order, one byte per tile.
+        n_col: number of columns the maze board.
+    """
+
+    n_row = len(tiles) // n_col
+    with open(path, "wb") as board_file:
+        board_file.write(BOARD_FILE_HEADER.pack(BOARD_FILE_MAGIC, BOARD_FILE_VERSION, 0, n_row, n_col, *start, *end))
+        board_file.write(tiles)
+
+
+def open_maze_file(path: str) -> Tuple[Tuple[int, int], Tuple[int, int], MappedBoard]:
+    """Opens a maze board file without reading its tiles.
+
+    Args:
+        path: path of a maze board file.
+    Returns:
+        start position coordinates
+        end position coordinates
+        memory mapped maze board
+    """
+
+    board = MappedBoard(path)
+    return board.start, board.end, board
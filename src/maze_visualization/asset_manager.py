@@ -0,0 +1,79 @@
+"""Cache of images loaded from disk.
+
+Every image is decoded once and converted to the pixel format of the display, so that blitting it needs no
+conversion. Scaled variants are kept in a least recently used cache keyed by path and size.
+"""
+from collections import OrderedDict
+from typing import Dict, Iterable, Optional, Tuple
+
+import pygame
+
+BACKGROUND_IMAGE = "img/background.jpg"
+
+ImageSize = Tuple[int, int]
+
+
+class AssetManager:
+    """Loads every image once and caches its scaled variants."""
+
+    def __init__(self, max_entries: int = 16):
+        """Constructor for the asset manager.
+
+        Args:
+            max_entries: number of scaled images kept in memory.
+        """
+
+        self.max_entries = max_entries
+        self.images: Dict[str, pygame.Surface] = {}
+        self.scaled: "OrderedDict[Tuple[str, ImageSize], pygame.Surface]" = OrderedDict()
+        self.hits = self.misses = 0
+
+    def load(self, path: str) -> pygame.Surface:
+        """Returns an image at its original size, loading it on first use.
+
+        Args:
+            path: path of the image file.
+        """
+
+        image = self.images.get(path)
+        if image is None:
+            image = pygame.image.load(path)
+            # Converting needs a display mode, images loaded before it is set keep their file format.
+            if pygame.display.get_surface() is not None:
+                image = image.convert_alpha() if image.get_flags() & pygame.SRCALPHA else image.convert()
+            self.images[path] = image
+        return image
+
+    def get(self, path: str, size: Optional[ImageSize] = None) -> pygame.Surface:
+        """Returns an image scaled to a size, scaling it on first use.
+
+        Args:
+            path: path of the image file.
+            size: pixel width and height of the image, its original size if not given.
+        """
+
+        if size is None:
+            return self.load(path)
+        key = (path, size)
+        image = self.scaled.get(key)
+        if image is not None:
+            self.scaled.move_to_end(key)
+            self.hits += 1
+            return image
+
+        self.misses += 1
+        image = pygame.transform.scale(self.load(path), size)
+        self.scaled[key] = image
+        if len(self.scaled) > self.max_entries:
+            self.scaled.popitem(last=False)
+        return image
+
+    def preload(self, assets: Iterable[Tuple[str, Optional[ImageSize]]]) -> None:
+        """Loads and scales images ahead of their first draw.
+
+        Args:
+            assets: paths and sizes of the images.
+        """
+
+        for path, size in assets:
+            self.get(path, size)
@@ -19,6 +19,7 @@ SELECTED_BACKGROUND_COLOR: Final = Color(66, 104, 63)
 GOAL_COLOR: Final = Color(255, 215, 0)
 PLAYER_COLOR: Final = Color(255, 0, 0)
 VISITED_COLOR: Final = Color(255, 192, 203)
+HINT_COLOR: Final = Color(66, 104, 63)
 
 WALL_COLOR: Final = Color(86, 146, 86)
 PATH_COLOR: Final = Color(244, 237, 221)
@@ -1,53 +1,85 @@
 """Defines Pygame visualization of the maze"""
-from typing import Final, Tuple
+import os
+from typing import Final, Hashable, List, Optional, Set, Tuple
 import pygame
 
 from src.maze_game.layers.maze_layer import MazeLayer
 from src.maze_game.layers.options_layer import OptionsLayer
 from src.maze_game import MazeGame, MazeGameState, MazeGameObject
+from src.frame_profiler import PROFILER
 
+from src.maze_visualization.asset_manager import BACKGROUND_IMAGE, AssetManager
+from src.maze_visualization.text_cache import TextCache
 from src.maze_visualization.tile import Tile
-from src.maze_visualization.utils import draw_text, MazeText, ScreenSize
+from src.maze_visualization.utils import ScreenSize
 from src.maze_visualization.game_color import (GAME_OVER_TEXT_COLOR, MESSAGE_BACKGROUND_COLOR, TILE_BORDER_COLOR,
                                                PLAYER_COLOR, PATH_COLOR, GOAL_COLOR, VISITED_COLOR, WALL_COLOR,
-                                               SELECTED_BACKGROUND_COLOR)
+                                               SELECTED_BACKGROUND_COLOR, HINT_COLOR)
+
+# Top left pixel of the maze board on the screen.
+MAZE_ORIGIN: Final = (50, 75)
+# Tiles changed by the player moves, drawn over the static maze surface.
+DYNAMIC_TILES: Final = (MazeGameObject.PLAYER_TILE.value, MazeGameObject.VISITED_TILE.value)
 
 
 class MazeGameVisualization:
     """Maze Game visualization class"""
 
-    def __init__(self, screen_height: int, screen_width: int):
+    def __init__(self, screen_height: int, screen_width: int, headless: bool = False, font_file: Optional[str] = None):
         """Maze Game visualization class constructor.
 
         Args:
             screen_height: pixel height of user screen
             screen_width: pixel width of the user screen
+            headless: render into an off-screen display through the SDL dummy video driver, without a window.
+            font_file: path of the font file of the texts, the font bundled with pygame if not given.
         """
 
-        pygame.init()
+        if headless:
+            # The video driver is picked when the display is initialized, so this has to come first.
+            os.environ["SDL_VIDEODRIVER"] = "dummy"
+        # Only the subsystems drawn with are initialized, the audio and joystick ones are slow to start.
+        pygame.display.init()
+        pygame.font.init()
         pygame.display.set_caption("Maze")
         self.text_color = pygame.Color("black")
-        # Museo Sans Cyrillic 500 WhatFontIs.com
-        self.font = pygame.font.SysFont("sans", 60)
-        self.small_font: Final = pygame.font.SysFont("sans", 40)
+        # Fonts are loaded from a file, looking up system fonts scans every installed font.
+        self.font = pygame.font.Font(font_file, 60)
+        self.small_font: Final = pygame.font.Font(font_file, 40)
+        self.profiler_font: Final = pygame.font.Font(font_file, 20)
         self.screen_height, self.screen_width, = screen_height, screen_width
         self.screen: pygame.Surface = pygame.display.set_mode([screen_width, screen_height])
+        self.assets = AssetManager()
+        self.texts = TextCache()
+        self.assets.preload([(BACKGROUND_IMAGE, (screen_width, screen_height))])
+        self.frame_key: Optional[Hashable] = None
+        self.step_counter_rect = pygame.Rect(0, 0, 0, 0)
+        self.profiler_rect = pygame.Rect(0, 0, 0, 0)
+        self.maze_surface: Optional[pygame.Surface] = None
+        self.maze_key: Optional[Hashable] = None
+        self.dynamic_tiles: Set[Tuple[int, int]] = set()
 
     def draw_image(self, top_left_x: int, top_left_y: int, image_path: str, scale: float = 1):
         """Draws an image on a given surface"""
 
-        img = pygame.image.load(image_path).convert_alpha()
+        img = self.assets.load(image_path)
         width = img.get_width()
         height = img.get_height()
-        scaled_image = pygame.transform.scale(img, (int(width * scale), int(height * scale)))
+        scaled_image = self.assets.get(image_path, (int(width * scale), int(height * scale)))
         self.screen.blit(scaled_image, (top_left_x, top_left_y))
 
-    def draw_background(self):
-        """Draws the background of on the screen."""
+    def draw_background(self, area: Optional[pygame.Rect] = None):
+        """Draws the background of on the screen.
 
-        bg_img = pygame.image.load("img/background.jpg")
-        background = pygame.transform.scale(bg_img, (self.screen_width, self.screen_height))
-        self.screen.blit(background, (0, 0))
+        Args:
+            area: region of the screen to draw the background on, the whole screen if not given.
+        """
+
+        background = self.assets.get(BACKGROUND_IMAGE, (self.screen_width, self.screen_height))
+        if area is None:
+            self.screen.blit(background, (0, 0))
+        else:
+            self.screen.blit(background, area, area)
 
     def draw_option(self, option_text: str, option_space: ScreenSize, selected: bool = False):
         """Draws an option on the screen."""
@@ -63,12 +95,9 @@ class MazeGameVisualization:
             self.screen, TILE_BORDER_COLOR,
             pygame.Rect(option_space.top_left_x, option_space.top_left_y, option_space.width, option_space.height), 5)
 
-        img = self.font.render(option_text, True, pygame.Color("Blue"))
-        text_width, text_height = img.get_width(), img.get_height()
-        option = MazeText(option_text, self.text_color, self.font,
-                          option_space.top_left_x + option_space.width // 2 - text_width // 2,
-                          option_space.top_left_y + option_space.height // 2 - text_height // 2)
-        draw_text(option, self.screen)
+        img, (text_width, text_height) = self.texts.render(self.font, option_text, self.text_color, static=True)
+        self.screen.blit(img, (option_space.top_left_x + option_space.width // 2 - text_width // 2,
+                               option_space.top_left_y + option_space.height // 2 - text_height // 2))
 
     def draw_options(self, options: OptionsLayer, options_space: ScreenSize, padding: Tuple[int, int] = (50, 10)):
         """Draws the options on the screen."""
@@ -90,14 +119,11 @@ class MazeGameVisualization:
     def draw_main_menu(self, menu_layer: OptionsLayer):
         """Draws the main menu on the screen."""
 
-        img = self.font.render("Menu Screen", True, pygame.Color("Blue"))
-        text_width, _ = img.get_width(), img.get_height()
+        img, (text_width, text_height) = self.texts.render(self.font, "Menu Screen", self.text_color, static=True)
+        self.screen.blit(img, (self.screen_width // 2 - text_width // 2, 50))
 
-        title_text = MazeText("Menu Screen", self.text_color, self.font, self.screen_width // 2 - text_width // 2, 50)
-
-        draw_text(title_text, self.screen)
         x_padding = 100
-        y_padding = 50 + img.get_height()
+        y_padding = 50 + text_height
         menu_option_space = ScreenSize(self.screen_width - 2 * x_padding, self.screen_height - 2 * y_padding, x_padding,
                                        y_padding)
 
@@ -106,15 +132,11 @@ class MazeGameVisualization:
     def draw_pause_screen(self, pause_layer: OptionsLayer):
         """Draws the pause menu on the screen."""
 
-        img = self.font.render("Paused", True, pygame.Color("Blue"))
-        text_width, _ = img.get_width(), img.get_height()
-
-        title_text = MazeText("Paused", self.text_color, self.font, self.screen_width // 2 - text_width // 2, 50)
-
-        draw_text(title_text, self.screen)
+        img, (text_width, text_height) = self.texts.render(self.font, "Paused", self.text_color, static=True)
+        self.screen.blit(img, (self.screen_width // 2 - text_width // 2, 50))
 
         x_padding = 150
-        y_padding = 100 + img.get_height()
+        y_padding = 100 + text_height
         menu_option_space = ScreenSize(self.screen_width - 2 * x_padding, self.screen_height - 2 * y_padding, x_padding,
                                        y_padding)
 
@@ -133,67 +155,153 @@ class MazeGameVisualization:
             pygame.Rect(self.screen_width // 2 - bg_width // 2, self.screen_height // 2 - bg_height // 2, bg_width,
                         bg_height), int(150 * 0.1))
 
-        img = self.font.render("Game Over", True, pygame.Color("Blue"))
-        text_width, text_height = img.get_width(), img.get_height()
-        game_over_text_left_x = self.screen_width // 2 - text_width // 2
-        game_over_text_text_left_y = self.screen_height // 2 - text_height // 2
-        game_over_text = MazeText("Game Over", GAME_OVER_TEXT_COLOR, self.font, game_over_text_left_x,
-                                  game_over_text_text_left_y)
-        draw_text(game_over_text, self.screen)
-
-        img = self.small_font.render("Press down arrow to start next level", True, pygame.Color("Blue"))
-        text_width, text_height = img.get_width(), img.get_height()
-        next_level_message_left_x = self.screen_width // 2 - text_width // 2
-        next_level_message_left_y = self.screen_height // 2 - text_height // 2 + 75
-        next_level_message = MazeText("Press down arrow to start next level", GAME_OVER_TEXT_COLOR, self.small_font,
-                                      next_level_message_left_x, next_level_message_left_y)
-        draw_text(next_level_message, self.screen)
-
-    def draw_tile(self, tile: Tile):
+        img, (text_width, text_height) = self.texts.render(self.font, "Game Over", GAME_OVER_TEXT_COLOR, static=True)
+        self.screen.blit(img, (self.screen_width // 2 - text_width // 2, self.screen_height // 2 - text_height // 2))
+
+        message = "Press down arrow to start next level"
+        img, (text_width, text_height) = self.texts.render(self.small_font, message, GAME_OVER_TEXT_COLOR, static=True)
+        self.screen.blit(img,
+                         (self.screen_width // 2 - text_width // 2, self.screen_height // 2 - text_height // 2 + 75))
+
+    def draw_tile(self, tile: Tile, surface: Optional[pygame.Surface] = None):
         """Draws the game tile on the screen.
 
         Args:
-            board_x: top left x pixel location of the maze board.
-            board_y: top left y pixel location of the maze board.
             tile: tile that needs to be drawn.
+            surface: surface to draw the tile on, the screen if not given.
         """
 
+        surface = surface or self.screen
         pygame.draw.rect(
-            self.screen, tile.tile_color,
+            surface, tile.tile_color,
             pygame.Rect(tile.tile_space.top_left_x, tile.tile_space.top_left_y, tile.tile_space.width,
                         tile.tile_space.height), 0)
         if int(tile.tile_space.width * 0.1) > 0:
             pygame.draw.rect(
-                self.screen, tile.border_color,
+                surface, tile.border_color,
                 pygame.Rect(tile.tile_space.top_left_x, tile.tile_space.top_left_y, tile.tile_space.width,
                             tile.tile_space.height), int(tile.tile_space.width * 0.1))
 
+    def get_tile_size(self, maze: MazeLayer) -> Tuple[int, int]:
+        """Returns the pixel width and height of a maze tile on the screen.
+
+        Args:
+            maze: MazeGameLayer object.
+        """
+
+        board = maze.get_board()
+        maze_screen_width, maze_screen_height = self.screen_width - 100, self.screen_height - 100
+        return maze_screen_width // len(board[0]), maze_screen_height // len(board)
+
+    def draw_board_tile(self,
+                        value: int,
+                        i: int,
+                        j: int,
+                        tile_size: Tuple[int, int],
+                        surface: Optional[pygame.Surface] = None) -> pygame.Rect:
+        """Draws a single tile of the maze board.
+
+        Args:
+            value: value of the tile on the board.
+            i: row of the tile.
+            j: column of the tile.
+            tile_size: pixel width and height of a tile.
+            surface: surface holding the maze board only, the screen if not given.
+        Returns:
+            the region of the surface covered by the tile.
+        """
+
+        if value == MazeGameObject.WALL.value:
+            tile_color = WALL_COLOR
+        elif value == MazeGameObject.GOAL.value:
+            tile_color = GOAL_COLOR
+        elif value == MazeGameObject.VISITED_TILE.value:
+            tile_color = VISITED_COLOR
+        elif value == MazeGameObject.PLAYER_TILE.value:
+            tile_color = PLAYER_COLOR
+        else:
+            tile_color = PATH_COLOR
+        tile_width, tile_height = tile_size
+        origin_x, origin_y = MAZE_ORIGIN if surface is None else (0, 0)
+        tile_space = ScreenSize(tile_width, tile_height, origin_x + j * tile_width, origin_y + i * tile_height)
+        self.draw_tile(Tile(tile_color, TILE_BORDER_COLOR, tile_space), surface)
+        return pygame.Rect(tile_space.top_left_x, tile_space.top_left_y, tile_width, tile_height)
+
+    def render_static_maze(self, maze: MazeLayer) -> pygame.Surface:
+        """Renders the walls, paths and goal of a maze once into an off-screen surface.
+
+        Player and visited tiles are drawn as paths and remembered as dynamic tiles.
+
+        Args:
+            maze: MazeGameLayer object.
+        Returns:
+            the static maze surface, kept until the level changes.
+        """
+
+        board = maze.get_board()
+        tile_size = self.get_tile_size(maze)
+        maze_surface = pygame.Surface((len(board[0]) * tile_size[0], len(board) * tile_size[1])).convert()
+        self.maze_surface = maze_surface
+        self.maze_key = (id(maze), maze.level_count)
+        self.dynamic_tiles = set()
+        for i in range(len(board)):
+            row = board[i]
+            for j in range(len(board[0])):
+                value = row[j]
+                if value in DYNAMIC_TILES:
+                    self.dynamic_tiles.add((i, j))
+                    value = MazeGameObject.PATH.value
+                self.draw_board_tile(value, i, j, tile_size, maze_surface)
+        return maze_surface
+
     def draw_maze(self, maze: MazeLayer):
         """Draws the maze game board on the screen.
+
+        The static maze surface is rendered on the first draw of a level, every later draw blits it and draws the
+        dynamic tiles over it.
+
         Args:
             maze: MazeGameLayer object.
         """
 
+        maze_surface = self.maze_surface
+        if maze_surface is None or self.maze_key != (id(maze), maze.level_count):
+            maze_surface = self.render_static_maze(maze)
+        self.dynamic_tiles.update(maze.take_changed_tiles())
+        self.screen.blit(maze_surface, MAZE_ORIGIN)
+
         board = maze.get_board()
-        row, col = len(board), len(board[0])
-        maze_screen_width, maze_screen_height = self.screen_width - 100, self.screen_height - 100
-        tile_width, tile_height = maze_screen_width // col, maze_screen_height // row
-
-        for i in range(row):
-            for j in range(col):
-                if board[i][j] == MazeGameObject.WALL.value:
-                    tile_color = WALL_COLOR
-                elif board[i][j] == MazeGameObject.GOAL.value:
-                    tile_color = GOAL_COLOR
-                elif board[i][j] == MazeGameObject.VISITED_TILE.value:
-                    tile_color = VISITED_COLOR
-                elif board[i][j] == MazeGameObject.PLAYER_TILE.value:
-                    tile_color = PLAYER_COLOR
-                else:
-                    tile_color = PATH_COLOR
-                tile_space = ScreenSize(tile_width, tile_height, 50 + j * tile_width, 75 + i * tile_height)
-                tile = Tile(tile_color, TILE_BORDER_COLOR, tile_space)
-                self.draw_tile(tile)
+        tile_size = self.get_tile_size(maze)
+        for i, j in self.dynamic_tiles:
+            self.draw_board_tile(board[i][j], i, j, tile_size)
+
+    def draw_solution_path(self, maze: MazeLayer):
+        """Draws the shortest path from the player to the goal over the maze board.
+
+        Args:
+            maze: MazeGameLayer object.
+        """
+
+        tile_width, tile_height = self.get_tile_size(maze)
+        inset_x, inset_y = tile_width // 3, tile_height // 3
+
+        for i, j in maze.get_solution_path()[1:-1]:
+            pygame.draw.rect(
+                self.screen, HINT_COLOR,
+                pygame.Rect(MAZE_ORIGIN[0] + j * tile_width + inset_x, MAZE_ORIGIN[1] + i * tile_height + inset_y,
+                            max(1, tile_width - 2 * inset_x), max(1, tile_height - 2 * inset_y)))
+
+    def draw_distance_counter(self, maze: MazeLayer):
+        """Draws the number of moves left to the goal on the screen.
+
+        Args:
+            maze: MazeGameLayer object
+
+        """
+
+        img, (text_width, text_height) = self.texts.render(self.small_font, f"Goal: {maze.get_distance_remaining()}",
+                                                           self.text_color)
+        self.screen.blit(img, (self.screen_width // 2 - text_width // 2, text_height // 2))
 
     def draw_level_counter(self, maze: MazeLayer):
         """Draws the level on the screen.
@@ -202,39 +310,134 @@ class MazeGameVisualization:
             maze: MazeGameLayer Object with the level number
 
         """
-        img = self.small_font.render(f"Level: {maze.level_count}", True, pygame.Color("Black"))
-        text_width, text_height = img.get_width(), img.get_height()
+        img, (text_width, text_height) = self.texts.render(self.small_font, f"Level: {maze.level_count}",
+                                                           self.text_color)
         self.screen.blit(img, (50 + text_width // 2, text_height // 2))
 
-    def draw_step_counter(self, maze: MazeLayer):
+    def draw_step_counter(self, maze: MazeLayer) -> pygame.Rect:
         """Draws the steps on the screen.
 
         Args:
             maze: MazeGameLayer object with the step count
+        Returns:
+            the region of the screen covered by the text.
+        """
+
+        img, (text_width, text_height) = self.texts.render(self.small_font, f"Steps: {maze.step_count}",
+                                                           self.text_color)
+        return self.screen.blit(img, (3 * self.screen_width // 4 - text_width // 2, text_height // 2))
 
+    @staticmethod
+    def get_frame_key(game: MazeGame) -> Hashable:
+        """Returns the part of the game state that needs the whole screen to be redrawn when it changes.
+
+        Args:
+            game: MazeGame object contain game state
         """
 
-        img = self.small_font.render(f"Steps: {maze.step_count}", True, pygame.Color("Black"))
-        text_width, text_height = img.get_width(), img.get_height()
-        self.screen.blit(img, (3 * self.screen_width // 4 - text_width // 2, text_height // 2))
+        if game.state == MazeGameState.MENU:
+            return game.state, game.main_menu_layer.current_option
+        if game.state == MazeGameState.PAUSED:
+            return game.state, game.pause_menu_layer.current_option
+        maze = game.get_maze()
+        hint = maze.board.curr_pos if game.show_hint else None
+        return game.state, id(maze), maze.level_count, maze.is_solved(), hint
 
-    def draw_game(self, game: MazeGame):
-        """Draws the game on the screen.
+    def draw_full_game(self, game: MazeGame):
+        """Draws the whole game on the screen.
 
         Args:
             game: MazeGame object contain game state
         """
 
-        self.draw_background()
+        with PROFILER.phase("draw.background"):
+            self.draw_background()
         if game.state == MazeGameState.MENU:
-            self.draw_main_menu(game.main_menu_layer)
+            with PROFILER.phase("draw.menu"):
+                self.draw_main_menu(game.main_menu_layer)
 
         elif game.state == MazeGameState.PAUSED:
-            self.draw_pause_screen(game.pause_menu_layer)
+            with PROFILER.phase("draw.menu"):
+                self.draw_pause_screen(game.pause_menu_layer)
 
         else:
-            self.draw_maze(game.get_maze())
-            self.draw_level_counter(game.get_maze())
-            self.draw_step_counter(game.get_maze())
+            with PROFILER.phase("draw.maze"):
+                self.draw_maze(game.get_maze())
+            if game.show_hint and not game.get_maze().is_solved():
+                with PROFILER.phase("draw.hint"):
+                    self.draw_solution_path(game.get_maze())
+                    self.draw_distance_counter(game.get_maze())
+            with PROFILER.phase("draw.hud"):
+                self.draw_level_counter(game.get_maze())
+                self.step_counter_rect = self.draw_step_counter(game.get_maze())
             if game.get_maze().is_solved():
-                self.draw_game_over()
+                with PROFILER.phase("draw.game_over"):
+                    self.draw_game_over()
+
+    def draw_changes(self, maze: MazeLayer) -> List[pygame.Rect]:
+        """Draws the maze tiles changed by the player moves and the step counter.
+
+        Args:
+            maze: MazeGameLayer object.
+        Returns:
+            the regions of the screen that changed.
+        """
+
+        with PROFILER.phase("draw.tiles"):
+            board = maze.get_board()
+            tile_size = self.get_tile_size(maze)
+            changed_tiles = dict.fromkeys(maze.take_changed_tiles())
+            self.dynamic_tiles.update(changed_tiles)
+            dirty_rects = [self.draw_board_tile(board[i][j], i, j, tile_size) for i, j in changed_tiles]
+        if dirty_rects:
+            with PROFILER.phase("draw.hud"):
+                previous_rect = self.step_counter_rect
+                self.draw_background(previous_rect)
+                self.step_counter_rect = self.draw_step_counter(maze)
+                dirty_rects.append(previous_rect.union(self.step_counter_rect))
+        return dirty_rects
+
+    def draw_profiler_overlay(self) -> Optional[pygame.Rect]:
+        """Draws the frame profiler summary at the bottom of the screen and clears it once profiling stops.
+
+        Returns:
+            the region of the screen that changed, None if nothing changed.
+        """
+
+        if not PROFILER.enabled and not self.profiler_rect:
+            return None
+        with PROFILER.phase("draw.profiler"):
+            previous_rect = self.profiler_rect
+            self.draw_background(previous_rect)
+            self.profiler_rect = pygame.Rect(0, 0, 0, 0)
+            if PROFILER.enabled:
+                img = self.profiler_font.render(PROFILER.get_summary(), True, self.text_color)
+                self.profiler_rect = self.screen.blit(img, (50, self.screen_height - img.get_height()))
+            return previous_rect.union(self.profiler_rect) if previous_rect else self.profiler_rect
+
+    def draw_game(self, game: MazeGame) -> List[pygame.Rect]:
+        """Draws the game on the screen.
+
+        The whole screen is only redrawn when the frame key of the game changes, otherwise only the maze tiles
+        changed by the player moves, the step counter and the profiler overlay are redrawn.
+
+        Args:
+            game: MazeGame object contain game state
+        Returns:
+            the regions of the screen that changed since the last frame.
+        """
+
+        frame_key = self.get_frame_key(game)
+        if frame_key != self.frame_key:
+            self.frame_key = frame_key
+            self.draw_full_game(game)
+            dirty_rects = [self.screen.get_rect()]
+        elif game.state in (MazeGameState.MENU, MazeGameState.PAUSED):
+            dirty_rects = []
+        else:
+            dirty_rects = self.draw_changes(game.get_maze())
+
+        profiler_rect = self.draw_profiler_overlay()
+        if profiler_rect:
+            dirty_rects.append(profiler_rect)
+        return dirty_rects
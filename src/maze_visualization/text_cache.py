@@ -0,0 +1,59 @@
+"""Cache of rendered text.
+
+Rasterizing text is one of the most expensive draw calls, so every rendered text is kept with its size. Static
+labels are kept for good, changing texts such as counters in a least recently used cache.
+"""
+from collections import OrderedDict
+from typing import Dict, Tuple, Union
+
+import pygame
+from pygame.font import Font
+
+TextColor = Union[pygame.Color, Tuple[int, int, int], str]
+TextKey = Tuple[Font, str, Tuple[int, ...]]
+RenderedText = Tuple[pygame.Surface, Tuple[int, int]]
+
+
+class TextCache:
+    """Cache of rendered text surfaces and their sizes."""
+
+    def __init__(self, max_entries: int = 128):
+        """Constructor for the text cache.
+
+        Args:
+            max_entries: number of changing texts kept in memory.
+        """
+
+        self.max_entries = max_entries
+        self.labels: Dict[TextKey, RenderedText] = {}
+        self.entries: "OrderedDict[TextKey, RenderedText]" = OrderedDict()
+        self.hits = self.misses = 0
+
+    def render(self, font: Font, text: str, color: TextColor, static: bool = False) -> RenderedText:
+        """Returns a rendered text and its pixel width and height, rendering it on first use.
+
+        Args:
+            font: font of the text.
+            text: the text.
+            color: color of the text.
+            static: keep the text for good instead of in the least recently used cache.
+        """
+
+        key = (font, text, tuple(pygame.Color(color)))
+        rendered = self.labels.get(key) or self.entries.get(key)
+        if rendered is not None:
+            if key in self.entries:
+                self.entries.move_to_end(key)
+            self.hits += 1
+            return rendered
+
+        self.misses += 1
+        image = font.render(text, True, color)
+        rendered = (image, image.get_size())
+        if static:
+            self.labels[key] = rendered
+        else:
+            self.entries[key] = rendered
+            if len(self.entries) > self.max_entries:
+                self.entries.popitem(last=False)
+        return rendered
@@ -1,18 +1,22 @@
 """Defining the game engine."""
 import asyncio
-from typing import Final
+from typing import Callable, Final, Type
 
-from src.event_manager import EventManager
+from src.event_manager import EventManager, EventType
 from src.event_listener import EventListener
 from src.event import (Direction, Event, QuitEvent, StartGameEvent, TickEvent, MovementEvent, SelectEvent, PauseEvent,
-                       EscapeEvent)
+                       EscapeEvent, KeyboardEvent, RenderEvent)
+from src.frame_profiler import PROFILER
 from src.maze_game import MazeGame, MazeGameState
-from src.logger import init_logger
+from src.logger import EVENT_TYPE, init_logger
 
 SCREEN_WIDTH: Final = 1280
 SCREEN_HEIGHT: Final = 720
 MAZE_WIDTH: Final = SCREEN_WIDTH - 100
 MAZE_HEIGHT: Final = SCREEN_HEIGHT - 100
+PROFILER_KEY: Final = "f3"
+# Most ticks run back to back after a stall, the ticks missed beyond it are dropped.
+MAX_CATCH_UP_TICKS: Final = 5
 
 LOGGER: Final = init_logger(__name__)
 
@@ -20,17 +24,67 @@ LOGGER: Final = init_logger(__name__)
 class GameEngine(EventListener):
     """The game engine class."""
 
-    def __init__(self, event_manager: EventManager, maze: MazeGame):
+    def __init__(self, event_manager: EventManager, maze: MazeGame, tick_rate: int = 60, frame_rate: int = 30):
         """Constructor for the game engine.
 
         Args:
             event_manager: The event manager.
+            maze: The maze game.
+            tick_rate: simulation ticks per second.
+            frame_rate: rendered frames per second, 0 renders as fast as possible.
         """
 
         self.maze = maze
+        self.tick_rate = tick_rate
+        self.frame_rate = frame_rate
         self.running = True
         self.event_manager = event_manager
-        self.event_manager.register_listener(self)
+        self.subscribe(QuitEvent, self.handle_quit)
+        self.subscribe(MovementEvent, self.handle_movement)
+        self.subscribe(PauseEvent, self.handle_pause)
+        self.subscribe(SelectEvent, self.handle_select)
+        self.subscribe(EscapeEvent, self.handle_escape)
+        self.subscribe(KeyboardEvent, self.handle_keyboard)
+
+    def subscribe(self, event_type: Type[EventType], handler: Callable[[EventType], None]):
+        """Subscribe a handler to the events of a type, the events are logged and handled in the engine phase.
+
+        Args:
+            event_type: The type of the events to handle.
+            handler: The handler of the events.
+        """
+
+        def handle(event: EventType):
+            with PROFILER.phase("engine.notify"):
+                self.notify(event)
+                handler(event)
+
+        self.event_manager.subscribe(event_type, handle)
+
+    def handle_quit(self, _: QuitEvent):
+        """Process quit event."""
+        self.running = False
+
+    def handle_movement(self, event: MovementEvent):
+        """Process movement event."""
+        self.move(event.direction)
+
+    def handle_pause(self, _: PauseEvent):
+        """Process pause event."""
+        self.pause()
+
+    def handle_select(self, _: SelectEvent):
+        """Process select event."""
+        self.select()
+
+    def handle_escape(self, _: EscapeEvent):
+        """Process escape event."""
+        if self.maze.state != MazeGameState.MENU:
+            self.maze.set_state(MazeGameState.MENU)
+
+    def handle_keyboard(self, event: KeyboardEvent):
+        """Process keyboard event."""
+        self.press_key(event.key_char)
 
     def move(self, direction: Direction):
         """Move the player in the given direction.
@@ -71,31 +125,65 @@ class GameEngine(EventListener):
             elif self.maze.pause_menu_layer.get_current_option() == "Quit":
                 self.event_manager.post(QuitEvent())
 
+    def press_key(self, key_char: str):
+        """Process a key without its own event.
+
+        Args:
+            key_char: name of the key.
+        """
+        if key_char == "h" and self.maze.state == MazeGameState.PLAYING:
+            self.maze.toggle_hint()
+        elif key_char == PROFILER_KEY:
+            PROFILER.toggle()
+
     def notify(self, event: Event):
-        """Receive an event posted to the message queue.
+        """Log an event posted to the message queue, the handler of its type processes it.
 
         Args:
             event: The event to receive.
         """
-        if not isinstance(event, TickEvent):
-            LOGGER.info("Received event: %s", event)
-        if isinstance(event, QuitEvent):
-            self.running = False
-        if isinstance(event, MovementEvent):
-            self.move(event.direction)
-        elif isinstance(event, PauseEvent):
-            self.pause()
-        elif isinstance(event, SelectEvent):
-            self.select()
-        elif isinstance(event, EscapeEvent):
-            if self.maze.state != MazeGameState.MENU:
-                self.maze.set_state(MazeGameState.MENU)
+        LOGGER.info("Received event: %s", event, extra={EVENT_TYPE: type(event).__name__})
 
     async def run(self):
-        """Run the game engine."""
+        """Run the game engine.
+
+        Ticks are posted at a fixed rate and frames are rendered at their own rate. Between the two the loop waits
+        with asyncio.sleep, so the other tasks of the event loop keep running.
+        """
         LOGGER.info("Starting game engine")
         self.event_manager.post(StartGameEvent())
+        self.event_manager.drain()
+        loop = asyncio.get_running_loop()
+        tick_interval = 1 / self.tick_rate
+        frame_interval = 1 / self.frame_rate if self.frame_rate else 0.0
+        next_tick = next_frame = loop.time()
         while self.running:
-            self.event_manager.post(TickEvent())
-            await asyncio.sleep(0)
+            now = loop.time()
+            if now >= next_tick:
+                next_tick = self.post_ticks(now, next_tick, tick_interval)
+            if self.running and now >= next_frame:
+                self.event_manager.post(RenderEvent())
+                self.event_manager.drain()
+                PROFILER.end_frame()
+                next_frame += frame_interval
+                if next_frame <= now:
+                    next_frame = now + frame_interval
+            with PROFILER.phase("loop.sleep"):
+                await asyncio.sleep(max(0.0, min(next_tick, next_frame) - loop.time()))
         LOGGER.info("Stopping game engine")
+
+    def post_ticks(self, now: float, next_tick: float, tick_interval: float) -> float:
+        """Posts the ticks due by now and returns the time of the next one.
+
+        Args:
+            now: the current loop time.
+            next_tick: loop time of the first tick due.
+            tick_interval: seconds between two ticks.
+        """
+        for _ in range(MAX_CATCH_UP_TICKS):
+            self.event_manager.post(TickEvent())
+            self.event_manager.drain()
+            next_tick += tick_interval
+            if next_tick > now or not self.running:
+                return next_tick
+        return now + tick_interval
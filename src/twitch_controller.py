@@ -0,0 +1,195 @@
+"""Handles Twitch chat input.
+
+Chat is read from the Twitch IRC server as a stream of CRLF terminated lines. Lines are located in the receive buffer
+by index and never copied, only the few bytes of a candidate command are.
+"""
+import asyncio
+from typing import Dict, Final, Iterator, Optional, Tuple
+
+from src.crowd_vote import CrowdVote
+from src.event import Direction, Event, MovementEvent, PauseEvent, QuitEvent
+from src.event_listener import EventListener
+from src.event_manager import EventManager
+from src.logger import init_logger
+
+TWITCH_HOST: Final = "irc.chat.twitch.tv"
+TWITCH_PORT: Final = 6667
+READ_SIZE: Final = 65536
+# Longer chat messages are never commands, they are skipped without being copied.
+MAX_COMMAND_LENGTH: Final = 16
+
+PRIVMSG: Final = b" PRIVMSG "
+COMMANDS: Final[Dict[bytes, Event]] = {
+    b"up": MovementEvent(Direction.UP),
+    b"down": MovementEvent(Direction.DOWN),
+    b"left": MovementEvent(Direction.LEFT),
+    b"right": MovementEvent(Direction.RIGHT),
+    b"pause": PauseEvent(),
+}
+
+LOGGER: Final = init_logger(__name__)
+
+
+class LineSplitter:
+    """Splits a byte stream into CRLF terminated lines without copying them."""
+
+    def __init__(self):
+        """Constructor for the line splitter."""
+
+        self.buffer = bytearray()
+
+    def feed(self, data: bytes) -> Iterator[Tuple[int, int]]:
+        """Adds received data and yields the start and end index in the buffer of every complete line.
+
+        The indexes are valid until the lines are all consumed, the incomplete last line is then kept for the next
+        call.
+
+        Args:
+            data: the received data.
+        """
+
+        buffer = self.buffer
+        buffer += data
+        start = 0
+        while True:
+            end = buffer.find(b"\r\n", start)
+            if end < 0:
+                break
+            yield start, end
+            start = end + 2
+        del buffer[:start]
+
+
+def parse_chat_command(buffer: bytearray, start: int, end: int) -> Optional[Tuple[bytes, Event]]:
+    """Parses a chat command out of an IRC line.
+
+    Args:
+        buffer: buffer holding the line.
+        start: index of the first byte of the line.
+        end: index of the end of the line, its CRLF excluded.
+    Returns:
+        the user name and the event of the command, None if the line is not a chat command.
+    """
+
+    if buffer.startswith(b"@", start, end):
+        # Skip the IRCv3 message tags.
+        tags_end = buffer.find(b" ", start, end)
+        if tags_end < 0:
+            return None
+        start = tags_end + 1
+    if not buffer.startswith(b":", start, end):
+        return None
+    privmsg = buffer.find(PRIVMSG, start, end)
+    if privmsg < 0:
+        return None
+    text = buffer.find(b" :", privmsg + len(PRIVMSG), end) + 2
+    if text < 2 or end - text > MAX_COMMAND_LENGTH:
+        return None
+    event = COMMANDS.get(bytes(buffer[text:end]).strip().lower())
+    if event is None:
+        return None
+    user_end = buffer.find(b"!", start, privmsg)
+    return bytes(buffer[start + 1:user_end if user_end >= 0 else privmsg]), event
+
+
+class TwitchChat(EventListener):
+    """Handles Twitch chat input."""
+
+    def __init__(self,
+                 event_manager: EventManager,
+                 channel: str,
+                 username: str,
+                 token: str,
+                 host: str = TWITCH_HOST,
+                 port: int = TWITCH_PORT,
+                 votes: Optional[CrowdVote] = None):
+        """Constructor for the Twitch chat controller.
+
+        Args:
+            event_manager: The event manager.
+            channel: name of the channel whose chat is read.
+            username: name of the account reading the chat.
+            token: OAuth token of the account.
+            host: IRC server host.
+            port: IRC server port.
+            votes: crowd vote the movement commands are counted in, they are posted right away if not given.
+        """
+
+        self.event_manager = event_manager
+        self.channel, self.username, self.token = channel.lower().lstrip("#"), username.lower(), token
+        self.host, self.port = host, port
+        self.votes = votes
+        self.splitter = LineSplitter()
+        self.writer: Optional[asyncio.StreamWriter] = None
+        self.running = False
+        self.lines = self.commands = 0
+        event_manager.register_listener(self, (QuitEvent, ))
+
+    async def run(self):
+        """Connects to the chat and posts its commands until the game quits or the server disconnects."""
+
+        reader, self.writer = await asyncio.open_connection(self.host, self.port)
+        token = self.token if self.token.startswith("oauth:") else f"oauth:{self.token}"
+        self.writer.write(f"PASS {token}\r\nNICK {self.username}\r\nJOIN #{self.channel}\r\n".encode())
+        self.running = True
+        LOGGER.info("Reading the chat of #%s", self.channel)
+        try:
+            while self.running:
+                data = await reader.read(READ_SIZE)
+                if not data:
+                    break
+                self.handle_data(data)
+                # A flooded stream never suspends reader.read, let the game loop run between two reads.
+                await asyncio.sleep(0)
+        finally:
+            self.close()
+        LOGGER.info("Stopped reading the chat of #%s", self.channel)
+
+    def handle_data(self, data: bytes):
+        """Posts the commands of the received chat lines and answers the server pings.
+
+        Args:
+            data: the received data.
+        """
+
+        buffer = self.splitter.buffer
+        for start, end in self.splitter.feed(data):
+            self.lines += 1
+            if buffer.startswith(b"PING", start, end):
+                if self.writer is not None:
+                    self.writer.write(b"PONG" + buffer[start + 4:end] + b"\r\n")
+                continue
+            command = parse_chat_command(buffer, start, end)
+            if command is not None:
+                self.commands += 1
+                self.handle_command(*command)
+
+    def handle_command(self, user: bytes, event: Event):
+        """Posts the event of a chat command, or votes for its direction.
+
+        Args:
+            user: name of the user who sent the command.
+            event: the event of the command.
+        """
+
+        if self.votes is not None and isinstance(event, MovementEvent):
+            self.votes.vote(user, event.direction)
+        else:
+            self.event_manager.post(event)
+
+    def close(self):
+        """Stops reading the chat and closes the connection."""
+
+        self.running = False
+        if self.writer is not None:
+            self.writer.close()
+            self.writer = None
+
+    def notify(self, event: Event):
+        """Receive events posted to the message queue.
+
+        Args:
+            event: The event that was posted.
+        """
+        if isinstance(event, QuitEvent):
+            self.close()
@@ -1,10 +1,12 @@
 """Maze view class."""
+from typing import Optional
 
 import pygame
 
-from src.event import Event, StartGameEvent, QuitEvent, TickEvent
-from src.event_manager import EventManager
+from src.event import Event, StartGameEvent, QuitEvent, RenderEvent
+from src.event_manager import VIEW_PRIORITY, EventManager
 from src.event_listener import EventListener
+from src.frame_profiler import PROFILER
 from src.maze_game import MazeGame
 from src.maze_visualization import MazeGameVisualization
 
@@ -12,20 +14,25 @@ from src.maze_visualization import MazeGameVisualization
 class MazeView(EventListener):
     """Draws the model state onto the screen."""
 
-    def __init__(self, event_manager: EventManager, maze: MazeGame):
+    def __init__(self,
+                 event_manager: EventManager,
+                 maze: MazeGame,
+                 headless: bool = False,
+                 visualization: Optional[MazeGameVisualization] = None):
         """Constructor for the maze view.
 
         Args:
             event_manager: The event manager.
             maze: The maze game.
+            headless: render without a window.
+            visualization: visualization to draw with, one is created if not given.
 
         """
         self.maze = maze
         self.is_initialized = False
-        self.clock = pygame.time.Clock()
         self.event_manager = event_manager
-        self.event_manager.register_listener(self)
-        self.maze_visualization = MazeGameVisualization(720, 1280)
+        self.event_manager.register_listener(self, (StartGameEvent, QuitEvent, RenderEvent), VIEW_PRIORITY)
+        self.maze_visualization = visualization or MazeGameVisualization(720, 1280, headless)
 
     def notify(self, event: Event):
         """Receive events posted to the message queue.
@@ -39,17 +46,18 @@ class MazeView(EventListener):
         elif isinstance(event, QuitEvent):
             self.is_initialized = False
             pygame.quit()
-        elif isinstance(event, TickEvent):
+        elif isinstance(event, RenderEvent):
             self.draw()
-            self.clock.tick(30)
 
     def draw(self):
         """Draw the current game state on screen."""
 
         if not self.is_initialized:
             return
-        self.maze_visualization.draw_game(self.maze)
-        pygame.display.update()
+        dirty_rects = self.maze_visualization.draw_game(self.maze)
+        if dirty_rects:
+            with PROFILER.phase("display.update"):
+                pygame.display.update(dirty_rects)
 
     def initialize(self):
         """
@@ -57,4 +65,3 @@ class MazeView(EventListener):
         """
 
         self.is_initialized = True
-        self.clock = pygame.time.Clock()
@@ -0,0 +1,26 @@
+"""Testing the render benchmark."""
+import unittest
+
+import pygame
+
+from benchmarks.render_benchmark import benchmark_render
+
+
+class TestRenderBenchmark(unittest.TestCase):
+    """Test the render benchmark."""
+
+    def test_headless_render(self):
+        """Test that frames of every scene are rendered without a display"""
+
+        results = benchmark_render(frames=3, levels=2)
+        self.addCleanup(pygame.quit)
+
+        self.assertEqual(pygame.display.get_driver(), "dummy")
+        self.assertEqual(list(results),
+                         ["menu", "pause", "level_1_full", "level_1_play", "level_2_full", "level_2_play"])
+        for scene, fps in results.items():
+            self.assertGreater(fps, 0, scene)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,49 @@
+"""Testing the benchmark suite."""
+import json
+import os
+import tempfile
+import unittest
+
+from benchmarks.suite import LEVEL_COUNT, bench_levels, compare, update_baseline
+
+
+class TestSuite(unittest.TestCase):
+    """Test the benchmark suite."""
+
+    def test_compare(self):
+        """Test that only the benchmarks slower than their threshold are regressions"""
+
+        baseline = {"results": {"a": 1.0, "b": 1.0, "c": 1.0}, "thresholds": {"b": 2.0}}
+        results = {"a": 1.6, "b": 2.5, "c": 1.4, "new": 9.0}
+        self.assertEqual(compare(results, baseline, 0.5), [("a", 1.6, 1.0)])
+        self.assertEqual(compare({"b": 3.5}, baseline, 0.5), [("b", 3.5, 1.0)])
+
+    def test_update_baseline_merges(self):
+        """Test that updating the baseline with some groups keeps the other results and the thresholds"""
+
+        temp_dir = tempfile.TemporaryDirectory()    # pylint: disable=consider-using-with
+        self.addCleanup(temp_dir.cleanup)
+        path = os.path.join(temp_dir.name, "baseline.json")
+        update_baseline(path, {"a": 1.0, "b": 2.0})
+        with open(path, encoding="utf-8") as baseline_file:
+            baseline = json.load(baseline_file)
+        baseline["thresholds"] = {"b": 1.0}
+        with open(path, "w", encoding="utf-8") as baseline_file:
+            json.dump(baseline, baseline_file)
+
+        update_baseline(path, {"b": 3.0, "c": 4.0})
+        with open(path, encoding="utf-8") as baseline_file:
+            baseline = json.load(baseline_file)
+        self.assertEqual(baseline["results"], {"a": 1.0, "b": 3.0, "c": 4.0})
+        self.assertEqual(baseline["thresholds"], {"b": 1.0})
+
+    def test_bench_levels(self):
+        """Test that the level benchmark plays a game through its levels"""
+
+        results = bench_levels(1)
+        self.assertEqual(list(results), [f"get_next_level.levels_1_{LEVEL_COUNT}"])
+        self.assertGreater(results[f"get_next_level.levels_1_{LEVEL_COUNT}"], 0)
+
+
+if __name__ == "__main__":
+    unittest.main()
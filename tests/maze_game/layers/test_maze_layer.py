@@ -5,6 +5,7 @@ from typing import List, Tuple
 from src.maze_game.layers.maze_layer import MazeLayer
 from src.maze_game.maze_board import MazeBoard
 from src.maze_game.maze_game_object import MazeGameObject
+from src.maze_game.maze_generators import MAZE_GENERATORS
 
 
 def generate_prim_maze(height: int, width: int) -> Tuple[Tuple[int, int], Tuple[int, int], List[List[int]]]:
@@ -24,10 +25,16 @@ def generate_prim_maze(height: int, width: int) -> Tuple[Tuple[int, int], Tuple[
 class TestMazeLayer(TestCase):
     """Test the Maze Layer Class."""
 
-    @mock.patch("src.maze_game.layers.maze_layer.generate_prim_maze")
-    def test_maze_layer_board_setup(self, mock_generate_prim_maze: mock.MagicMock):
+    def setUp(self):
+        """Replace the registered prim generator with a mock."""
+        self.mock_generate_prim_maze = mock.MagicMock()
+        patcher = mock.patch.dict(MAZE_GENERATORS, {"prim": self.mock_generate_prim_maze})
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def test_maze_layer_board_setup(self):
         """Test that maze layer is correctly generated."""
-        mock_generate_prim_maze.return_value = generate_prim_maze(5, 5)
+        self.mock_generate_prim_maze.return_value = generate_prim_maze(5, 5)
         maze_layer = MazeLayer(5, 5)
         exp_board = MazeBoard(
             generate_prim_maze(5, 5)[2],
@@ -39,11 +46,11 @@ class TestMazeLayer(TestCase):
         self.assertEqual(maze_layer.tile_height, 100 // 1)
         self.assertTrue(isinstance(maze_layer.get_board(), list))
         self.assertEqual(maze_layer.get_board(), exp_board.board)
+        self.assertIsNone(maze_layer.distance_field)
 
-    @mock.patch("src.maze_game.layers.maze_layer.generate_prim_maze")
-    def test_maze_layer_board_movement(self, mock_generate_prim_maze: mock.MagicMock):
+    def test_maze_layer_board_movement(self):
         """Test that maze layer is correctly generated."""
-        mock_generate_prim_maze.return_value = generate_prim_maze(5, 5)
+        self.mock_generate_prim_maze.return_value = generate_prim_maze(5, 5)
         maze_layer = MazeLayer(5, 5)
 
         maze_layer.move_up()
@@ -71,10 +78,9 @@ class TestMazeLayer(TestCase):
         exp_location = (2, 1)
         self.assertEqual(maze_layer.board.curr_pos, exp_location)
 
-    @mock.patch("src.maze_game.layers.maze_layer.generate_prim_maze")
-    def test_maze_layer_solved(self, mock_generate_prim_maze: mock.MagicMock):
+    def test_maze_layer_solved(self):
         """Test that maze layer is correctly generated."""
-        mock_generate_prim_maze.return_value = generate_prim_maze(5, 5)
+        self.mock_generate_prim_maze.return_value = generate_prim_maze(5, 5)
         maze_layer = MazeLayer(5, 5)
 
         maze_layer.move_down()
@@ -88,3 +94,32 @@ class TestMazeLayer(TestCase):
 
         self.assertEqual(maze_layer.board.curr_pos, (4, 3))
         self.assertTrue(maze_layer.is_solved())
+
+    def test_maze_layer_ndarray_movement(self):
+        """Test that the player moves the same way on an ndarray board."""
+        try:
+            from src.maze_game.maze_generation import to_ndarray    # pylint: disable=import-outside-toplevel
+            start, end, board = generate_prim_maze(5, 5)
+            self.mock_generate_prim_maze.return_value = (start, end, to_ndarray(board))
+        except ImportError:
+            self.skipTest("numpy is not installed")
+        maze_layer = MazeLayer(5, 5, use_numpy=True)
+
+        maze_layer.move_down()
+        maze_layer.move_down()
+        maze_layer.move_right()
+        self.assertEqual(maze_layer.board.curr_pos, (2, 2))
+        self.assertEqual(maze_layer.get_board()[2][2], MazeGameObject.PLAYER_TILE.value)
+        self.assertEqual(maze_layer.get_board()[2][1], MazeGameObject.VISITED_TILE.value)
+
+    def test_maze_layer_changed_tiles(self):
+        """Test that the moves record the tiles they change."""
+        self.mock_generate_prim_maze.return_value = generate_prim_maze(5, 5)
+        maze_layer = MazeLayer(5, 5)
+
+        maze_layer.move_up()
+        self.assertEqual(maze_layer.take_changed_tiles(), [])
+        maze_layer.move_down()
+        maze_layer.move_right()
+        self.assertEqual(maze_layer.take_changed_tiles(), [(0, 1), (1, 1), (1, 1), (1, 2)])
+        self.assertEqual(maze_layer.take_changed_tiles(), [])
@@ -0,0 +1,60 @@
+"""Testing the DistanceField class."""
+import unittest
+
+from src.event import Direction
+from src.maze_game.distance_field import DistanceField
+from src.maze_game.layers.maze_layer import MazeLayer
+
+# 0 path, 1 wall, 2 goal, 7 player
+BOARD = [
+    [1, 7, 1, 1, 1],
+    [1, 0, 0, 0, 1],
+    [1, 0, 1, 0, 1],
+    [1, 0, 1, 0, 1],
+    [1, 1, 1, 2, 1],
+]
+
+
+class TestDistanceField(unittest.TestCase):
+    """Test the DistanceField class."""
+
+    def test_distances(self):
+        """Test the distances, the next move and the solution path."""
+
+        field = DistanceField(BOARD, (4, 3))
+        self.assertEqual(field.distance((4, 3)), 0)
+        self.assertEqual(field.distance((0, 1)), 6)
+        self.assertEqual(field.distance((3, 1)), 7)
+        self.assertEqual(field.distance((0, 0)), -1)
+        self.assertTrue(field.is_solvable((0, 1)))
+
+        self.assertEqual(field.next_move((0, 1)), Direction.DOWN)
+        self.assertEqual(field.next_move((1, 1)), Direction.RIGHT)
+        self.assertIsNone(field.next_move((4, 3)))
+        self.assertEqual(field.solution_path((0, 1)), [(0, 1), (1, 1), (1, 2), (1, 3), (2, 3), (3, 3), (4, 3)])
+
+    def test_unsolvable(self):
+        """Test that a walled off goal can't be reached."""
+
+        board = [list(row) for row in BOARD]
+        board[3][3] = 1
+        field = DistanceField(board, (4, 3))
+        self.assertFalse(field.is_solvable((0, 1)))
+        self.assertIsNone(field.next_move((0, 1)))
+        self.assertEqual(field.solution_path((0, 1)), [])
+
+    def test_maze_layer_hint(self):
+        """Test that following the hints solves a maze layer."""
+
+        maze_layer = MazeLayer(620, 1180, 4, generator="kruskal", seed=1)
+        distance = maze_layer.get_distance_remaining()
+        moves = {
+            Direction.UP: maze_layer.move_up,
+            Direction.DOWN: maze_layer.move_down,
+            Direction.LEFT: maze_layer.move_left,
+            Direction.RIGHT: maze_layer.move_right
+        }
+        while not maze_layer.is_solved():
+            moves[maze_layer.get_hint()]()
+        self.assertEqual(maze_layer.step_count, distance)
+        self.assertEqual(maze_layer.get_distance_remaining(), 0)
@@ -0,0 +1,43 @@
+"""Testing the LevelPrefetcher class."""
+import unittest
+from unittest import mock
+
+from src.maze_game.level_prefetcher import LevelPrefetcher
+
+
+class TestLevelPrefetcher(unittest.TestCase):
+    """Test the LevelPrefetcher class."""
+
+    def test_prefetched_level(self):
+        """Test that the prefetched levels are generated ahead and handed out once"""
+
+        prefetcher = LevelPrefetcher((300, 300), depth=2)
+        self.addCleanup(prefetcher.close)
+        prefetcher.prefetch(1)
+        self.assertEqual(sorted(prefetcher.pending), [2, 3])
+
+        level = prefetcher.get_level(2)
+        self.assertEqual(level.level_count, 2)
+        self.assertIsNotNone(level.distance_field)
+        self.assertEqual(sorted(prefetcher.pending), [3])
+
+    def test_level_generated_in_place(self):
+        """Test that levels are generated in place without a prefetch"""
+
+        prefetcher = LevelPrefetcher((300, 300), depth=0)
+        self.assertIsNone(prefetcher.executor)
+        prefetcher.prefetch(1)
+        self.assertEqual(prefetcher.pending, {})
+        level = prefetcher.get_level(2)
+        self.assertEqual(level.level_count, 2)
+        self.assertIsNone(level.distance_field)
+
+    def test_failed_prefetch(self):
+        """Test that a failed prefetch falls back to generating in place"""
+
+        prefetcher = LevelPrefetcher((300, 300), depth=1)
+        self.addCleanup(prefetcher.close)
+        with mock.patch("src.maze_game.level_prefetcher.MazeLayer", side_effect=ValueError):
+            prefetcher.prefetch(1)
+            prefetcher.pending[2].exception()
+        self.assertEqual(prefetcher.get_level(2).level_count, 2)
@@ -0,0 +1,58 @@
+"""Testing the MazeCache class."""
+import tempfile
+import unittest
+from random import Random
+
+from src.maze_game.layers.maze_layer import MazeLayer
+from src.maze_game.maze_cache import MazeCache, level_seed
+from src.maze_game.maze_generators import MAZE_GENERATORS
+
+
+class TestMazeCache(unittest.TestCase):
+    """Test the MazeCache class."""
+
+    def test_seeded_generation(self):
+        """Test that a seed or a seeded random generator always makes the same maze"""
+
+        for name, generate in MAZE_GENERATORS.items():
+            with self.subTest(generator=name):
+                self.assertEqual(generate(9, 13, seed=4), generate(9, 13, seed=4))
+                self.assertEqual(generate(9, 13, rng=Random(4)), generate(9, 13, seed=4))
+
+    def test_memory_tier(self):
+        """Test that cached mazes are handed out as copies and evicted least recently used first"""
+
+        cache = MazeCache(max_entries=2)
+        start, end, board = cache.get_maze(9, 13, "kruskal", 1)
+        self.assertEqual((start, end, board), MAZE_GENERATORS["kruskal"](9, 13, seed=1))
+        board[start[0]][start[1]] = 0
+        self.assertNotEqual(cache.get_maze(9, 13, "kruskal", 1)[2], board)
+        self.assertEqual((cache.hits, cache.misses), (1, 1))
+
+        cache.get_maze(9, 13, "kruskal", 2)
+        cache.get_maze(9, 13, "kruskal", 1)
+        cache.get_maze(9, 13, "kruskal", 3)
+        self.assertEqual(list(cache.entries), [(9, 13, "kruskal", 1), (9, 13, "kruskal", 3)])
+
+    def test_disk_tier(self):
+        """Test that a new cache finds the mazes generated by another one on disk"""
+
+        with tempfile.TemporaryDirectory() as directory:
+            expected = MazeCache(directory=directory).get_maze(9, 13, "wilson", 5)
+            cache = MazeCache(directory=directory)
+            self.assertEqual(cache.get_maze(9, 13, "wilson", 5), expected)
+            self.assertEqual((cache.disk_hits, cache.misses), (1, 0))
+
+    def test_seeded_maze_layer(self):
+        """Test that replaying a seeded level is a cache lookup"""
+
+        cache = MazeCache()
+        seed = level_seed(20261018, 3)
+        first = MazeLayer(300, 500, 3, generator="kruskal", seed=seed, cache=cache)
+        first.move_down()
+        replay = MazeLayer(300, 500, 3, generator="kruskal", seed=seed, cache=cache)
+
+        self.assertEqual((cache.hits, cache.misses), (1, 1))
+        self.assertEqual(replay.board.curr_pos, replay.board.start)
+        self.assertEqual(replay.board.end, first.board.end)
+        self.assertNotEqual(level_seed(20261018, 4), seed)
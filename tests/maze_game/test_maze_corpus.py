@@ -0,0 +1,80 @@
+"""Testing the maze corpus builder."""
+import os
+import tempfile
+import unittest
+
+from src.maze_game.maze_corpus import RECORD_HEADER, build_corpus, load_corpus_maze, open_corpus
+from src.maze_game.maze_generators import generate_kruskal_maze
+
+
+class TestMazeCorpus(unittest.TestCase):
+    """Test the maze corpus builder."""
+
+    def setUp(self):
+        """Setup a temporary corpus path."""
+        temp_dir = tempfile.TemporaryDirectory()    # pylint: disable=consider-using-with
+        self.addCleanup(temp_dir.cleanup)
+        self.path = os.path.join(temp_dir.name, "pack.mzc")
+
+    def test_build_corpus(self):
+        """Test that the corpus mazes are reproduced from their seed"""
+
+        generated = build_corpus(self.path, [(5, 9), (11, 7)], 3, "kruskal", base_seed=10, workers=1)
+        self.assertEqual(generated, 6)
+
+        self.assertEqual(load_corpus_maze(self.path, 11, 7, 12), generate_kruskal_maze(11, 7, seed=12))
+        with self.assertRaises(KeyError):
+            load_corpus_maze(self.path, 11, 7, 13)
+
+    def test_resume_corpus(self):
+        """Test that an interrupted build only generates the missing mazes"""
+
+        build_corpus(self.path, [(5, 9)], 4, "kruskal", workers=1)
+        self.assertEqual(build_corpus(self.path, [(5, 9)], 4, "kruskal", workers=1), 0)
+        self.assertEqual(build_corpus(self.path, [(5, 9)], 6, "kruskal", workers=1), 2)
+
+        # Drop the index and half of the last record, as a crash in the middle of a write would.
+        corpus_file, index = open_corpus(self.path, "kruskal")
+        with corpus_file:
+            corpus_file.truncate(max(index.values()) + 10)
+        corpus_file, index = open_corpus(self.path, "kruskal")
+        corpus_file.close()
+        self.assertEqual(len(index), 5)
+
+        self.assertEqual(build_corpus(self.path, [(5, 9)], 6, "kruskal", workers=1), 1)
+        self.assertEqual(load_corpus_maze(self.path, 5, 9, 5), generate_kruskal_maze(5, 9, seed=5))
+
+    def test_generator_mismatch(self):
+        """Test that a corpus is only resumed with the generator it was built with"""
+
+        build_corpus(self.path, [(5, 9)], 1, "kruskal", workers=1)
+        with self.assertRaises(ValueError):
+            build_corpus(self.path, [(5, 9)], 1, "wilson", workers=1)
+
+    def test_resume_corrupt_record(self):
+        """Test that the scan of an interrupted build stops at a record whose payload does not match its CRC"""
+
+        build_corpus(self.path, [(5, 9)], 4, "kruskal", workers=1)
+        corpus_file, index = open_corpus(self.path, "kruskal")
+        with corpus_file:
+            offsets = sorted(index.values())
+            # Drop the index and flip a tile of the third record, as a torn write would leave it.
+            corpus_file.truncate(offsets[-1])
+            corpus_file.seek(offsets[2] + RECORD_HEADER.size + 2)
+            payload_byte = corpus_file.read(1)[0]
+            corpus_file.seek(-1, os.SEEK_CUR)
+            corpus_file.write(bytes([payload_byte ^ 0xff]))
+        corpus_file, index = open_corpus(self.path, "kruskal")
+        corpus_file.close()
+        self.assertEqual(sorted(index.values()), offsets[:2])
+        self.assertEqual(os.path.getsize(self.path), offsets[2])
+
+        self.assertEqual(build_corpus(self.path, [(5, 9)], 4, "kruskal", workers=1), 2)
+        for seed in range(4):
+            self.assertEqual(load_corpus_maze(self.path, 5, 9, seed), generate_kruskal_maze(5, 9, seed=seed))
+
+    def test_negative_seed(self):
+        """Test that corpus seeds can't be negative"""
+
+        with self.assertRaises(ValueError):
+            build_corpus(self.path, [(5, 9)], 1, "kruskal", base_seed=-1, workers=1)
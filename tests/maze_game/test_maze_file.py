@@ -0,0 +1,87 @@
+"""Testing the bit packed maze file format."""
+import os
+import tempfile
+import unittest
+
+from src.maze_game.layers.maze_layer import MazeLayer
+from src.maze_game.maze_board import MazeBoard
+from src.maze_game.maze_file import MAZE_FILE_HEADER, load_maze, pack_row, save_maze, unpack_row
+from src.maze_game.maze_game_object import MazeGameObject
+from src.maze_game.maze_generators import generate_kruskal_maze
+from src.maze_game.maze_generation import np
+
+
+class TestMazeFile(unittest.TestCase):
+    """Test the bit packed maze file format."""
+
+    def setUp(self):
+        """Setup a temporary maze file path."""
+        temp_dir = tempfile.TemporaryDirectory()    # pylint: disable=consider-using-with
+        self.addCleanup(temp_dir.cleanup)
+        self.path = os.path.join(temp_dir.name, "level.maze")
+
+    def test_pack_row(self):
+        """Test that a row keeps its walls through packing"""
+
+        row = [1, 0, 0, 1, 1, 1, 0, 1, 1, 0, 1]
+        packed = pack_row(bytes(row))
+        self.assertEqual(packed, bytes([0b10011101, 0b10100000]))
+        self.assertEqual(unpack_row(packed, len(row)), row)
+
+    def test_save_and_load(self):
+        """Test that a saved maze loads back lazily with its header"""
+
+        start, end, grid = generate_kruskal_maze(13, 21, seed=3)
+        save_maze(self.path, MazeBoard(grid, start, end, start), seed=3, generator="kruskal")
+        self.assertEqual(os.path.getsize(self.path), MAZE_FILE_HEADER.size + 13 * 3)
+
+        board, seed, generator = load_maze(self.path)
+        self.addCleanup(board.board.close)
+        self.assertEqual((seed, generator), (3, "kruskal"))
+        self.assertEqual((board.start, board.end, board.curr_pos), (start, end, start))
+        self.assertEqual(board.board.rows, {})
+        self.assertEqual(board.board[5], grid[5])
+        self.assertEqual(list(board.board.rows), [5])
+        self.assertEqual([board.board[i] for i in range(len(grid))], grid)
+
+    @unittest.skipIf(np is None, "numpy is not installed")
+    def test_numpy_save_and_load(self):
+        """Test that ndarray boards are packed and unpacked as a whole"""
+
+        start, end, grid = generate_kruskal_maze(13, 21, seed=3, use_numpy=True)
+        save_maze(self.path, MazeBoard(grid, start, end, start))
+        board, seed, generator = load_maze(self.path, use_numpy=True)
+
+        self.assertEqual((seed, generator), (None, ""))
+        self.assertEqual(board.board.dtype, np.int8)
+        self.assertEqual(board.board.tolist(), grid.tolist())
+
+    def test_maze_layer_from_maze_file(self):
+        """Test that a maze layer plays on a maze file"""
+
+        start, end, grid = generate_kruskal_maze(7, 7, seed=1)
+        save_maze(self.path, MazeBoard(grid, start, end, start))
+        maze_layer = MazeLayer(700, 700, board_file=self.path)
+        self.addCleanup(maze_layer.close)
+
+        maze_layer.move_down()
+        self.assertEqual(maze_layer.board.curr_pos, (1, 1))
+        self.assertEqual(maze_layer.get_board()[0][1], MazeGameObject.VISITED_TILE.value)
+        self.assertEqual(maze_layer.get_board()[end[0]][end[1]], MazeGameObject.GOAL.value)
+
+    def test_invalid_maze_file(self):
+        """Test that truncated maze files are rejected"""
+
+        start, end, grid = generate_kruskal_maze(7, 7, seed=1)
+        save_maze(self.path, MazeBoard(grid, start, end, start))
+        with open(self.path, "rb+") as maze_file:
+            maze_file.truncate(MAZE_FILE_HEADER.size + 3)
+        with self.assertRaises(ValueError):
+            load_maze(self.path)
+
+    def test_negative_seed(self):
+        """Test that seeds outside of the unsigned header seed are rejected"""
+
+        start, end, grid = generate_kruskal_maze(7, 7, seed=1)
+        with self.assertRaises(ValueError):
+            save_maze(self.path, MazeBoard(grid, start, end, start), seed=-1)
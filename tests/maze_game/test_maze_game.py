@@ -1,7 +1,47 @@
 """Testing MazeGame Class."""
 
+import os
+import tempfile
 import unittest
 
+from src.config import BaseConfig
+from src.maze_game import MazeGame
+from src.maze_game.layers.maze_layer import MazeLayer
+from src.maze_game.maze_mmap import generate_eller_maze_file
+
 
 class TestMazeGame(unittest.TestCase):
     """Test the MazeGame class."""
+
+    def test_get_next_level(self):
+        """Test that the next level is swapped in from the prefetcher."""
+
+        game = MazeGame((400, 300), BaseConfig)
+        self.addCleanup(game.close)
+        self.assertIn(2, game.prefetcher.pending)
+
+        game.get_next_level()
+        self.assertEqual(game.curr_level, 2)
+        self.assertEqual(game.get_maze().level_count, 2)
+        self.assertEqual(game.level_stats, {1: 0})
+        self.assertIn(3, game.prefetcher.pending)
+
+    def test_board_files_are_closed(self):
+        """Test that the mapping of a board file is released when its level is left or the game is closed."""
+
+        temp_dir = tempfile.TemporaryDirectory()    # pylint: disable=consider-using-with
+        self.addCleanup(temp_dir.cleanup)
+        path = os.path.join(temp_dir.name, "maze.board")
+        generate_eller_maze_file(path, 7, 7)
+
+        game = MazeGame((400, 300), BaseConfig)
+        self.addCleanup(game.close)
+        game.curr_maze = MazeLayer(700, 700, board_file=path)
+        mapped_board = game.curr_maze.mapped_board
+        game.get_next_level()
+        self.assertTrue(mapped_board.mapping.closed)
+
+        game.curr_maze = MazeLayer(700, 700, board_file=path)
+        mapped_board = game.curr_maze.mapped_board
+        game.close()
+        self.assertTrue(mapped_board.mapping.closed)
@@ -1,10 +1,16 @@
 """Testing Maze Board Generation."""
 import unittest
 from unittest.mock import Mock, patch
-from typing import Set
+from typing import List, Tuple
 
+from src.maze_game.distance_field import DistanceField
 from src.maze_game.maze_game_object import MazeGameObject
-from src.maze_game.maze_generation import generate_prim_maze
+from src.maze_game.maze_generation import generate_prim_maze, fill_walls, seed_shared_rng, to_ndarray, WallFrontier
+
+try:
+    import numpy as np
+except ImportError:    # pragma: no cover
+    np = None    # type: ignore
 
 
 class TestMazeGeneration(unittest.TestCase):
@@ -47,6 +53,7 @@ class TestMazeGeneration(unittest.TestCase):
 
         maze_shape = (5, 10)
         start_pos, end_pos, generated_maze = generate_prim_maze(maze_shape[0], maze_shape[1])
+        self.assertTrue(DistanceField(generated_maze, end_pos).is_solvable(start_pos))
 
         self.assertEqual(generated_maze[start_pos[0]][start_pos[1]], MazeGameObject.PLAYER_TILE.value)
         self.assertEqual(generated_maze[end_pos[0]][end_pos[1]], MazeGameObject.GOAL.value)
@@ -62,30 +69,86 @@ class TestMazeGeneration(unittest.TestCase):
             if i != end_pos[1]:
                 self.assertEqual(generated_maze[4][i], MazeGameObject.WALL.value)
 
-    @patch('src.maze_game.maze_generation.random')
-    @patch('src.maze_game.maze_generation.choices')
-    def test_maze_generation(self, mock_choices: Mock, mock_random: Mock):
+    @patch('src.maze_game.maze_generation.SHARED_RNG')
+    def test_maze_generation(self, mock_rng: Mock):
         """Test that maze is generated correctly
 
         Args:
-            mock_choice (mock): mock of random.choice
+            mock_rng (mock): mock of the shared random generator
         """
         maze_shape = (5, 5)
-        mock_random.return_value = 0.5
+        mock_rng.random.return_value = 0.5
 
-        def choices_side_effect(data: Set, k: int):
+        def choices_side_effect(data: List[Tuple[int, int]], k: int):
+            # Picks the first wall of the frontier.
             return list(data)[:k]
 
-        mock_choices.side_effect = choices_side_effect
+        mock_rng.choices.side_effect = choices_side_effect
         start_pos, end_pos, generated_maze = generate_prim_maze(maze_shape[0], maze_shape[1])
 
         self.assertEqual(generated_maze[start_pos[0]][start_pos[1]], MazeGameObject.PLAYER_TILE.value)
         self.assertEqual(generated_maze[end_pos[0]][end_pos[1]], MazeGameObject.GOAL.value)
-        self.assertEqual(start_pos, (0, 2))
+        self.assertEqual(start_pos, (0, 1))
         self.assertEqual(end_pos, (4, 3))
         self.assertEqual(generated_maze[3][3], MazeGameObject.PATH.value)
         self.assertEqual(generated_maze[2][4], MazeGameObject.WALL.value)
         self.assertEqual(generated_maze[4][2], MazeGameObject.WALL.value)
         self.assertEqual(generated_maze[1][4], MazeGameObject.WALL.value)
         self.assertEqual(generated_maze[3][2], MazeGameObject.WALL.value)
-        self.assertEqual(generated_maze[1][1], MazeGameObject.WALL.value)
+        self.assertEqual(generated_maze[1][2], MazeGameObject.WALL.value)
+
+    def test_solvable_mazes(self):
+        """Test that generated mazes can always be solved"""
+
+        for seed in range(20):
+            start_pos, end_pos, generated_maze = generate_prim_maze(12, 23, seed=seed)
+            self.assertTrue(DistanceField(generated_maze, end_pos).is_solvable(start_pos), f"seed {seed}")
+
+    def test_wall_frontier(self):
+        """Test that the wall frontier keeps its position map consistent"""
+
+        frontier = WallFrontier()
+        for wall in [(0, 1), (1, 0), (2, 1), (0, 1)]:
+            frontier.add(wall)
+        self.assertEqual(len(frontier), 3)
+
+        frontier.remove((0, 1))
+        self.assertEqual(len(frontier), 2)
+        self.assertNotIn((0, 1), frontier)
+        for wall in [(1, 0), (2, 1)]:
+            self.assertIn(wall, frontier)
+            self.assertEqual(frontier.walls[frontier.positions[wall]], wall)
+
+        frontier.remove((2, 1))
+        frontier.remove((1, 0))
+        self.assertEqual(len(frontier), 0)
+
+    def test_shared_rng(self):
+        """Test that the unseeded generations repeat once the shared generator is seeded again"""
+
+        self.addCleanup(seed_shared_rng)
+        seed_shared_rng(7)
+        maze = generate_prim_maze(15, 21)
+        seed_shared_rng(7)
+        self.assertEqual(generate_prim_maze(15, 21), maze)
+
+    @unittest.skipIf(np is None, "numpy is not installed")
+    def test_ndarray_board(self):
+        """Test that the ndarray board matches the list board for the same seed"""
+
+        list_start, list_end, list_maze = generate_prim_maze(31, 47, seed=7)
+        start, end, maze = generate_prim_maze(31, 47, use_numpy=True, seed=7)
+
+        self.assertEqual(maze.dtype, np.int8)
+        self.assertEqual(maze.shape, (31, 47))
+        self.assertEqual((start, end), (list_start, list_end))
+        self.assertEqual(maze.tolist(), list_maze)
+
+    @unittest.skipIf(np is None, "numpy is not installed")
+    def test_ndarray_fill_walls(self):
+        """Test that the vectorized fill turns every empty tile into a wall"""
+
+        empty, path, wall = MazeGameObject.EMPTY.value, MazeGameObject.PATH.value, MazeGameObject.WALL.value
+        maze = to_ndarray([[empty, path], [path, empty]])
+        fill_walls(maze)
+        self.assertEqual(maze.tolist(), [[wall, path], [path, wall]])
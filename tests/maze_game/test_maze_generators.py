@@ -0,0 +1,72 @@
+"""Testing the maze generator registry."""
+import unittest
+from collections import deque
+from typing import List, Tuple
+
+from src.maze_game.distance_field import DistanceField
+from src.maze_game.maze_game_object import MazeGameObject
+from src.maze_game.maze_generators import (MAZE_GENERATORS, get_generator, register_generator, resolve_generator_name,
+                                           select_generator, generate_kruskal_maze)
+
+
+def count_reachable(maze: List[List[int]], start: Tuple[int, int]) -> Tuple[int, int]:
+    """Returns the number of open tiles reachable from start and the number of open edges between them."""
+
+    seen = {start}
+    queue = deque([start])
+    edges = 0
+    while queue:
+        row, col = queue.popleft()
+        for next_row, next_col in ((row + 1, col), (row - 1, col), (row, col + 1), (row, col - 1)):
+            if 0 <= next_row < len(maze) and 0 <= next_col < len(maze[0]) \
+                    and maze[next_row][next_col] != MazeGameObject.WALL.value:
+                edges += 1
+                if (next_row, next_col) not in seen:
+                    seen.add((next_row, next_col))
+                    queue.append((next_row, next_col))
+    return len(seen), edges // 2
+
+
+class TestMazeGenerators(unittest.TestCase):
+    """Test the maze generator registry."""
+
+    def test_generated_mazes(self):
+        """Test that every cell based generator makes a perfect maze with an entry and an exit"""
+
+        for name in ("kruskal", "backtracker", "wilson"):
+            for shape in ((5, 5), (6, 11), (12, 23), (31, 40)):
+                with self.subTest(generator=name, shape=shape):
+                    start_pos, end_pos, maze = MAZE_GENERATORS[name](*shape)
+
+                    self.assertEqual((len(maze), len(maze[0])), shape)
+                    self.assertEqual(start_pos[0], 0)
+                    self.assertEqual(end_pos[0], shape[0] - 1)
+                    self.assertEqual(maze[start_pos[0]][start_pos[1]], MazeGameObject.PLAYER_TILE.value)
+                    self.assertEqual(maze[end_pos[0]][end_pos[1]], MazeGameObject.GOAL.value)
+                    for row in maze:
+                        self.assertEqual(row[0], MazeGameObject.WALL.value)
+                    self.assertTrue(DistanceField(maze, end_pos).is_solvable(start_pos))
+
+                    open_tiles = sum(tile != MazeGameObject.WALL.value for row in maze for tile in row)
+                    reachable, edges = count_reachable(maze, start_pos)
+                    self.assertEqual(reachable, open_tiles)
+                    self.assertEqual(edges, open_tiles - 1)
+
+    def test_select_generator(self):
+        """Test that generators are selected by name and by board size"""
+
+        self.assertEqual(resolve_generator_name("wilson", 10, 10), "wilson")
+        self.assertEqual(resolve_generator_name("auto", 10, 10), select_generator(10, 10))
+        self.assertEqual(select_generator(1000, 1000), "backtracker")
+        self.assertIs(get_generator("kruskal", 10, 10), generate_kruskal_maze)
+        with self.assertRaises(KeyError):
+            get_generator("unknown", 10, 10)
+
+    def test_register_generator(self):
+        """Test that a custom generator can be registered"""
+
+        register_generator("custom", generate_kruskal_maze)
+        self.addCleanup(MAZE_GENERATORS.pop, "custom")
+        self.assertIs(get_generator("custom", 10, 10), generate_kruskal_maze)
+        with self.assertRaises(ValueError):
+            register_generator("auto", generate_kruskal_maze)
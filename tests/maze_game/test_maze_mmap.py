@@ -0,0 +1,70 @@
+"""Testing the memory mapped maze boards."""
+import os
+import tempfile
+import unittest
+
+from src.maze_game.layers.maze_layer import MazeLayer
+from src.maze_game.maze_game_object import MazeGameObject
+from src.maze_game.maze_mmap import generate_eller_maze_file, open_maze_file
+from tests.maze_game.test_maze_generators import count_reachable
+
+
+class TestMazeMmap(unittest.TestCase):
+    """Test the memory mapped maze boards."""
+
+    def setUp(self):
+        """Setup a temporary board file path."""
+        temp_dir = tempfile.TemporaryDirectory()    # pylint: disable=consider-using-with
+        self.addCleanup(temp_dir.cleanup)
+        self.path = os.path.join(temp_dir.name, "maze.board")
+
+    def test_eller_maze_file(self):
+        """Test that the eller's generator writes a perfect maze with an entry and an exit"""
+
+        for shape in ((3, 3), (5, 5), (6, 11), (12, 23), (41, 40)):
+            with self.subTest(shape=shape):
+                start_pos, end_pos = generate_eller_maze_file(self.path, *shape)
+                board_start, board_end, maze = open_maze_file(self.path)
+                self.addCleanup(maze.close)
+
+                self.assertEqual((board_start, board_end), (start_pos, end_pos))
+                self.assertEqual((len(maze), len(maze[0])), shape)
+                self.assertEqual(start_pos[0], 0)
+                self.assertEqual(end_pos[0], shape[0] - 1)
+                self.assertEqual(maze[start_pos[0]][start_pos[1]], MazeGameObject.PLAYER_TILE.value)
+                self.assertEqual(maze[end_pos[0]][end_pos[1]], MazeGameObject.GOAL.value)
+                for i in range(shape[0]):
+                    self.assertEqual(maze[i][0], MazeGameObject.WALL.value)
+                    self.assertEqual(maze[i][-1], MazeGameObject.WALL.value)
+
+                open_tiles = sum(tile != MazeGameObject.WALL.value for row in maze for tile in row)
+                reachable, edges = count_reachable(maze, start_pos)
+                self.assertEqual(reachable, open_tiles)
+                self.assertEqual(edges, open_tiles - 1)
+
+    def test_maze_layer_from_file(self):
+        """Test that a maze layer plays on a mapped board without changing the file"""
+
+        generate_eller_maze_file(self.path, 7, 7)
+        with open(self.path, "rb") as board_file:
+            file_bytes = board_file.read()
+
+        maze_layer = MazeLayer(700, 700, board_file=self.path)
+        self.addCleanup(maze_layer.close)
+        self.assertEqual((maze_layer.tile_height_count, maze_layer.tile_width_count), (7, 7))
+        self.assertEqual(maze_layer.tile_width, 100)
+
+        maze_layer.move_down()
+        self.assertEqual(maze_layer.board.curr_pos, (1, 1))
+        self.assertEqual(maze_layer.get_board()[1][1], MazeGameObject.PLAYER_TILE.value)
+        self.assertEqual(maze_layer.get_board()[0][1], MazeGameObject.VISITED_TILE.value)
+        with open(self.path, "rb") as board_file:
+            self.assertEqual(board_file.read(), file_bytes)
+
+    def test_invalid_board_file(self):
+        """Test that files without the board header are rejected"""
+
+        with open(self.path, "wb") as board_file:
+            board_file.write(b"\0" * 64)
+        with self.assertRaises(ValueError):
+            open_maze_file(self.path)
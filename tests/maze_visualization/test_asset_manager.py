@@ -0,0 +1,42 @@
+"""Testing the AssetManager class."""
+import os
+import tempfile
+import unittest
+
+import pygame
+
+from src.maze_visualization.asset_manager import AssetManager
+
+
+class TestAssetManager(unittest.TestCase):
+    """Test the AssetManager class."""
+
+    def setUp(self):
+        """Setup a temporary image file."""
+        temp_dir = tempfile.TemporaryDirectory()    # pylint: disable=consider-using-with
+        self.addCleanup(temp_dir.cleanup)
+        self.path = os.path.join(temp_dir.name, "image.bmp")
+        pygame.image.save(pygame.Surface((8, 4)), self.path)
+
+    def test_images_are_loaded_once(self):
+        """Test that an image is decoded once and its scaled variants are cached"""
+
+        assets = AssetManager()
+        image = assets.load(self.path)
+        os.remove(self.path)
+        self.assertIs(assets.load(self.path), image)
+        self.assertIs(assets.get(self.path), image)
+
+        scaled = assets.get(self.path, (16, 8))
+        self.assertEqual(scaled.get_size(), (16, 8))
+        self.assertIs(assets.get(self.path, (16, 8)), scaled)
+        self.assertEqual((assets.hits, assets.misses), (1, 1))
+
+    def test_scaled_images_are_evicted(self):
+        """Test that the least recently used scaled image is evicted first"""
+
+        assets = AssetManager(max_entries=2)
+        assets.preload([(self.path, (1, 1)), (self.path, (2, 2))])
+        assets.get(self.path, (1, 1))
+        assets.get(self.path, (3, 3))
+        self.assertEqual(list(assets.scaled), [(self.path, (1, 1)), (self.path, (3, 3))])
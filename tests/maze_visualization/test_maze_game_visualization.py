@@ -0,0 +1,93 @@
+"""Testing the MazeGameVisualization class."""
+import unittest
+from unittest import mock
+
+import pygame
+
+from src.config import BaseConfig
+from src.event import Direction
+from src.maze_game import MazeGame, MazeGameState
+from src.maze_visualization.maze_game_visualization import HINT_COLOR, MAZE_ORIGIN, MazeGameVisualization
+
+
+class TestMazeGameVisualization(unittest.TestCase):
+    """Test the MazeGameVisualization class."""
+
+    def setUp(self):
+        """Setup a headless visualization and a game being played."""
+        self.visualization = MazeGameVisualization(720, 1280, headless=True)
+        self.addCleanup(pygame.quit)
+        self.game = MazeGame((1180, 620), BaseConfig)
+        self.addCleanup(self.game.close)
+        self.game.set_state(MazeGameState.PLAYING)
+        self.full_screen = [self.visualization.screen.get_rect()]
+
+    def get_tile_rect(self, row: int, col: int) -> pygame.Rect:
+        """Returns the region of the screen covered by a maze tile."""
+        tile_width, tile_height = self.visualization.get_tile_size(self.game.get_maze())
+        return pygame.Rect(MAZE_ORIGIN[0] + col * tile_width, MAZE_ORIGIN[1] + row * tile_height, tile_width,
+                           tile_height)
+
+    def test_move_redraws_changed_tiles(self):
+        """Test that a move only redraws the tiles left and entered by the player and the step counter"""
+
+        self.assertEqual(self.visualization.draw_game(self.game), self.full_screen)
+        self.assertEqual(self.visualization.draw_game(self.game), [])
+
+        start = self.game.get_maze().board.curr_pos
+        step_counter_rect = self.visualization.step_counter_rect
+        self.game.move(Direction.DOWN)
+        dirty_rects = self.visualization.draw_game(self.game)
+
+        self.assertEqual(self.game.get_maze().board.curr_pos, (start[0] + 1, start[1]))
+        self.assertEqual(len(dirty_rects), 3)
+        self.assertEqual(dirty_rects[:2], [self.get_tile_rect(*start), self.get_tile_rect(start[0] + 1, start[1])])
+        self.assertEqual(dirty_rects[2], step_counter_rect.union(self.visualization.step_counter_rect))
+
+    def test_frame_key_changes_redraw_the_screen(self):
+        """Test that a state, hint or level change redraws the whole screen"""
+
+        self.visualization.draw_game(self.game)
+        self.game.set_state(MazeGameState.PAUSED)
+        self.assertEqual(self.visualization.draw_game(self.game), self.full_screen)
+        self.assertEqual(self.visualization.draw_game(self.game), [])
+        self.game.set_state(MazeGameState.PLAYING)
+        self.assertEqual(self.visualization.draw_game(self.game), self.full_screen)
+
+        self.game.toggle_hint()
+        self.assertEqual(self.visualization.draw_game(self.game), self.full_screen)
+        self.game.toggle_hint()
+        self.assertEqual(self.visualization.draw_game(self.game), self.full_screen)
+
+        self.game.get_next_level()
+        self.assertEqual(self.visualization.draw_game(self.game), self.full_screen)
+
+    def test_hint_is_drawn_over_the_solution_tiles(self):
+        """Test that the solution path is drawn in the middle of its maze tiles"""
+
+        self.game.toggle_hint()
+        self.visualization.draw_game(self.game)
+        for row, col in self.game.get_maze().get_solution_path()[1:-1]:
+            self.assertEqual(self.visualization.screen.get_at(self.get_tile_rect(row, col).center), HINT_COLOR)
+
+    def test_static_maze_is_rendered_once_per_level(self):
+        """Test that the static maze surface is reused by the frames of a level and rebuilt for the next one"""
+
+        with mock.patch.object(self.visualization, "render_static_maze",
+                               wraps=self.visualization.render_static_maze) as render_static_maze:
+            self.visualization.draw_game(self.game)
+            maze_surface = self.visualization.maze_surface
+            self.game.move(Direction.DOWN)
+            self.game.toggle_hint()
+            self.visualization.draw_game(self.game)
+            self.assertEqual(render_static_maze.call_count, 1)
+            self.assertIs(self.visualization.maze_surface, maze_surface)
+
+            self.game.get_next_level()
+            self.visualization.draw_game(self.game)
+            self.assertEqual(render_static_maze.call_count, 2)
+            self.assertIsNot(self.visualization.maze_surface, maze_surface)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,38 @@
+"""Testing the TextCache class."""
+import unittest
+from unittest import mock
+
+import pygame
+
+from src.maze_visualization.text_cache import TextCache
+
+
+class TestTextCache(unittest.TestCase):
+    """Test the TextCache class."""
+
+    def setUp(self):
+        """Setup a font that counts its renders."""
+        self.font = mock.MagicMock()
+        self.font.render.side_effect = lambda text, antialias, color: pygame.Surface((10 * len(text), 20))
+
+    def test_texts_are_rendered_once(self):
+        """Test that a text is rendered once per font, text and color"""
+
+        cache = TextCache()
+        image, size = cache.render(self.font, "Paused", pygame.Color("black"), static=True)
+        self.assertEqual(size, (60, 20))
+        self.assertIs(cache.render(self.font, "Paused", (0, 0, 0))[0], image)
+        cache.render(self.font, "Paused", "blue")
+        self.assertEqual(self.font.render.call_count, 2)
+        self.assertEqual((cache.hits, cache.misses), (1, 2))
+
+    def test_static_labels_are_never_evicted(self):
+        """Test that changing texts are evicted least recently used first and static labels are kept"""
+
+        cache = TextCache(max_entries=2)
+        cache.render(self.font, "Menu Screen", "black", static=True)
+        for steps in range(5):
+            cache.render(self.font, f"Steps: {steps}", "black")
+        self.assertEqual([key[1] for key in cache.entries], ["Steps: 3", "Steps: 4"])
+        cache.render(self.font, "Menu Screen", "black")
+        self.assertEqual(self.font.render.call_count, 6)
@@ -0,0 +1,105 @@
+"""Testing the CrowdVote class."""
+import tracemalloc
+import unittest
+from typing import List
+
+from src.crowd_vote import WINDOW_GENERATIONS, CrowdVote
+from src.event import Direction, Event, MovementEvent, TickEvent
+from src.event_listener import EventListener
+from src.event_manager import EventManager
+
+
+class RecordingListener(EventListener):
+    """Records the events it is notified of."""
+
+    def __init__(self):
+        self.events: List[Event] = []
+
+    def notify(self, event: Event):
+        self.events.append(event)
+
+
+class FakeClock:
+    """Clock set by hand."""
+
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+class TestCrowdVote(unittest.TestCase):
+    """Test the CrowdVote class."""
+
+    def setUp(self):
+        self.clock = FakeClock()
+        self.event_manager = EventManager()
+        self.listener = RecordingListener()
+        self.event_manager.register_listener(self.listener, (MovementEvent, ))
+        self.votes = CrowdVote(self.event_manager, window=1.0, clock=self.clock)
+
+    def test_winner_once_per_window(self):
+        """Test that the most voted direction is posted once, when the window closes"""
+
+        for user, direction in ((b"a", Direction.LEFT), (b"b", Direction.UP), (b"c", Direction.UP)):
+            self.assertTrue(self.votes.vote(user, direction))
+        self.clock.now = 0.5
+        self.event_manager.post(TickEvent())
+        self.assertEqual(self.listener.events, [])
+        self.assertEqual(self.votes.get_tallies()[Direction.UP], 2)
+        self.assertAlmostEqual(self.votes.get_time_left(), 0.5)
+
+        self.clock.now = 1.0
+        self.event_manager.post(TickEvent())
+        self.event_manager.post(TickEvent())
+        self.assertEqual(self.listener.events, [MovementEvent(Direction.UP)])
+        self.assertEqual(sum(self.votes.get_tallies().values()), 0)
+        self.assertEqual(self.votes.get_time_left(), 1.0)
+
+    def test_one_vote_per_user_per_window(self):
+        """Test that a user votes once per window and again in the next one"""
+
+        self.assertTrue(self.votes.vote(b"a", Direction.LEFT))
+        self.assertFalse(self.votes.vote(b"a", Direction.RIGHT))
+        self.assertEqual(self.votes.close_window(), Direction.LEFT)
+        self.assertTrue(self.votes.vote(b"a", Direction.RIGHT))
+        self.assertEqual(self.votes.duplicates, 1)
+
+    def test_tie_goes_to_first(self):
+        """Test that a tie goes to the direction that got its votes first"""
+
+        self.votes.vote(b"a", Direction.DOWN)
+        self.votes.vote(b"b", Direction.RIGHT)
+        self.votes.vote(b"c", Direction.RIGHT)
+        self.votes.vote(b"d", Direction.DOWN)
+        self.assertEqual(self.votes.close_window(), Direction.RIGHT)
+        self.assertIsNone(self.votes.close_window())
+
+    def test_generation_wrap_around(self):
+        """Test that voters are forgotten when the window numbers wrap around"""
+
+        self.votes.vote(b"a", Direction.UP)
+        for _ in range(WINDOW_GENERATIONS):
+            self.votes.close_window()
+            self.assertTrue(self.votes.vote(b"a", Direction.UP))
+
+    def test_bounded_memory(self):
+        """Test that a crowd of distinct users does not grow the memory of the vote"""
+
+        users = [f"user{index}".encode() for index in range(200_000)]
+        directions = list(Direction)
+        tracemalloc.start()
+        try:
+            before = tracemalloc.get_traced_memory()[0]
+            for index, user in enumerate(users):
+                self.votes.vote(user, directions[index % len(directions)])
+            growth = tracemalloc.get_traced_memory()[0] - before
+        finally:
+            tracemalloc.stop()
+        self.assertLess(growth, 16 * 1024)
+        self.assertGreater(sum(self.votes.get_tallies().values()), len(users) * 0.9)
+
+
+if __name__ == "__main__":
+    unittest.main()
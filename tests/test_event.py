@@ -0,0 +1,88 @@
+"""Testing the event classes."""
+import tracemalloc
+import unittest
+from types import SimpleNamespace
+from typing import List, Optional
+from unittest import mock
+
+from src.config import BaseConfig
+from src.event import Direction, Event, KeyboardEvent, MovementEvent, QuitEvent, RenderEvent, TickEvent
+from src.event_listener import EventListener
+from src.event_manager import EventManager
+from src.keyboard_controller import Keyboard
+from src.maze_game import MazeGame
+from src.model import GameEngine
+
+
+class KeepingListener(EventListener):
+    """Keeps every event it is notified of alive, so that any new event shows up in the traced memory."""
+
+    def __init__(self, size: int):
+        self.events: List[Optional[Event]] = [None] * size
+        self.count = 0
+
+    def notify(self, event: Event):
+        self.events[self.count] = event
+        self.count += 1
+
+
+class TestEvent(unittest.TestCase):
+    """Test the event classes."""
+
+    def test_interned_events(self):
+        """Test that equal events are a single immutable instance"""
+
+        self.assertIs(TickEvent(), TickEvent())
+        self.assertIsNot(TickEvent(), QuitEvent())
+        self.assertIs(KeyboardEvent("h"), KeyboardEvent("h"))
+        self.assertIsNot(KeyboardEvent("h"), KeyboardEvent("p"))
+        self.assertIs(MovementEvent(Direction.UP), MovementEvent(Direction.UP))
+        self.assertEqual(MovementEvent(Direction.UP).direction, Direction.UP)
+        self.assertEqual(str(KeyboardEvent("h")), "Keyboard Event, key_char=h")
+
+        with self.assertRaises(AttributeError):
+            MovementEvent(Direction.UP).direction = Direction.DOWN
+        with self.assertRaises(AttributeError):
+            TickEvent().value = 1
+        with self.assertRaises(TypeError):
+            KeyboardEvent()
+
+    @mock.patch("src.keyboard_controller.py_event", SimpleNamespace(get=tuple))
+    def test_tick_allocates_nothing(self):
+        """Test that the steady state game loop allocates nothing per tick, not even temporary objects"""
+
+        game = MazeGame((400, 300), BaseConfig)
+        self.addCleanup(game.close)
+        event_manager = EventManager(BaseConfig.EVENT_QUEUE_SIZE, {
+            TickEvent: 1,
+            RenderEvent: 1,
+            MovementEvent: BaseConfig.MAX_MOVES_PER_TICK
+        })
+        engine = GameEngine(event_manager, game)
+        Keyboard(event_manager)
+        listener = KeepingListener(20_000)
+        event_manager.register_listener(listener, (TickEvent, RenderEvent))
+
+        def tick():
+            engine.post_ticks(0.0, 0.0, 1.0)
+            event_manager.post(RenderEvent())
+            event_manager.drain()
+
+        tick()
+        listener.count = 0
+        tracemalloc.start()
+        self.addCleanup(tracemalloc.stop)
+        tick()
+        listener.count = 0
+        tracemalloc.reset_peak()
+        start_size = tracemalloc.get_traced_memory()[0]
+        for _ in range(10_000):
+            tick()
+        size, peak = tracemalloc.get_traced_memory()
+        self.assertEqual(listener.count, 20_000)
+
+        # The listener keeps every event alive, a new event per tick would keep 20000 objects. Temporary objects of
+        # a tick raise the peak above the memory in use at the start, only the iterators of the for loops are left,
+        # a single generator based context manager would already add about 600 bytes.
+        self.assertLess(size - start_size, 1024)
+        self.assertLess(peak - start_size, 512)
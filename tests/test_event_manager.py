@@ -0,0 +1,108 @@
+"""Testing the EventManager class."""
+import unittest
+from typing import List
+
+from src.event import Direction, Event, MovementEvent, PauseEvent, QuitEvent, TickEvent
+from src.event_listener import EventListener
+from src.event_manager import EventManager
+
+
+class NamedListener(EventListener):
+    """Records its name in a shared list for every event it is notified of."""
+
+    def __init__(self, name: str, calls: List[str]):
+        self.name = name
+        self.calls = calls
+
+    def notify(self, event: Event):
+        self.calls.append(self.name)
+
+
+class TestEventManager(unittest.TestCase):
+    """Test the EventManager class."""
+
+    def test_dispatch_by_type(self):
+        """Test that handlers only get the events of their type and its subclasses"""
+
+        event_manager = EventManager()
+        calls: List[str] = []
+        event_manager.register_listener(NamedListener("all", calls))
+        event_manager.register_listener(NamedListener("tick", calls), (TickEvent, ))
+        event_manager.register_listener(NamedListener("input", calls), (MovementEvent, QuitEvent))
+
+        event_manager.post(TickEvent())
+        event_manager.post(MovementEvent(Direction.UP))
+        event_manager.post(Event())
+        self.assertEqual(calls, ["all", "tick", "all", "input", "all"])
+        self.assertEqual(len(event_manager.get_handlers(QuitEvent)), 2)
+
+    def test_priority_order(self):
+        """Test that handlers are called by priority, then in the order they subscribed"""
+
+        event_manager = EventManager()
+        calls: List[str] = []
+        for name, priority in (("view", 100), ("model", 0), ("controller", 0)):
+            event_manager.register_listener(NamedListener(name, calls), priority=priority)
+        event_manager.post(TickEvent())
+        self.assertEqual(calls, ["model", "controller", "view"])
+
+    def test_dispatch_table_is_rebuilt(self):
+        """Test that subscribing and unregistering after a post updates the dispatch table"""
+
+        event_manager = EventManager()
+        calls: List[str] = []
+        first = NamedListener("first", calls)
+        event_manager.register_listener(first, (TickEvent, ))
+        event_manager.post(TickEvent())
+        event_manager.subscribe(Event, lambda event: calls.append("handler"), priority=-1)
+        event_manager.post(TickEvent())
+        event_manager.unregister_listener(first)
+        event_manager.post(TickEvent())
+        self.assertEqual(calls, ["first", "handler", "first", "handler"])
+
+    def test_queued_events_do_not_recurse(self):
+        """Test that events posted by a handler are dispatched after the current one, within the same drain"""
+
+        event_manager = EventManager(queue_size=8)
+        calls: List[str] = []
+        event_manager.subscribe(TickEvent, lambda event: (calls.append("tick"), event_manager.post(QuitEvent())))
+        event_manager.subscribe(TickEvent, lambda event: calls.append("tick 2"))
+        event_manager.subscribe(QuitEvent, lambda event: calls.append("quit"))
+
+        event_manager.post(TickEvent())
+        self.assertEqual(calls, [])
+        self.assertEqual(event_manager.drain(), 2)
+        self.assertEqual(calls, ["tick", "tick 2", "quit"])
+        self.assertEqual(event_manager.drain(), 0)
+
+    def test_coalescing(self):
+        """Test that queued events beyond the limit of their type are coalesced"""
+
+        event_manager = EventManager(queue_size=8, limits={TickEvent: 1, MovementEvent: 2})
+        calls: List[Event] = []
+        event_manager.subscribe(Event, calls.append)
+
+        for event in (TickEvent(), TickEvent(), MovementEvent(Direction.UP), MovementEvent(Direction.LEFT),
+                      MovementEvent(Direction.UP), PauseEvent(), TickEvent()):
+            event_manager.post(event)
+        event_manager.drain()
+        self.assertEqual(calls, [TickEvent(), MovementEvent(Direction.UP), MovementEvent(Direction.LEFT), PauseEvent()])
+        self.assertEqual(event_manager.coalesced, 3)
+
+        event_manager.post(TickEvent())
+        event_manager.drain()
+        self.assertIs(calls[-1], TickEvent())
+
+    def test_backpressure(self):
+        """Test that a full queue drops new events but essential ones, and a drain dispatches at most its size"""
+
+        event_manager = EventManager(queue_size=3)
+        calls: List[Event] = []
+        event_manager.subscribe(Event, calls.append)
+
+        accepted = [event_manager.post(event) for event in (PauseEvent(), ) * 4 + (QuitEvent(), )]
+        self.assertEqual(accepted, [True, True, True, False, True])
+        self.assertEqual(event_manager.dropped, 1)
+        self.assertEqual(event_manager.drain(), 3)
+        self.assertEqual(event_manager.drain(), 1)
+        self.assertIs(calls[-1], QuitEvent())
@@ -0,0 +1,63 @@
+"""Testing the FrameProfiler class."""
+import json
+import os
+import tempfile
+import unittest
+from unittest import mock
+
+from src.frame_profiler import BUCKET_EDGES_MS, FrameProfiler, PhaseStats
+
+
+class TestFrameProfiler(unittest.TestCase):
+    """Test the FrameProfiler class."""
+
+    @mock.patch("src.frame_profiler.perf_counter")
+    def test_phases_are_timed_per_frame(self, mock_perf_counter: mock.MagicMock):
+        """Test that phases run more than once in a frame are summed and frames are timed end to end"""
+
+        mock_perf_counter.side_effect = [0.0, 0.0, 0.001, 0.002, 0.003, 0.006, 0.010, 0.018, 0.020, 0.060]
+        profiler = FrameProfiler()
+        profiler.toggle()
+        with profiler.phase("draw"):
+            pass
+        with profiler.phase("draw"):
+            pass
+        with profiler.phase("update"):
+            pass
+        profiler.end_frame()
+        profiler.end_frame()
+
+        self.assertAlmostEqual(profiler.stats["draw"].total, 4.0)
+        self.assertAlmostEqual(profiler.stats["update"].total, 8.0)
+        self.assertEqual([round(ms, 6) for ms in profiler.stats["frame"].recent], [20.0, 40.0])
+        self.assertAlmostEqual(profiler.get_fps(), 2 * 1000 / 60)
+        self.assertAlmostEqual(profiler.stats["frame"].percentile(50), 40.0)
+
+    def test_disabled_profiler_records_nothing(self):
+        """Test that a disabled profiler records no phases and shares a single no-op phase"""
+
+        profiler = FrameProfiler()
+        self.assertIs(profiler.phase("draw"), profiler.phase("update"))
+        with profiler.phase("draw"):
+            pass
+        profiler.end_frame()
+        self.assertEqual(profiler.stats, {})
+        self.assertEqual(profiler.get_summary(), "FPS --")
+
+    def test_dump(self):
+        """Test that the histogram of every phase is written to JSON"""
+
+        profiler = FrameProfiler()
+        stats = profiler.stats["draw"] = PhaseStats(profiler.window)
+        for seconds in (0.00005, 0.003, 0.0035, 0.5):
+            stats.add(seconds)
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "profile.json")
+            profiler.dump(path)
+            with open(path, encoding="utf-8") as report_file:
+                report = json.load(report_file)
+
+        self.assertEqual(report["bucket_edges_ms"], list(BUCKET_EDGES_MS))
+        self.assertEqual(report["phases"]["draw"]["count"], 4)
+        self.assertEqual(report["phases"]["draw"]["max_ms"], 500.0)
+        self.assertEqual(report["phases"]["draw"]["histogram"], [1, 0, 0, 0, 0, 2, 0, 0, 0, 0, 0, 1])
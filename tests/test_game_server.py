@@ -0,0 +1,86 @@
+"""Testing the headless game server."""
+import subprocess
+import sys
+import unittest
+from random import Random
+
+from src.event import Direction
+from src.game_server import GameServer, SessionShard, ShardError, get_board_state
+
+
+class TestGameServer(unittest.TestCase):
+    """Test the headless game server."""
+
+    def test_diffs_mirror_the_boards(self):
+        """Test that applying the diffs to the first full state gives the boards of the server"""
+
+        shard = SessionShard()
+        boards = {}
+        for session_id, level, step_count, curr_pos, solved, tiles, board_state in shard.create([3, 5]):
+            self.assertEqual((level, step_count, solved, tiles), (1, 0, False, ()))
+            n_row, n_col, tiles_bytes = board_state
+            self.assertEqual(len(tiles_bytes), n_row * n_col)
+            boards[session_id] = (n_col, bytearray(tiles_bytes))
+
+        rng = Random(0)
+        directions = [direction.value for direction in Direction]
+        for _ in range(50):
+            moves = [(session_id, rng.choice(directions)) for session_id in (3, 5, 3, 7)]
+            for session_id, _, _, _, _, tiles, board_state in shard.move(moves):
+                if board_state is not None:
+                    boards[session_id] = (board_state[1], bytearray(board_state[2]))
+                n_col, board = boards[session_id]
+                for row, col, value in tiles:
+                    board[row * n_col + col] = value
+        for session_id, game in shard.sessions.items():
+            self.assertEqual(boards[session_id][1], get_board_state(game.get_board())[2])
+        shard.close([3, 5])
+        self.assertEqual(shard.sessions, {})
+
+    def test_level_change_sends_the_board(self):
+        """Test that moving on to the next level sends the whole new board"""
+
+        shard = SessionShard()
+        shard.create([0])
+        shard.sessions[0].get_maze().board.solved = True
+        ((_, level, step_count, _, _, tiles, board_state), ) = shard.move([(0, Direction.DOWN.value)])
+        self.assertEqual((level, step_count, tiles), (2, 0, ()))
+        self.assertIsNotNone(board_state)
+
+    def test_sharded_server(self):
+        """Test that sessions are spread over the workers and moved in batches"""
+
+        server = GameServer(2)
+        self.addCleanup(server.close)
+        diffs = server.create_sessions(5)
+        self.assertEqual(sorted(diff[0] for diff in diffs), [0, 1, 2, 3, 4])
+        moves = [(session_id, direction.value) for session_id in range(5) for direction in Direction]
+        diffs = server.move(moves + [(99, Direction.UP.value)])
+        self.assertEqual(sorted(diff[0] for diff in diffs), [0, 1, 2, 3, 4])
+        server.close_sessions([0, 1])
+        self.assertEqual([diff[0] for diff in server.move([(0, Direction.UP.value), (2, Direction.UP.value)])], [2])
+
+    def test_bad_requests_keep_the_shard_alive(self):
+        """Test that a bad move is skipped and a failing request is reported without stopping the shard"""
+
+        server = GameServer(1)
+        self.addCleanup(server.close)
+        server.create_sessions(1)
+        self.assertEqual(server.move([(0, 9)]), [])
+        with self.assertRaises(ShardError):
+            server.move([(0, )])
+        self.assertEqual([diff[0] for diff in server.move([(0, Direction.UP.value)])], [0])
+        self.assertEqual(len(server.create_sessions(1)), 1)
+
+    def test_no_pygame_import(self):
+        """Test that the server does not import pygame"""
+
+        output = subprocess.run([sys.executable, "-c", "import sys, src.game_server; print('pygame' in sys.modules)"],
+                                check=True,
+                                capture_output=True,
+                                text=True).stdout
+        self.assertEqual(output.strip(), "False")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,83 @@
+"""Testing the logging pipeline."""
+import threading
+import time
+import unittest
+from logging import INFO, Handler, LogRecord, getLogger
+from logging.handlers import QueueListener
+from queue import SimpleQueue
+from typing import List
+
+from src.logger import EVENT_TYPE, DeferredQueueHandler, EventLogFilter, init_logger
+
+
+class SlowHandler(Handler):
+    """Handler blocking like a stalled disk, records the messages and the thread writing them."""
+
+    def __init__(self):
+        super().__init__()
+        self.messages: List[str] = []
+        self.threads: List[threading.Thread] = []
+
+    def emit(self, record: LogRecord):
+        time.sleep(0.01)
+        self.messages.append(record.getMessage())
+        self.threads.append(threading.current_thread())
+
+
+def make_record(event_type: str) -> LogRecord:
+    """Returns a record of an event type."""
+
+    record = LogRecord("test", INFO, __file__, 0, "Received event: %s", (event_type, ), None)
+    setattr(record, EVENT_TYPE, event_type)
+    return record
+
+
+class TestLogger(unittest.TestCase):
+    """Test the logging pipeline."""
+
+    def test_init_logger_is_idempotent(self):
+        """Test that initializing a logger again does not add handlers"""
+
+        logger = init_logger("tests.idempotent")
+        handlers = list(logger.handlers)
+        self.assertIs(init_logger("tests.idempotent"), logger)
+        self.assertEqual(logger.handlers, handlers)
+        self.assertEqual(len(handlers), 1)
+        self.assertIs(init_logger("tests.other").handlers[0], handlers[0])
+
+    def test_event_sampling_and_rate_limit(self):
+        """Test that event records are sampled and rate limited per event type"""
+
+        clock = [0.0]
+        log_filter = EventLogFilter({"MovementEvent": 10}, max_per_second=3, clock=lambda: clock[0])
+        kept = [log_filter.filter(make_record("MovementEvent")) for _ in range(40)]
+        self.assertEqual([index for index, keep in enumerate(kept) if keep], [9, 19, 29])
+        kept = [log_filter.filter(make_record("PauseEvent")) for _ in range(5)]
+        self.assertEqual(kept, [True, True, True, False, False])
+        clock[0] = 1.0
+        self.assertTrue(log_filter.filter(make_record("PauseEvent")))
+        self.assertTrue(log_filter.filter(LogRecord("test", INFO, __file__, 0, "Starting", None, None)))
+        self.assertEqual(log_filter.suppressed, 39)
+
+    def test_records_are_written_by_a_background_thread(self):
+        """Test that a stalled handler does not block the logging call"""
+
+        log_queue: SimpleQueue = SimpleQueue()
+        slow_handler = SlowHandler()
+        listener = QueueListener(log_queue, slow_handler)
+        logger = getLogger("tests.background")
+        logger.propagate = False
+        logger.addHandler(DeferredQueueHandler(log_queue))
+        listener.start()
+        start_time = time.perf_counter()
+        for index in range(20):
+            logger.warning("record %d", index)
+        elapsed = time.perf_counter() - start_time
+        listener.stop()
+        self.assertLess(elapsed, 0.1)
+        self.assertEqual(slow_handler.messages, [f"record {index}" for index in range(20)])
+        self.assertNotIn(threading.current_thread(), slow_handler.threads)
+
+
+if __name__ == "__main__":
+    unittest.main()
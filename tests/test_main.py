@@ -0,0 +1,38 @@
+"""Testing the game startup."""
+import asyncio
+import unittest
+
+import pygame
+
+import main
+from src.config import BaseConfig
+from src.event import RenderEvent, StartGameEvent
+from src.model import GameEngine
+
+
+class HeadlessConfig(BaseConfig):
+    """Config of a game without a window."""
+
+    HEADLESS = True
+
+
+class TestMain(unittest.TestCase):
+    """Test the game startup."""
+
+    def test_create_game(self):
+        """Test that the game is created with its first level and draws its first frame"""
+
+        event_manager, game, game_model = asyncio.run(main.create_game(HeadlessConfig))
+        self.addCleanup(pygame.quit)
+        self.addCleanup(game.close)
+        self.assertIsInstance(game_model, GameEngine)
+        self.assertEqual(game.get_maze().level_count, 1)
+        self.assertEqual(pygame.display.get_surface().get_size(), (main.SCREEN_WIDTH, main.SCREEN_HEIGHT))
+        self.assertFalse(pygame.mixer.get_init())
+        event_manager.post(StartGameEvent())
+        event_manager.post(RenderEvent())
+        self.assertEqual(event_manager.drain(), 2)
+
+
+if __name__ == "__main__":
+    unittest.main()
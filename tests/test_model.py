@@ -0,0 +1,91 @@
+"""Testing the GameEngine class."""
+import asyncio
+import unittest
+from typing import List
+from unittest import mock
+
+from src.config import BaseConfig
+from src.event import Event, EscapeEvent, PauseEvent, QuitEvent, RenderEvent, SelectEvent, TickEvent
+from src.event_listener import EventListener
+from src.event_manager import EventManager
+from src.maze_game import MazeGame, MazeGameState
+from src.model import GameEngine
+
+
+class RecordingListener(EventListener):
+    """Records the tick and render events and quits after a number of frames."""
+
+    def __init__(self, event_manager: EventManager, frames: int):
+        self.event_manager = event_manager
+        self.frames = frames
+        self.events: List[Event] = []
+        event_manager.register_listener(self)
+
+    def notify(self, event: Event):
+        if isinstance(event, (TickEvent, RenderEvent)):
+            self.events.append(event)
+        if isinstance(event, RenderEvent) and sum(isinstance(e, RenderEvent) for e in self.events) == self.frames:
+            self.event_manager.post(QuitEvent())
+
+
+class TestGameEngine(unittest.TestCase):
+    """Test the GameEngine class."""
+
+    def setUp(self):
+        """Setup a game."""
+        self.game = MazeGame((400, 300), BaseConfig)
+        self.addCleanup(self.game.close)
+
+    def test_fixed_rate_loop(self):
+        """Test that ticks and frames run at their own rates while other tasks keep running"""
+
+        event_manager = EventManager()
+        engine = GameEngine(event_manager, self.game, tick_rate=200, frame_rate=50)
+        listener = RecordingListener(event_manager, frames=5)
+        background_steps = []
+
+        async def background():
+            while engine.running:
+                background_steps.append(None)
+                await asyncio.sleep(0.001)
+
+        async def play():
+            task = asyncio.create_task(background())
+            await engine.run()
+            await task
+
+        asyncio.run(play())
+        ticks = sum(isinstance(event, TickEvent) for event in listener.events)
+        self.assertGreaterEqual(ticks, 12)
+        self.assertLessEqual(ticks, 25)
+        self.assertIsInstance(listener.events[0], TickEvent)
+        self.assertGreater(len(background_steps), 10)
+
+    def test_event_handlers(self):
+        """Test that every event type reaches its own handler"""
+
+        event_manager = EventManager()
+        engine = GameEngine(event_manager, self.game)
+
+        event_manager.post(SelectEvent())
+        self.assertEqual(self.game.state, MazeGameState.PLAYING)
+        event_manager.post(PauseEvent())
+        self.assertEqual(self.game.state, MazeGameState.PAUSED)
+        event_manager.post(EscapeEvent())
+        self.assertEqual(self.game.state, MazeGameState.MENU)
+        event_manager.post(QuitEvent())
+        self.assertFalse(engine.running)
+
+    def test_events_handled_in_engine_phase(self):
+        """Test that the engine subscribes once per event type and handles the events in its profiler phase"""
+
+        event_manager = EventManager()
+        engine = GameEngine(event_manager, self.game)
+        self.assertEqual(len(event_manager.get_handlers(QuitEvent)), 1)
+
+        with mock.patch("src.model.PROFILER") as profiler:
+            # The phase ends after the handler ran.
+            profiler.phase.return_value.__exit__.side_effect = lambda *_: self.assertFalse(engine.running)
+            event_manager.post(QuitEvent())
+        profiler.phase.assert_called_once_with("engine.notify")
+        profiler.phase.return_value.__exit__.assert_called_once()
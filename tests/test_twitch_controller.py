@@ -0,0 +1,112 @@
+"""Testing the Twitch chat controller."""
+import asyncio
+import unittest
+from typing import List
+
+from src.crowd_vote import CrowdVote
+from src.event import Direction, Event, MovementEvent, PauseEvent, QuitEvent
+from src.event_listener import EventListener
+from src.event_manager import EventManager
+from src.fake_irc_server import FakeIrcServer, generate_chat
+from src.twitch_controller import LineSplitter, TwitchChat, parse_chat_command
+
+
+class RecordingListener(EventListener):
+    """Records the events it is notified of."""
+
+    def __init__(self):
+        self.events: List[Event] = []
+
+    def notify(self, event: Event):
+        self.events.append(event)
+
+
+def parse_line(line: bytes):
+    """Parses a single line with the splitter and the command parser."""
+
+    splitter = LineSplitter()
+    return [parse_chat_command(splitter.buffer, start, end) for start, end in splitter.feed(line)][0]
+
+
+class TestTwitchController(unittest.TestCase):
+    """Test the Twitch chat controller."""
+
+    def test_line_splitter(self):
+        """Test that lines split across chunks are yielded once complete and the consumed lines are released"""
+
+        splitter = LineSplitter()
+        lines = []
+        for chunk in (b"PING :a\r\nPRIV", b"MSG x\r", b"\n", b"\r\nlast"):
+            lines.extend(bytes(splitter.buffer[start:end]) for start, end in splitter.feed(chunk))
+        self.assertEqual(lines, [b"PING :a", b"PRIVMSG x", b""])
+        self.assertEqual(splitter.buffer, bytearray(b"last"))
+
+    def test_parse_chat_command(self):
+        """Test that chat commands are parsed with their user and other lines are ignored"""
+
+        self.assertEqual(parse_line(b":bob!bob@bob.tmi.twitch.tv PRIVMSG #maze :up\r\n"),
+                         (b"bob", MovementEvent(Direction.UP)))
+        self.assertEqual(parse_line(b"@badges=;color= :amy!amy@amy.tmi.twitch.tv PRIVMSG #maze : Pause \r\n"),
+                         (b"amy", PauseEvent()))
+        self.assertIsNone(parse_line(b":bob!bob@bob.tmi.twitch.tv PRIVMSG #maze :go up now\r\n"))
+        self.assertIsNone(parse_line(b":bob!bob@bob.tmi.twitch.tv PRIVMSG #maze :" + b"up" * 100 + b"\r\n"))
+        self.assertIsNone(parse_line(b":tmi.twitch.tv 001 maze :up\r\n"))
+        self.assertIsNone(parse_line(b"up\r\n"))
+
+    def test_malformed_tagged_line(self):
+        """Test that a tagged line without a space is ignored instead of parsed from the start of the buffer"""
+
+        splitter = LineSplitter()
+        chunk = b":bob!bob@bob.tmi.twitch.tv PRIVMSG #maze :up\r\n@badges=;color=\r\n"
+        commands = [parse_chat_command(splitter.buffer, start, end) for start, end in splitter.feed(chunk)]
+        self.assertEqual(commands, [(b"bob", MovementEvent(Direction.UP)), None])
+
+    def test_chat_from_fake_server(self):
+        """Test that the chat of the fake server is logged into, turned into events and its ping answered"""
+
+        lines = generate_chat(5000, 50, seed=0)
+        expected = [parse_line(line) for line in lines]
+        expected_events = [command[1] for command in expected if command is not None]
+        server = FakeIrcServer(lines, batch=97)
+        event_manager = EventManager()
+        listener = RecordingListener()
+        event_manager.register_listener(listener)
+
+        async def run_chat():
+            port = await server.start()
+            chat = TwitchChat(event_manager, "#Maze", "Bot", "secret", "127.0.0.1", port)
+            await chat.run()
+            await server.close()
+            return chat
+
+        chat = asyncio.run(run_chat())
+        self.assertEqual(server.received, [b"PASS oauth:secret", b"NICK bot", b"JOIN #maze", b"PONG :tmi.twitch.tv"])
+        self.assertEqual(listener.events, expected_events)
+        self.assertEqual(chat.commands, len(expected_events))
+        self.assertEqual(chat.lines, len(lines) + 2)
+
+    def test_movement_commands_are_votes(self):
+        """Test that movement commands go to the crowd vote and the other commands are posted"""
+
+        event_manager = EventManager()
+        listener = RecordingListener()
+        event_manager.register_listener(listener)
+        votes = CrowdVote(event_manager)
+        chat = TwitchChat(event_manager, "maze", "bot", "secret", votes=votes)
+        chat.handle_data(b":a!a@a PRIVMSG #maze :left\r\n:b!b@b PRIVMSG #maze :pause\r\n:a!a@a PRIVMSG #maze :up\r\n")
+        self.assertEqual(listener.events, [PauseEvent()])
+        self.assertEqual(votes.get_tallies()[Direction.LEFT], 1)
+        self.assertEqual(votes.duplicates, 1)
+
+    def test_quit_closes_chat(self):
+        """Test that quitting the game stops reading the chat"""
+
+        event_manager = EventManager()
+        chat = TwitchChat(event_manager, "maze", "bot", "oauth:secret")
+        chat.running = True
+        event_manager.post(QuitEvent())
+        self.assertFalse(chat.running)
+
+
+if __name__ == "__main__":
+    unittest.main()